@@ -4,6 +4,7 @@ This module handles the construction and configuration of the application,
 including interface selection, storage configuration, and future database setup.
 """
 
+import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -13,6 +14,29 @@ from kawasaki_etl.utils.logger import configure_logging, get_logger
 from kawasaki_etl.utils.settings import get_interface_settings, get_settings
 
 
+def _call_if_loaded(module_name: str, function_name: str) -> None:
+    # A resource can only exist if its module was imported; importing it just to
+    # release nothing would undo the lazy imports.
+    module = sys.modules.get(module_name)
+    if module is not None:
+        getattr(module, function_name)()
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    _call_if_loaded("kawasaki_etl.utils.http_client", "close_http_client")
+
+
+def close_meta_index() -> None:
+    """Close the shared SQLite meta index if it was opened."""
+    _call_if_loaded("kawasaki_etl.core.meta_index", "close_meta_index")
+
+
+def dispose_engines() -> None:
+    """Dispose cached database engines if any were created."""
+    _call_if_loaded("kawasaki_etl.core.db", "dispose_engines")
+
+
 class Application:
     """Main application class that orchestrates components."""
 
@@ -62,6 +86,9 @@ class Application:
             self.logger.error("Application error", error=str(e))
             raise
         finally:
+            close_http_client()
+            close_meta_index()
+            dispose_engines()
             self.logger.info("Application shutting down")
 
 
@@ -1,4 +1,12 @@
-"""Static configuration values for open data pages."""
+"""Static configuration values for open data pages.
+
+The population catalog is loaded from its JSON data file only when one of the
+``POPULATION_*_PAGES`` names is first accessed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 from kawasaki_etl.configs.aed_locations import AED_LOCATIONS_PAGE
 from kawasaki_etl.configs.childcare import (
@@ -17,15 +25,17 @@ from kawasaki_etl.configs.disaster_prevention import (
     HAZARD_PAGE,
     WATER_SUPPLY_PAGE,
 )
-from kawasaki_etl.configs.population import (
-    BASE_CATEGORY_URL,
-    POPULATION_2022_PAGES,
-    POPULATION_2023_PAGES,
-    POPULATION_2024_PAGES,
-    POPULATION_2025_PAGES,
-)
+from kawasaki_etl.configs.population import BASE_CATEGORY_URL
 from kawasaki_etl.configs.pharmacy_permits import PHARMACY_PERMITS_PAGE
 
+if TYPE_CHECKING:  # pragma: no cover
+    from kawasaki_etl.configs.population import (
+        POPULATION_2022_PAGES,
+        POPULATION_2023_PAGES,
+        POPULATION_2024_PAGES,
+        POPULATION_2025_PAGES,
+    )
+
 __all__ = [
     "AED_LOCATIONS_PAGE",
     "BASE_CATEGORY_URL",
@@ -47,3 +57,12 @@ __all__ = [
     "POPULATION_2025_PAGES",
     "WATER_SUPPLY_PAGE",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name.startswith("POPULATION_") and name.endswith("_PAGES"):
+        from kawasaki_etl.configs import population
+
+        return getattr(population, name)
+    message = f"module {__name__!s} has no attribute {name!s}"
+    raise AttributeError(message)
@@ -1,71 +1,229 @@
-"""Core functionality for Kawasaki ETL."""
+"""Core functionality for Kawasaki ETL.
 
-from kawasaki_etl.core.models import (
-    DatasetConfig,
-    DatasetConfigError,
-    get_dataset_config,
-    load_dataset_configs,
-)
-from kawasaki_etl.core.io import (
-    DownloadError,
-    download_file,
-    download_if_needed,
-    get_raw_path,
-)
-from kawasaki_etl.core.db import (
-    DBConfigError,
-    DBConnectionError,
-    UpsertError,
-    get_engine,
-    upsert_dataframe,
-)
-from kawasaki_etl.core.meta_store import (
-    calculate_sha256,
-    get_meta_path,
-    is_already_loaded,
-    mark_loaded,
-)
-from kawasaki_etl.core.pdf_utils import (
-    TourismPdfExtractionError,
-    extract_tables_from_tourism_irikomi,
-)
-from kawasaki_etl.core.normalize import (
-    COMMON_ENCODINGS,
-    NormalizationError,
-    detect_encoding_and_read_csv,
-    normalize_column_name,
-    normalize_columns,
-    normalize_csv,
-    normalize_excel,
-    normalize_zip_of_csv,
-)
+Names are resolved lazily on first access so that importing the package (for
+example from the CLI) does not pull in pandas, SQLAlchemy, httpx or pypdf until
+a command actually needs them.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "DatasetConfig": "kawasaki_etl.core.models",
+    "DatasetConfigError": "kawasaki_etl.core.models",
+    "clear_dataset_config_cache": "kawasaki_etl.core.models",
+    "get_dataset_config": "kawasaki_etl.core.models",
+    "load_dataset_configs": "kawasaki_etl.core.models",
+    "DownloadError": "kawasaki_etl.core.io",
+    "download_file": "kawasaki_etl.core.io",
+    "download_if_needed": "kawasaki_etl.core.io",
+    "get_raw_path": "kawasaki_etl.core.io",
+    "DownloadJob": "kawasaki_etl.core.async_io",
+    "download_files": "kawasaki_etl.core.async_io",
+    "download_files_async": "kawasaki_etl.core.async_io",
+    "DatasetSchema": "kawasaki_etl.core.schema",
+    "SchemaError": "kawasaki_etl.core.schema",
+    "apply_schema": "kawasaki_etl.core.schema",
+    "get_schema": "kawasaki_etl.core.schema",
+    "register_schema": "kawasaki_etl.core.schema",
+    "ProjectionError": "kawasaki_etl.core.projection",
+    "ReadProjection": "kawasaki_etl.core.projection",
+    "RowPredicate": "kawasaki_etl.core.projection",
+    "filter_rows": "kawasaki_etl.core.projection",
+    "get_projection": "kawasaki_etl.core.projection",
+    "DBConfigError": "kawasaki_etl.core.db",
+    "DBConnectionError": "kawasaki_etl.core.db",
+    "UpsertError": "kawasaki_etl.core.db",
+    "UpsertSummary": "kawasaki_etl.core.db",
+    "dispose_engines": "kawasaki_etl.core.db",
+    "get_engine": "kawasaki_etl.core.db",
+    "invalidate_table_cache": "kawasaki_etl.core.db",
+    "upsert_dataframe": "kawasaki_etl.core.db",
+    "MetaStoreError": "kawasaki_etl.core.meta_store",
+    "are_loaded": "kawasaki_etl.core.meta_store",
+    "calculate_sha256": "kawasaki_etl.core.meta_store",
+    "completed_stages": "kawasaki_etl.core.meta_store",
+    "get_loaded_sha256": "kawasaki_etl.core.meta_store",
+    "get_meta_path": "kawasaki_etl.core.meta_store",
+    "import_json_meta": "kawasaki_etl.core.meta_store",
+    "is_already_loaded": "kawasaki_etl.core.meta_store",
+    "mark_loaded": "kawasaki_etl.core.meta_store",
+    "mark_stage_complete": "kawasaki_etl.core.meta_store",
+    "TourismPdfExtractionError": "kawasaki_etl.core.pdf_utils",
+    "extract_tables_from_tourism_irikomi": "kawasaki_etl.core.pdf_utils",
+    "COMMON_ENCODINGS": "kawasaki_etl.core.normalize",
+    "CSVNormalizationSummary": "kawasaki_etl.core.normalize",
+    "NormalizationError": "kawasaki_etl.core.normalize",
+    "detect_encoding": "kawasaki_etl.core.normalize",
+    "detect_encoding_and_read_csv": "kawasaki_etl.core.normalize",
+    "iter_csv_chunks": "kawasaki_etl.core.normalize",
+    "iter_normalized_chunks": "kawasaki_etl.core.normalize",
+    "normalize_column_name": "kawasaki_etl.core.normalize",
+    "normalize_columns": "kawasaki_etl.core.normalize",
+    "normalize_csv": "kawasaki_etl.core.normalize",
+    "normalize_csv_chunked": "kawasaki_etl.core.normalize",
+    "normalize_excel": "kawasaki_etl.core.normalize",
+    "normalize_zip_of_csv": "kawasaki_etl.core.normalize",
+    "normalized_dest": "kawasaki_etl.core.normalize",
+    "read_csv_header": "kawasaki_etl.core.normalize",
+    "read_normalized": "kawasaki_etl.core.normalize",
+    "write_normalized": "kawasaki_etl.core.normalize",
+}
 
 __all__ = [
     "COMMON_ENCODINGS",
+    "CSVNormalizationSummary",
     "DBConfigError",
     "DBConnectionError",
     "DatasetConfig",
     "DatasetConfigError",
+    "DatasetSchema",
     "DownloadError",
+    "DownloadJob",
+    "MetaStoreError",
     "NormalizationError",
+    "ProjectionError",
+    "ReadProjection",
+    "RowPredicate",
+    "SchemaError",
     "TourismPdfExtractionError",
     "UpsertError",
+    "UpsertSummary",
+    "apply_schema",
+    "are_loaded",
     "calculate_sha256",
+    "clear_dataset_config_cache",
+    "completed_stages",
+    "detect_encoding",
     "detect_encoding_and_read_csv",
+    "dispose_engines",
     "download_file",
+    "download_files",
+    "download_files_async",
     "download_if_needed",
     "extract_tables_from_tourism_irikomi",
+    "filter_rows",
     "get_dataset_config",
     "get_engine",
+    "get_loaded_sha256",
     "get_meta_path",
+    "get_projection",
     "get_raw_path",
+    "get_schema",
+    "import_json_meta",
+    "invalidate_table_cache",
     "is_already_loaded",
+    "iter_csv_chunks",
+    "iter_normalized_chunks",
     "load_dataset_configs",
     "mark_loaded",
+    "mark_stage_complete",
     "normalize_column_name",
     "normalize_columns",
     "normalize_csv",
+    "normalize_csv_chunked",
     "normalize_excel",
     "normalize_zip_of_csv",
+    "normalized_dest",
+    "read_csv_header",
+    "read_normalized",
+    "register_schema",
     "upsert_dataframe",
+    "write_normalized",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_ATTRIBUTES.get(name)
+    if module_path is None:
+        message = f"module {__name__!s} has no attribute {name!s}"
+        raise AttributeError(message)
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from kawasaki_etl.core.models import (
+        DatasetConfig,
+        DatasetConfigError,
+        clear_dataset_config_cache,
+        get_dataset_config,
+        load_dataset_configs,
+    )
+    from kawasaki_etl.core.io import (
+        DownloadError,
+        download_file,
+        download_if_needed,
+        get_raw_path,
+    )
+    from kawasaki_etl.core.async_io import (
+        DownloadJob,
+        download_files,
+        download_files_async,
+    )
+    from kawasaki_etl.core.schema import (
+        DatasetSchema,
+        SchemaError,
+        apply_schema,
+        get_schema,
+        register_schema,
+    )
+    from kawasaki_etl.core.projection import (
+        ProjectionError,
+        ReadProjection,
+        RowPredicate,
+        filter_rows,
+        get_projection,
+    )
+    from kawasaki_etl.core.db import (
+        DBConfigError,
+        DBConnectionError,
+        UpsertError,
+        UpsertSummary,
+        dispose_engines,
+        get_engine,
+        invalidate_table_cache,
+        upsert_dataframe,
+    )
+    from kawasaki_etl.core.meta_store import (
+        MetaStoreError,
+        are_loaded,
+        calculate_sha256,
+        completed_stages,
+        get_loaded_sha256,
+        get_meta_path,
+        import_json_meta,
+        is_already_loaded,
+        mark_loaded,
+        mark_stage_complete,
+    )
+    from kawasaki_etl.core.pdf_utils import (
+        TourismPdfExtractionError,
+        extract_tables_from_tourism_irikomi,
+    )
+    from kawasaki_etl.core.normalize import (
+        COMMON_ENCODINGS,
+        CSVNormalizationSummary,
+        NormalizationError,
+        detect_encoding,
+        detect_encoding_and_read_csv,
+        normalize_column_name,
+        normalize_columns,
+        iter_csv_chunks,
+        iter_normalized_chunks,
+        normalize_csv,
+        normalize_csv_chunked,
+        normalize_excel,
+        normalize_zip_of_csv,
+        normalized_dest,
+        read_csv_header,
+        read_normalized,
+        write_normalized,
+    )
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, cast
+from urllib.parse import urlparse
+
+from kawasaki_etl.core.io import (
+    CHUNK_SIZE,
+    HTTP_PARTIAL_CONTENT,
+    DownloadError,
+    DownloadResult,
+    HTTPErrorType,
+    _begin_part,  # pyright: ignore[reportPrivateUsage]
+    _discard_part,  # pyright: ignore[reportPrivateUsage]
+    _finish_download,  # pyright: ignore[reportPrivateUsage]
+    _part_request,  # pyright: ignore[reportPrivateUsage]
+    _read_validators_sidecar,  # pyright: ignore[reportPrivateUsage]
+    _response_result,  # pyright: ignore[reportPrivateUsage]
+    _to_download_error,  # pyright: ignore[reportPrivateUsage]
+    _validator_headers,  # pyright: ignore[reportPrivateUsage]
+    _verify_part,  # pyright: ignore[reportPrivateUsage]
+    _write_validators_sidecar,  # pyright: ignore[reportPrivateUsage]
+    part_path_for,
+)
+from kawasaki_etl.utils.http_client import build_async_http_client
+from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
+from kawasaki_etl.utils.settings import get_download_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    import httpx
+
+logger: LoggerProtocol = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class DownloadJob:
+    """A single URL to be saved at ``dest``."""
+
+    url: str
+    dest: Path
+
+
+class _HostLimiter:
+    """Hand out one semaphore per host so a single server is not flooded."""
+
+    def __init__(self, per_host_limit: int) -> None:
+        self._per_host_limit = per_host_limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def for_url(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._per_host_limit)
+            self._semaphores[host] = semaphore
+        return semaphore
+
+
+async def _stream_to_part(
+    client: httpx.AsyncClient,
+    url: str,
+    part_path: Path,
+    headers: Mapping[str, str] | None,
+) -> DownloadResult:
+    """Async counterpart of the synchronous ``.part`` download with resume."""
+    offset, request_headers = _part_request(url, part_path, headers)
+    async with client.stream("GET", url, headers=request_headers) as response:
+        result, stale = _response_result(response, offset)
+        if not (result.not_modified or stale):
+            digest = _begin_part(response, url, part_path, offset)
+            resumed = response.status_code == HTTP_PARTIAL_CONTENT
+            with part_path.open("ab" if resumed else "wb") as part_file:
+                async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                    part_file.write(chunk)
+                    digest.update(chunk)
+            _verify_part(response, part_path, offset)
+            result = replace(result, sha256=digest.hexdigest())
+
+    if stale:
+        _discard_part(part_path)
+        return await _stream_to_part(client, url, part_path, headers)
+    return result
+
+
+async def _download_one(
+    client: httpx.AsyncClient,
+    job: DownloadJob,
+    global_limit: asyncio.Semaphore,
+    host_limiter: _HostLimiter,
+) -> Path:
+    job.dest.parent.mkdir(parents=True, exist_ok=True)
+    exists = job.dest.exists() and job.dest.stat().st_size > 0
+    headers = (
+        _validator_headers(_read_validators_sidecar(job.dest), job.dest)
+        if exists
+        else None
+    )
+    async with global_limit, host_limiter.for_url(job.url):
+        try:
+            result = await _stream_to_part(
+                client,
+                job.url,
+                part_path_for(job.dest),
+                headers,
+            )
+            _finish_download(job.dest, result)
+            if not result.not_modified:
+                _write_validators_sidecar(job.dest, result)
+        except (HTTPErrorType, OSError) as exc:
+            raise _to_download_error(exc, job.url, job.dest) from exc
+
+    logger.debug(
+        "Resource not modified" if result.not_modified else "Downloaded resource",
+        url=job.url,
+        dest=str(job.dest),
+        size=job.dest.stat().st_size,
+    )
+    return job.dest
+
+
+async def download_files_async(
+    jobs: Sequence[DownloadJob],
+    *,
+    max_concurrency: int | None = None,
+    per_host_limit: int | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> list[Path]:
+    """Download ``jobs`` concurrently and return their paths in input order.
+
+    Args:
+        jobs: URLs and destinations to fetch.
+        max_concurrency: Upper bound on in-flight requests across all hosts.
+            Defaults to ``DOWNLOAD_MAX_CONCURRENCY``.
+        per_host_limit: Upper bound on in-flight requests per host. Defaults to
+            ``DOWNLOAD_PER_HOST_CONCURRENCY``.
+        client: Optional pre-configured ``httpx.AsyncClient`` to reuse.
+
+    Raises:
+        DownloadError: When any download fails. Remaining downloads are
+            cancelled and their partial files removed.
+
+    """
+    if not jobs:
+        return []
+
+    settings = get_download_settings()
+    global_limit = asyncio.Semaphore(
+        max_concurrency or settings.download_max_concurrency,
+    )
+    host_limiter = _HostLimiter(
+        per_host_limit or settings.download_per_host_concurrency,
+    )
+
+    owns_client = client is None
+    active_client = client or build_async_http_client()
+    try:
+        tasks = [
+            asyncio.create_task(
+                _download_one(active_client, job, global_limit, host_limiter),
+            )
+            for job in jobs
+        ]
+        done, pending = await asyncio.wait(
+            tasks,
+            return_when=asyncio.FIRST_EXCEPTION,
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in tasks:
+            if task in done and task.exception() is not None:
+                raise cast("BaseException", task.exception())
+        return [task.result() for task in tasks]
+    finally:
+        if owns_client:
+            await active_client.aclose()
+
+
+def download_files(
+    jobs: Sequence[DownloadJob],
+    *,
+    max_concurrency: int | None = None,
+    per_host_limit: int | None = None,
+) -> list[Path]:
+    """Blocking wrapper around :func:`download_files_async`.
+
+    Raises:
+        DownloadError: When called from a running event loop, where
+            :func:`download_files_async` has to be awaited instead, or when any
+            download fails.
+
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        msg = (
+            "download_files cannot run inside a running event loop; "
+            "await download_files_async instead"
+        )
+        raise DownloadError(msg)
+    return asyncio.run(
+        download_files_async(
+            jobs,
+            max_concurrency=max_concurrency,
+            per_host_limit=per_host_limit,
+        ),
+    )
+
+
+__all__ = ["DownloadJob", "download_files", "download_files_async"]
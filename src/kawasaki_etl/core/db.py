@@ -1,29 +1,67 @@
 from __future__ import annotations
 
+import datetime
+import hashlib
+import numbers
 import os
-from dataclasses import dataclass
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+from dataclasses import dataclass, replace
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import unquote
 
-from pandas import DataFrame
+import numpy as np
 import yaml
-from sqlalchemy import MetaData, Table, create_engine, text
+from pandas import DataFrame, NaT, Series, isna
+from sqlalchemy import Column, MetaData, Table, create_engine, select, text, tuple_
 from sqlalchemy.dialects.postgresql import Insert as PGInsert
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
 
 from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
+from kawasaki_etl.utils.settings import get_db_load_settings
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
-    from pandas import DataFrame
+    from collections.abc import Iterable, Iterator, Mapping
+
     from sqlalchemy.dialects.sqlite import Insert as SQLiteInsert
     from sqlalchemy.engine import Engine
 
 logger: LoggerProtocol = get_logger(__name__)
 
+# Upper bound on bound parameters in a single statement per dialect. SQLite
+# builds before 3.32 only allow 999.
+_MAX_BIND_PARAMETERS: dict[str, int] = {
+    "postgresql": 65535,
+    "sqlite": 32766 if sqlite3.sqlite_version_info >= (3, 32) else 999,
+}
+
+LOAD_METHODS: tuple[str, ...] = ("auto", "insert", "copy")
+
+# Column holding a hash of the non-key values, used to skip unchanged rows.
+ROW_HASH_COLUMN = "row_hash"
+
+_engine_lock = threading.Lock()
+# Engines are reused for the life of the process, keyed by (alias, DSN).
+_engine_cache: dict[tuple[str, str], Engine] = {}
+_engine_cache_pid = os.getpid()
+
+# Parsed DB YAML per resolved path with the (mtime_ns, size) it was read at.
+_db_config_cache_lock = threading.Lock()
+_db_config_cache: dict[Path, tuple[tuple[int, int], dict[str, DBConfig]]] = {}
+
+_table_cache_lock = threading.Lock()
+# Reflected tables per engine: table name -> (table, reflected_at monotonic time).
+_table_cache: weakref.WeakKeyDictionary[Engine, dict[str, tuple[Table, float]]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class DBConfigError(Exception):
     """Raised when DB configuration loading fails."""
@@ -37,6 +75,22 @@ class UpsertError(Exception):
     """Raised when UPSERT processing fails."""
 
 
+@dataclass(frozen=True)
+class UpsertSummary:
+    """Outcome of :func:`upsert_dataframe`.
+
+    ``inserted`` and ``updated`` are only known when unchanged rows are
+    skipped; they are classified against the row hashes read before the write.
+    """
+
+    table: str
+    rows: int
+    method: str
+    inserted: int | None = None
+    updated: int | None = None
+    unchanged: int = 0
+
+
 @dataclass
 class DBConfig:
     """Database connection configuration."""
@@ -48,11 +102,18 @@ class DBConfig:
     password: str | None = None
     database: str | None = None
     options: str | None = None
+    pool_size: int | None = None
+    max_overflow: int | None = None
+    pool_recycle: int | None = None
+    statement_timeout_ms: int | None = None
+    # Test each connection with a round trip on checkout.
+    pool_pre_ping: bool = False
 
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any]) -> DBConfig:
         """Build a DBConfig from a mapping loaded from YAML."""
         return cls(
+            **_pool_options_from_mapping(mapping),
             dsn=str(mapping["dsn"]) if mapping.get("dsn") else None,
             host=str(mapping["host"]) if mapping.get("host") else None,
             port=int(mapping["port"]) if mapping.get("port") is not None else None,
@@ -60,8 +121,40 @@ class DBConfig:
             password=str(mapping["password"]) if mapping.get("password") else None,
             database=str(mapping["database"]) if mapping.get("database") else None,
             options=str(mapping["options"]) if mapping.get("options") else None,
+            pool_pre_ping=_pre_ping_from_mapping(mapping),
         )
 
+    def engine_options(self, dsn: str) -> dict[str, Any]:
+        """Return keyword arguments for ``create_engine`` for ``dsn``."""
+        url = make_url(dsn)
+        backend = url.get_backend_name()
+        options: dict[str, Any] = {}
+        if self.pool_pre_ping:
+            options["pool_pre_ping"] = True
+        # In-memory SQLite uses a per-thread pool that has no size or overflow.
+        in_memory = backend == "sqlite" and url.database in {None, "", ":memory:"}
+        if self.pool_size is not None and not in_memory:
+            options["pool_size"] = self.pool_size
+        if self.max_overflow is not None and not in_memory:
+            options["max_overflow"] = self.max_overflow
+        if self.pool_recycle is not None:
+            options["pool_recycle"] = self.pool_recycle
+        if self.statement_timeout_ms is not None:
+            if backend != "postgresql":
+                logger.debug(
+                    "statement_timeout_ms is only applied on PostgreSQL",
+                    dialect=backend,
+                )
+            else:
+                existing = url.query.get("options")
+                if isinstance(existing, tuple):
+                    existing = " ".join(existing)
+                timeout = f"-c statement_timeout={self.statement_timeout_ms}"
+                options["connect_args"] = {
+                    "options": f"{existing} {timeout}" if existing else timeout,
+                }
+        return options
+
     def as_dsn(self) -> str:
         """Return a DSN string constructed from configuration."""
         if self.dsn:
@@ -82,7 +175,62 @@ class DBConfig:
         )
 
 
+_POOL_OPTION_KEYS = (
+    "pool_size",
+    "max_overflow",
+    "pool_recycle",
+    "statement_timeout_ms",
+)
+
+
+def _pool_options_from_mapping(mapping: Mapping[str, Any]) -> dict[str, int | None]:
+    options: dict[str, int | None] = {}
+    for key in _POOL_OPTION_KEYS:
+        value = mapping.get(key)
+        if value is None:
+            options[key] = None
+            continue
+        try:
+            options[key] = int(value)
+        except (TypeError, ValueError) as exc:
+            msg = f"DB config '{key}' must be an integer: {value!r}"
+            raise DBConfigError(msg) from exc
+    return options
+
+
+def _pre_ping_from_mapping(mapping: Mapping[str, Any]) -> bool:
+    value = mapping.get("pool_pre_ping", False)
+    if not isinstance(value, bool):
+        msg = f"DB config 'pool_pre_ping' must be true or false: {value!r}"
+        raise DBConfigError(msg)
+    return value
+
+
 def _load_db_config_yaml(config_path: Path) -> dict[str, DBConfig]:
+    """Return the aliases in ``config_path``, reparsing only when it changed."""
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        msg = f"DB config file not found: {config_path}"
+        raise DBConfigError(msg) from None
+    except OSError as exc:  # pragma: no cover - unexpected filesystem failure
+        msg = f"Failed to read DB config file: {config_path}"
+        raise DBConfigError(msg) from exc
+
+    key = config_path.resolve()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _db_config_cache_lock:
+        cached = _db_config_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    configs = _parse_db_config_yaml(config_path)
+    with _db_config_cache_lock:
+        _db_config_cache[key] = (signature, configs)
+    return configs
+
+
+def _parse_db_config_yaml(config_path: Path) -> dict[str, DBConfig]:
     try:
         raw_content = config_path.read_text(encoding="utf-8")
     except FileNotFoundError:
@@ -113,11 +261,19 @@ def _load_db_config_yaml(config_path: Path) -> dict[str, DBConfig]:
 
 
 def _resolve_db_config(alias: str, config_path: Path | None = None) -> DBConfig:
+    path = config_path or Path(os.getenv("DB_CONFIG_PATH", "configs/db.yml"))
     env_dsn = os.getenv("DB_DSN")
     if env_dsn:
-        return DBConfig(dsn=env_dsn)
+        # Pool tuning still comes from the YAML alias when the file has one.
+        try:
+            pooled = _load_db_config_yaml(path).get(alias)
+        except DBConfigError:
+            pooled = None
+        if pooled is None:
+            return DBConfig(dsn=env_dsn)
+        # Cached configs are shared, so never modify them in place.
+        return replace(pooled, dsn=env_dsn)
 
-    path = config_path or Path(os.getenv("DB_CONFIG_PATH", "configs/db.yml"))
     configs = _load_db_config_yaml(path)
     try:
         return configs[alias]
@@ -126,24 +282,62 @@ def _resolve_db_config(alias: str, config_path: Path | None = None) -> DBConfig:
         raise DBConfigError(msg) from exc
 
 
+def _reset_engine_cache_after_fork() -> None:
+    global _engine_cache_pid  # noqa: PLW0603
+    pid = os.getpid()
+    if pid == _engine_cache_pid:
+        return
+    # Pooled connections belong to the parent; drop them without closing.
+    for engine in _engine_cache.values():
+        engine.dispose(close=False)
+    _engine_cache.clear()
+    _engine_cache_pid = pid
+
+
 def get_engine(alias: str = "default", *, config_path: Path | None = None) -> Engine:
-    """Create a SQLAlchemy engine from environment variables or YAML config."""
+    """Return a SQLAlchemy engine from environment variables or YAML config.
+
+    Engines are cached per alias and DSN for the life of the process. The
+    ``SELECT 1`` probe only runs when an engine is first created. Stale pooled
+    connections are replaced via ``pool_recycle``, or on checkout when the
+    alias sets ``pool_pre_ping``. The DB YAML is only reparsed when its mtime
+    or size changes.
+    """
     db_config = _resolve_db_config(alias, config_path)
     dsn = db_config.as_dsn()
-    try:
-        engine = create_engine(dsn, pool_pre_ping=True)
-        with engine.connect() as connection:
-            connection.execute(text("SELECT 1"))
-    except SQLAlchemyError as exc:
-        logger.error(
-            "DB connection failed", dsn=_mask_sensitive_dsn(dsn), error=str(exc),
-        )
-        msg = f"DB connection failed: {exc}"
-        raise DBConnectionError(msg) from exc
-    else:
+    cache_key = (alias, dsn)
+    with _engine_lock:
+        _reset_engine_cache_after_fork()
+        cached = _engine_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            engine = create_engine(dsn, **db_config.engine_options(dsn))
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except SQLAlchemyError as exc:
+            logger.error(
+                "DB connection failed",
+                dsn=_mask_sensitive_dsn(dsn),
+                error=str(exc),
+            )
+            msg = f"DB connection failed: {exc}"
+            raise DBConnectionError(msg) from exc
+        _engine_cache[cache_key] = engine
+        logger.debug("Created DB engine", alias=alias, dsn=_mask_sensitive_dsn(dsn))
         return engine
 
 
+def dispose_engines() -> None:
+    """Dispose every cached engine. Safe to call repeatedly."""
+    with _engine_lock:
+        _reset_engine_cache_after_fork()
+        for engine in _engine_cache.values():
+            engine.dispose()
+            invalidate_table_cache(engine)
+        _engine_cache.clear()
+
+
 def _mask_sensitive_dsn(dsn: str) -> str:
     """Mask sensitive parts of a DSN for safe logging.
 
@@ -176,61 +370,593 @@ def _build_insert_statement(table: Table, engine: Engine) -> PGInsert | SQLiteIn
     raise UpsertError(msg)
 
 
-def upsert_dataframe(
+def _rows_per_statement(engine: Engine, requested: int, column_count: int) -> int:
+    limit = _MAX_BIND_PARAMETERS.get(engine.dialect.name)
+    if limit is None:
+        return requested
+    return max(1, min(requested, limit // max(column_count, 1)))
+
+
+def _iter_record_batches(
     df: DataFrame,
-    table_name: str,
+    batch_size: int,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield ``df`` as lists of row dicts without materializing every row."""
+    for start in range(0, len(df), batch_size):
+        yield cast(
+            "list[dict[str, Any]]",
+            df.iloc[start : start + batch_size].to_dict(orient="records"),  # pyright: ignore[reportUnknownMemberType]
+        )
+
+
+def _grouped(
+    batches: Iterable[list[dict[str, Any]]],
+    size: int,
+) -> Iterator[list[list[dict[str, Any]]]]:
+    iterator = iter(batches)
+    while group := list(islice(iterator, size)):
+        yield group
+
+
+def _apply_on_conflict(
+    insert_stmt: Any,
+    table: Table,
     key_fields: list[str],
+    *,
+    only_changed: bool = False,
+) -> Any:
+    update_columns: dict[str, Any] = {}
+    for column in table.columns:
+        if column.name in key_fields:
+            continue
+        update_columns[column.name] = insert_stmt.excluded[column.name]
+
+    if update_columns:
+        # Leave rows whose hash did not change untouched so they are not rewritten.
+        where = (
+            table.c[ROW_HASH_COLUMN].is_distinct_from(
+                insert_stmt.excluded[ROW_HASH_COLUMN],
+            )
+            if only_changed
+            else None
+        )
+        return insert_stmt.on_conflict_do_update(
+            index_elements=key_fields,
+            set_=update_columns,
+            where=where,
+        )
+    return insert_stmt.on_conflict_do_nothing(index_elements=key_fields)
+
+
+def _build_upsert_statement(
+    table: Table,
     engine: Engine,
-) -> None:
-    """Perform an UPSERT of a pandas DataFrame into a database table."""
-    if getattr(df, "empty", False):
-        logger.info("Skip upsert: DataFrame is empty", table=table_name)
-        return
+    key_fields: list[str],
+    records: list[dict[str, Any]],
+    *,
+    only_changed: bool = False,
+) -> Any:
+    insert_stmt_any = cast(
+        "Any",
+        _build_insert_statement(table, engine).values(records),
+    )
+    return _apply_on_conflict(
+        insert_stmt_any,
+        table,
+        key_fields,
+        only_changed=only_changed,
+    )
+
+
+def _value_token(value: object) -> str:
+    # Equal values give equal tokens whatever dtype holds them, so int64 5 and
+    # float64 5.0 hash alike and the digest does not depend on pandas.
+    if isna(value):
+        return "\x00"
+    if isinstance(value, bool | np.bool_):
+        return str(bool(value))
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    if isinstance(value, numbers.Real):
+        number = float(value)
+        return str(int(number)) if number.is_integer() else repr(number)
+    return _key_token(value)
+
+
+def _row_hashes(df: DataFrame, key_fields: list[str]) -> Series:
+    """Return a SHA256 hex digest of the non-key values of each row in ``df``."""
+    value_columns = [
+        column
+        for column in df.columns
+        if column not in key_fields and column != ROW_HASH_COLUMN
+    ]
+    if not value_columns:
+        return Series(hashlib.sha256(b"").hexdigest(), index=df.index, dtype=object)
+    hashes = [
+        hashlib.sha256(
+            "\x1f".join(_value_token(value) for value in row).encode(),
+        ).hexdigest()
+        for row in df[value_columns].itertuples(index=False, name=None)
+    ]
+    return Series(hashes, index=df.index, dtype=object)
+
+
+def _key_token(value: object) -> str:
+    # Keys read back from the database may be dates while the frame holds text
+    # or datetime64 values (pd.Timestamp is a datetime). Midnight datetimes are
+    # compared as dates so that they match DATE columns.
+    if isinstance(value, datetime.datetime):
+        midnight = value.tzinfo is None and value.time() == datetime.time()
+        if value is not NaT and midnight:
+            return value.date().isoformat()
+        return value.isoformat()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def _fetch_row_hashes(
+    engine: Engine,
+    table: Table,
+    key_fields: list[str],
+    keys: list[tuple[Any, ...]],
+) -> dict[tuple[str, ...], str | None]:
+    """Return the stored row hash for each of ``keys`` that already exists."""
+    key_columns = [table.c[name] for name in key_fields]
+    batch_size = _rows_per_statement(engine, 1000, len(key_fields))
+    stored: dict[tuple[str, ...], str | None] = {}
+    with engine.connect() as conn:
+        for start in range(0, len(keys), batch_size):
+            batch = keys[start : start + batch_size]
+            query = select(*key_columns, table.c[ROW_HASH_COLUMN]).where(
+                tuple_(*key_columns).in_(batch),
+            )
+            for row in conn.execute(query):
+                stored[tuple(_key_token(value) for value in row[:-1])] = row[-1]
+    return stored
+
+
+def _split_unchanged(
+    df: DataFrame,
+    table: Table,
+    key_fields: list[str],
+    engine: Engine,
+) -> tuple[DataFrame, int, int, int]:
+    """Attach row hashes and drop rows whose stored hash already matches.
 
-    metadata = MetaData()
+    Returns the rows to write plus the inserted, updated and unchanged counts.
+    """
+    if ROW_HASH_COLUMN not in table.columns:
+        msg = (
+            f"Table '{table.name}' needs a '{ROW_HASH_COLUMN}' column "
+            "to skip unchanged rows"
+        )
+        raise UpsertError(msg)
+
+    hashed = df.assign(**{ROW_HASH_COLUMN: _row_hashes(df, key_fields)})
+    keys = list(hashed[key_fields].itertuples(index=False, name=None))
     try:
-        table = Table(table_name, metadata, autoload_with=engine)
+        stored = _fetch_row_hashes(engine, table, key_fields, keys)
     except SQLAlchemyError as exc:
-        msg = f"Failed to reflect table '{table_name}': {exc}"
+        msg = f"Failed to read row hashes from '{table.name}': {exc}"
         raise UpsertError(msg) from exc
 
-    for key in key_fields:
-        if key not in table.columns:
-            msg = f"Key field '{key}' is not present in table '{table_name}'"
-            raise UpsertError(msg)
+    existing: list[bool] = []
+    changed: list[bool] = []
+    for key, row_hash in zip(keys, hashed[ROW_HASH_COLUMN], strict=True):
+        token = tuple(_key_token(value) for value in key)
+        exists = token in stored
+        existing.append(exists)
+        changed.append(not exists or stored[token] != row_hash)
+
+    to_write = hashed[changed]
+    inserted = existing.count(False)
+    unchanged = len(hashed) - len(to_write)
+    return to_write, inserted, len(to_write) - inserted, unchanged
+
 
-    records: list[dict[str, Any]] = cast(
-        "list[dict[str, Any]]",
-        df.to_dict(orient="records"),  # pyright: ignore[reportUnknownMemberType]
+def _supports_copy(engine: Engine) -> bool:
+    return engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg"
+
+
+def _resolve_load_method(method: str | None, engine: Engine, total_rows: int) -> str:
+    settings = get_db_load_settings()
+    requested = (method or settings.upsert_method).lower()
+    if requested not in LOAD_METHODS:
+        msg = (
+            f"Unsupported load method '{requested}' "
+            f"(expected one of: {', '.join(LOAD_METHODS)})"
+        )
+        raise UpsertError(msg)
+    if requested == "copy":
+        if not _supports_copy(engine):
+            msg = (
+                "COPY loading requires PostgreSQL with the psycopg 3 driver; "
+                f"got '{engine.dialect.name}+{engine.dialect.driver}'"
+            )
+            raise UpsertError(msg)
+        return "copy"
+    if (
+        requested == "auto"
+        and _supports_copy(engine)
+        and total_rows >= settings.upsert_copy_threshold
+    ):
+        return "copy"
+    return "insert"
+
+
+def _build_staging_table(table: Table, columns: list[str]) -> Table:
+    unknown = [name for name in columns if name not in table.columns]
+    if unknown:
+        msg = f"Columns not present in table '{table.name}': {unknown}"
+        raise UpsertError(msg)
+    return Table(
+        f"_stg_{table.name}_{uuid.uuid4().hex[:8]}",
+        MetaData(),
+        *(Column(name, table.columns[name].type) for name in columns),
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
     )
-    if not records:
-        logger.info("Skip upsert: no records to insert", table=table_name)
-        return
 
+
+def _build_upsert_from_staging(
+    table: Table,
+    staging: Table,
+    key_fields: list[str],
+    *,
+    only_changed: bool = False,
+) -> Any:
     insert_stmt_any = cast(
         "Any",
-        _build_insert_statement(table, engine).values(records),
+        pg_insert(table).from_select(
+            [column.name for column in staging.columns],
+            select(*staging.columns),
+        ),
+    )
+    return _apply_on_conflict(
+        insert_stmt_any,
+        table,
+        key_fields,
+        only_changed=only_changed,
     )
-    update_columns: dict[str, Any] = {}
-    for column in table.columns:
-        if column.name in key_fields:
-            continue
-        update_columns[column.name] = insert_stmt_any.excluded[column.name]
 
-    if update_columns:
-        stmt = insert_stmt_any.on_conflict_do_update(
-            index_elements=key_fields,
-            set_=update_columns,
+
+def _copy_upsert(
+    df: DataFrame,
+    table: Table,
+    key_fields: list[str],
+    engine: Engine,
+    batch_size: int,
+    *,
+    only_changed: bool = False,
+) -> None:
+    """COPY ``df`` into a temporary staging table and upsert from it.
+
+    Everything runs in one transaction; the staging table is dropped on commit.
+    """
+    import psycopg
+
+    columns = [str(column) for column in df.columns]
+    staging = _build_staging_table(table, columns)
+    try:
+        _run_copy_upsert(
+            df,
+            table,
+            staging,
+            key_fields,
+            engine,
+            batch_size,
+            only_changed=only_changed,
         )
-    else:
-        stmt = insert_stmt_any.on_conflict_do_nothing(index_elements=key_fields)
+    except (SQLAlchemyError, psycopg.Error) as exc:
+        logger.error("COPY UPSERT failed", table=table.name, error=str(exc))
+        msg = f"Failed to upsert into '{table.name}' via COPY: {exc}"
+        raise UpsertError(msg) from exc
+
+
+def _run_copy_upsert(  # noqa: PLR0917
+    df: DataFrame,
+    table: Table,
+    staging: Table,
+    key_fields: list[str],
+    engine: Engine,
+    batch_size: int,
+    *,
+    only_changed: bool = False,
+) -> None:
+    columns = [column.name for column in staging.columns]
+    with engine.begin() as conn:
+        staging.create(conn)
+        quote = conn.dialect.identifier_preparer.quote
+        copy_sql = (
+            f"COPY {quote(staging.name)} "
+            f"({', '.join(quote(name) for name in columns)}) FROM STDIN"
+        )
+        driver_connection = cast("Any", conn.connection.driver_connection)
+        with driver_connection.cursor() as cursor, cursor.copy(copy_sql) as copy:
+            for start in range(0, len(df), batch_size):
+                chunk = df.iloc[start : start + batch_size]
+                # astype(object) boxes numpy scalars into Python values and lets
+                # missing values become None, which COPY writes as NULL.
+                boxed = chunk.astype(object).where(chunk.notna(), None)  # pyright: ignore[reportUnknownMemberType]
+                for row in boxed.itertuples(index=False, name=None):
+                    copy.write_row(row)
+        conn.execute(
+            _build_upsert_from_staging(
+                table,
+                staging,
+                key_fields,
+                only_changed=only_changed,
+            ),
+        )
+
+
+def invalidate_table_cache(
+    engine: Engine | None = None,
+    table_name: str | None = None,
+) -> None:
+    """Forget reflected tables so the next load reflects them again.
+
+    Without arguments the whole cache is cleared. ``engine`` limits the
+    invalidation to one engine and ``table_name`` to one table.
+    """
+    with _table_cache_lock:
+        engines = list(_table_cache.keys()) if engine is None else [engine]
+        for cached_engine in engines:
+            tables = _table_cache.get(cached_engine)
+            if tables is None:
+                continue
+            if table_name is None:
+                tables.clear()
+            else:
+                tables.pop(table_name, None)
+
+
+def _cached_table(table_name: str, engine: Engine) -> Table:
+    ttl = get_db_load_settings().upsert_reflection_ttl
+    now = time.monotonic()
+    with _table_cache_lock:
+        tables = _table_cache.setdefault(engine, {})
+        cached = tables.get(table_name)
+        if cached is not None and (ttl is None or now - cached[1] < ttl):
+            return cached[0]
+        try:
+            table = Table(table_name, MetaData(), autoload_with=engine)
+        except SQLAlchemyError as exc:
+            msg = f"Failed to reflect table '{table_name}': {exc}"
+            raise UpsertError(msg) from exc
+        tables[table_name] = (table, now)
+        logger.debug("Reflected table", table=table_name)
+        return table
+
+
+def _reflect_table(table_name: str, key_fields: list[str], engine: Engine) -> Table:
+    table = _cached_table(table_name, engine)
+    if any(key not in table.columns for key in key_fields):
+        # A cached reflection may predate a migration that added the column.
+        invalidate_table_cache(engine, table_name)
+        table = _cached_table(table_name, engine)
+
+    for key in key_fields:
+        if key not in table.columns:
+            msg = f"Key field '{key}' is not present in table '{table_name}'"
+            raise UpsertError(msg)
+    return table
+
 
+def _rows_per_second(rows: int, started: float) -> float:
+    elapsed = time.perf_counter() - started
+    return round(rows / elapsed, 1) if elapsed > 0 else float(rows)
+
+
+def _batched_upsert(
+    df: DataFrame,
+    table: Table,
+    key_fields: list[str],
+    engine: Engine,
+    *,
+    rows_per_statement: int,
+    statements_per_transaction: int,
+    log_progress: bool,
+    only_changed: bool = False,
+) -> None:
+    started = time.perf_counter()
+    total_rows = len(df)
+    loaded = 0
     try:
-        with engine.begin() as conn:
-            conn.execute(stmt)
+        with engine.connect() as conn:
+            for group in _grouped(
+                _iter_record_batches(df, rows_per_statement),
+                statements_per_transaction,
+            ):
+                with conn.begin():
+                    for records in group:
+                        conn.execute(
+                            _build_upsert_statement(
+                                table,
+                                engine,
+                                key_fields,
+                                records,
+                                only_changed=only_changed,
+                            ),
+                        )
+                loaded += sum(len(records) for records in group)
+                if log_progress:
+                    logger.info(
+                        "UPSERT progress",
+                        table=table.name,
+                        rows=loaded,
+                        total_rows=total_rows,
+                        rows_per_sec=_rows_per_second(loaded, started),
+                    )
     except SQLAlchemyError as exc:
-        logger.error("UPSERT failed", table=table_name, error=str(exc))
-        msg = f"Failed to upsert into '{table_name}': {exc}"
+        logger.error(
+            "UPSERT failed",
+            table=table.name,
+            committed_rows=loaded,
+            error=str(exc),
+        )
+        msg = f"Failed to upsert into '{table.name}': {exc}"
         raise UpsertError(msg) from exc
 
-    logger.info("UPSERT completed", table=table_name, rows=len(records))
+
+def _load_rows(
+    df: DataFrame,
+    table: Table,
+    key_fields: list[str],
+    engine: Engine,
+    *,
+    load_method: str,
+    rows_per_batch: int,
+    batches_per_transaction: int | None,
+    commit_per_batch: bool | None,
+    log_progress: bool | None,
+    only_changed: bool,
+) -> dict[str, int]:
+    settings = get_db_load_settings()
+    if load_method == "copy":
+        _copy_upsert(
+            df,
+            table,
+            key_fields,
+            engine,
+            rows_per_batch,
+            only_changed=only_changed,
+        )
+        batching: dict[str, int] = {}
+    else:
+        if commit_per_batch is None:
+            commit_per_batch = settings.upsert_commit_per_batch
+        statements_per_transaction = (
+            1
+            if commit_per_batch
+            else batches_per_transaction or settings.upsert_batches_per_transaction
+        )
+        batching = {
+            "rows_per_statement": _rows_per_statement(
+                engine,
+                rows_per_batch,
+                len(df.columns),
+            ),
+            "statements_per_transaction": statements_per_transaction,
+        }
+        _batched_upsert(
+            df,
+            table,
+            key_fields,
+            engine,
+            log_progress=(
+                settings.upsert_log_progress if log_progress is None else log_progress
+            ),
+            only_changed=only_changed,
+            **batching,
+        )
+    return batching
+
+
+def upsert_dataframe(
+    df: DataFrame,
+    table_name: str,
+    key_fields: list[str],
+    engine: Engine,
+    *,
+    batch_size: int | None = None,
+    batches_per_transaction: int | None = None,
+    commit_per_batch: bool | None = None,
+    log_progress: bool | None = None,
+    method: str | None = None,
+    skip_unchanged: bool | None = None,
+) -> UpsertSummary:
+    """Perform an UPSERT of a pandas DataFrame into a database table.
+
+    Rows are sliced from ``df`` into multi-row ``INSERT ... ON CONFLICT``
+    statements of ``batch_size`` rows (capped by the dialect's bound-parameter
+    limit) and committed every ``batches_per_transaction`` statements, or after
+    each statement with ``commit_per_batch``. Defaults come from
+    ``UPSERT_BATCH_SIZE``, ``UPSERT_BATCHES_PER_TRANSACTION`` and
+    ``UPSERT_COMMIT_PER_BATCH``. With ``log_progress`` (``UPSERT_LOG_PROGRESS``)
+    rows loaded so far and rows per second are logged after each commit.
+
+    Transactions committed before a failure stay committed; re-running the load
+    is safe because every statement is an UPSERT.
+
+    The target table is reflected once per engine and reused by later calls
+    (see :func:`invalidate_table_cache`); ``UPSERT_REFLECTION_TTL`` bounds how
+    long a reflection is trusted. A failed load drops the cached reflection, and
+    a key column missing from it triggers one fresh reflection before failing.
+
+    ``method`` (default ``UPSERT_METHOD``) selects the strategy: ``"insert"``
+    for the batched statements above, ``"copy"`` to COPY the frame into a
+    temporary staging table on PostgreSQL (psycopg 3) and upsert from it with a
+    single ``INSERT ... SELECT`` in one transaction, or ``"auto"`` to use COPY
+    on PostgreSQL once the frame has ``UPSERT_COPY_THRESHOLD`` rows.
+
+    With ``skip_unchanged`` (default ``UPSERT_SKIP_UNCHANGED``) a hash of the
+    non-key values is written to the table's ``row_hash`` column. Rows whose
+    stored hash already matches are dropped before the write, and the
+    ``ON CONFLICT DO UPDATE`` only fires ``WHERE row_hash IS DISTINCT FROM``
+    the new hash, so unchanged rows are never rewritten.
+    """
+    if getattr(df, "empty", False) or len(df) == 0:
+        logger.info("Skip upsert: DataFrame is empty", table=table_name)
+        return UpsertSummary(table=table_name, rows=0, method="skip")
+
+    table = _reflect_table(table_name, key_fields, engine)
+    settings = get_db_load_settings()
+    only_changed = (
+        settings.upsert_skip_unchanged if skip_unchanged is None else skip_unchanged
+    )
+    started = time.perf_counter()
+    try:
+        if only_changed:
+            df, inserted, updated, unchanged = _split_unchanged(
+                df,
+                table,
+                key_fields,
+                engine,
+            )
+            counts: dict[str, int] = {
+                "inserted": inserted,
+                "updated": updated,
+                "unchanged": unchanged,
+            }
+        else:
+            counts = {}
+        total_rows = len(df)
+        load_method = _resolve_load_method(method, engine, total_rows)
+        batching = (
+            _load_rows(
+                df,
+                table,
+                key_fields,
+                engine,
+                load_method=load_method,
+                rows_per_batch=batch_size or settings.upsert_batch_size,
+                batches_per_transaction=batches_per_transaction,
+                commit_per_batch=commit_per_batch,
+                log_progress=log_progress,
+                only_changed=only_changed,
+            )
+            if total_rows
+            else {}
+        )
+    except UpsertError:
+        # The table may have changed underneath the cached reflection.
+        invalidate_table_cache(engine, table_name)
+        raise
+
+    logger.info(
+        "UPSERT completed",
+        table=table_name,
+        rows=total_rows,
+        method=load_method,
+        rows_per_sec=_rows_per_second(total_rows, started),
+        **counts,
+        **batching,
+    )
+    return UpsertSummary(
+        table=table_name,
+        rows=total_rows,
+        method=load_method,
+        **counts,
+    )
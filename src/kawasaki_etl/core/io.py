@@ -1,19 +1,37 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from dataclasses import dataclass, replace
+from email.utils import formatdate
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
 
 import httpx
 
+from kawasaki_etl.core.meta_store import (
+    get_http_validators,
+    save_http_validators,
+    write_digest_sidecar,
+)
+from kawasaki_etl.utils.http_client import get_http_client
 from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from kawasaki_etl.core.models import DatasetConfig
 
 RAW_DATA_DIR = Path("data/raw")
 CHUNK_SIZE = 1024 * 64
 HTTP_ERROR_THRESHOLD = 400
+HTTP_NOT_MODIFIED = 304
+HTTP_PARTIAL_CONTENT = 206
+HTTP_RANGE_NOT_SATISFIABLE = 416
+PART_SUFFIX = ".part"
+# ETag/Last-Modified of downloads that have no dataset meta record.
+VALIDATORS_SIDECAR_SUFFIX = ".http.json"
 
 TimeoutErrorType: type[Exception] = getattr(httpx, "TimeoutException", Exception)
 RequestErrorType: type[Exception] = getattr(httpx, "RequestError", Exception)
@@ -41,52 +59,33 @@ def get_raw_path(dataset: DatasetConfig) -> Path:
     return RAW_DATA_DIR / dataset.category / dataset.dataset_id / filename
 
 
-def download_file(url: str, dest_path: Path) -> None:
-    """Download a file via HTTP(S) to the specified destination."""
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-    try:
-        with (
-            httpx.Client(
-                timeout=30.0,
-                follow_redirects=True,
-            ) as client,
-            client.stream("GET", url) as response,
-        ):
-            if response.status_code >= HTTP_ERROR_THRESHOLD:
-                msg = f"HTTP {response.status_code}"
-                raise DownloadError(msg)
-
-            with dest_path.open("wb") as dest_file:
-                for chunk in response.iter_bytes(chunk_size=CHUNK_SIZE):
-                    dest_file.write(chunk)
-    except HTTPErrorType as exc:
-        if isinstance(exc, TimeoutErrorType):
-            logger.error(
-                "Download timed out",
-                url=url,
-                dest=str(dest_path),
-                error=str(exc),
-            )
-            msg = "ダウンロードがタイムアウトしました"
-        elif isinstance(exc, RequestErrorType):
-            logger.error(
-                "Download request failed",
-                url=url,
-                dest=str(dest_path),
-                error=str(exc),
-            )
-            msg = "ネットワークエラーによりダウンロードに失敗しました"
-        else:
-            logger.error(
-                "HTTP error during download",
-                url=url,
-                dest=str(dest_path),
-                error=str(exc),
-            )
-            msg = "HTTP エラーによりダウンロードに失敗しました"
-        raise DownloadError(msg) from exc
-    except OSError as exc:
+def _to_download_error(exc: Exception, url: str, dest_path: Path) -> DownloadError:
+    """Log a transport or filesystem failure and wrap it in ``DownloadError``."""
+    if isinstance(exc, TimeoutErrorType):
+        logger.error(
+            "Download timed out",
+            url=url,
+            dest=str(dest_path),
+            error=str(exc),
+        )
+        msg = "ダウンロードがタイムアウトしました"
+    elif isinstance(exc, RequestErrorType):
+        logger.error(
+            "Download request failed",
+            url=url,
+            dest=str(dest_path),
+            error=str(exc),
+        )
+        msg = "ネットワークエラーによりダウンロードに失敗しました"
+    elif isinstance(exc, HTTPErrorType):
+        logger.error(
+            "HTTP error during download",
+            url=url,
+            dest=str(dest_path),
+            error=str(exc),
+        )
+        msg = "HTTP エラーによりダウンロードに失敗しました"
+    else:
         logger.error(
             "Failed to write downloaded file",
             url=url,
@@ -94,13 +93,298 @@ def download_file(url: str, dest_path: Path) -> None:
             error=str(exc),
         )
         msg = "ファイルの保存に失敗しました"
-        raise DownloadError(msg) from exc
+    return DownloadError(msg)
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    """Outcome of a single HTTP download."""
+
+    not_modified: bool = False
+    etag: str | None = None
+    last_modified: str | None = None
+    sha256: str | None = None
+
+
+def part_path_for(dest_path: Path) -> Path:
+    """Return the in-progress ``.part`` path used while downloading ``dest_path``."""
+    return dest_path.with_name(f"{dest_path.name}{PART_SUFFIX}")
+
+
+def _if_range_path(part_path: Path) -> Path:
+    return part_path.with_name(f"{part_path.name}.validator")
+
+
+def _validators_sidecar_path(dest_path: Path) -> Path:
+    return dest_path.with_name(f"{dest_path.name}{VALIDATORS_SIDECAR_SUFFIX}")
+
+
+def _read_validators_sidecar(dest_path: Path) -> dict[str, str]:
+    """Return the validators saved next to ``dest_path``; empty when unreadable."""
+    try:
+        data = json.loads(_validators_sidecar_path(dest_path).read_text("utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        str(key): str(value)
+        for key, value in cast("dict[str, Any]", data).items()
+        if value
+    }
+
+
+def _write_validators_sidecar(dest_path: Path, result: DownloadResult) -> None:
+    sidecar = _validators_sidecar_path(dest_path)
+    validators = {
+        key: value
+        for key, value in (
+            ("etag", result.etag),
+            ("last_modified", result.last_modified),
+        )
+        if value
+    }
+    if validators:
+        sidecar.write_text(json.dumps(validators), encoding="utf-8")
+    else:
+        sidecar.unlink(missing_ok=True)
+
+
+def _range_start(content_range: str | None) -> int | None:
+    # e.g. "bytes 1024-2047/4096"
+    if not content_range or not content_range.startswith("bytes "):
+        return None
+    start, _, _ = content_range.removeprefix("bytes ").partition("-")
+    return int(start) if start.isdigit() else None
+
+
+def _expected_size(response: Any, offset: int) -> int | None:
+    """Return the expected final file size, or ``None`` if it cannot be known.
+
+    Content-Length describes the encoded body, so it is only comparable with the
+    decoded bytes on disk when no content coding was applied.
+    """
+    encoding = response.headers.get("Content-Encoding", "identity")
+    if encoding.lower() != "identity":
+        return None
+    if offset:
+        _, _, total = str(response.headers.get("Content-Range", "")).rpartition("/")
+        return int(total) if total.isdigit() else None
+    length = response.headers.get("Content-Length")
+    return int(length) if length is not None and str(length).isdigit() else None
+
+
+def _hash_existing(path: Path) -> hashlib._Hash:  # pyright: ignore[reportPrivateUsage]
+    digest = hashlib.sha256()
+    with path.open("rb") as existing:
+        for chunk in iter(lambda: existing.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest
+
+
+def _begin_part(
+    response: Any,
+    url: str,
+    part_path: Path,
+    offset: int,
+) -> hashlib._Hash:  # pyright: ignore[reportPrivateUsage]
+    """Check a 200/206 response before its body is written to ``part_path``.
+
+    Records the If-Range validator of a fresh download and returns the SHA256
+    object to feed the body into, already holding the bytes of a resumed
+    ``.part``.
+    """
+    if response.status_code == HTTP_PARTIAL_CONTENT:
+        if _range_start(response.headers.get("Content-Range")) != offset:
+            part_path.unlink(missing_ok=True)
+            msg = "サーバーが想定外の範囲を返しました"
+            raise DownloadError(msg)
+        logger.info("Resuming download", url=url, offset=offset)
+        return _hash_existing(part_path)
+
+    validator_path = _if_range_path(part_path)
+    validator = response.headers.get("ETag") or response.headers.get(
+        "Last-Modified",
+    )
+    if validator:
+        validator_path.write_text(validator, encoding="utf-8")
+    else:
+        validator_path.unlink(missing_ok=True)
+    return hashlib.sha256()
 
 
-def download_if_needed(dataset: DatasetConfig) -> Path:
-    """Download the dataset if the raw file is not already present."""
+def _verify_part(response: Any, part_path: Path, offset: int) -> None:
+    """Raise unless ``part_path`` has the size announced by ``response``."""
+    resumed = response.status_code == HTTP_PARTIAL_CONTENT
+    expected = _expected_size(response, offset if resumed else 0)
+    actual = part_path.stat().st_size
+    if expected is not None and actual != expected:
+        msg = (
+            "ダウンロードサイズが Content-Length と一致しません "
+            f"(expected={expected}, actual={actual})"
+        )
+        raise DownloadError(msg)
+
+
+def _write_part(response: Any, url: str, part_path: Path, offset: int) -> str:
+    """Write a 200/206 body into ``part_path``, verify its size and hash it.
+
+    Returns the SHA256 hex digest of the complete file, computed from the bytes
+    as they are written so the file never needs to be re-read.
+    """
+    digest = _begin_part(response, url, part_path, offset)
+    resumed = response.status_code == HTTP_PARTIAL_CONTENT
+    with part_path.open("ab" if resumed else "wb") as part_file:
+        for chunk in response.iter_bytes(chunk_size=CHUNK_SIZE):
+            part_file.write(chunk)
+            digest.update(chunk)
+    _verify_part(response, part_path, offset)
+    return digest.hexdigest()
+
+
+def _part_request(
+    url: str,
+    part_path: Path,
+    headers: Mapping[str, str] | None,
+) -> tuple[int, dict[str, str]]:
+    """Return the resume offset and the request headers for ``part_path``."""
+    validator_path = _if_range_path(part_path)
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    if offset and not validator_path.exists():
+        # Without If-Range a changed resource would still answer 206 and its
+        # bytes would be appended to the stale prefix, so start over instead.
+        logger.info("Discarding partial download without validator", url=url)
+        part_path.unlink()
+        offset = 0
+    request_headers = dict(headers or {})
+    if offset:
+        request_headers["Range"] = f"bytes={offset}-"
+        # Byte ranges must refer to the unencoded file we already hold.
+        request_headers["Accept-Encoding"] = "identity"
+        request_headers["If-Range"] = validator_path.read_text(encoding="utf-8")
+    return offset, request_headers
+
+
+def _response_result(response: Any, offset: int) -> tuple[DownloadResult, bool]:
+    """Return the result skeleton for ``response`` and whether the part is stale.
+
+    A body is to be written unless the result is ``not_modified`` or stale.
+    """
+    result = DownloadResult(
+        not_modified=response.status_code == HTTP_NOT_MODIFIED,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    stale = offset > 0 and response.status_code == HTTP_RANGE_NOT_SATISFIABLE
+    if not (result.not_modified or stale) and (
+        response.status_code >= HTTP_ERROR_THRESHOLD
+    ):
+        msg = f"HTTP {response.status_code}"
+        raise DownloadError(msg)
+    return result, stale
+
+
+def _discard_part(part_path: Path) -> None:
+    # The partial file no longer matches the remote resource; start over.
+    part_path.unlink(missing_ok=True)
+    _if_range_path(part_path).unlink(missing_ok=True)
+
+
+def _stream_to_part(
+    client: Any,
+    url: str,
+    part_path: Path,
+    headers: Mapping[str, str] | None,
+) -> DownloadResult:
+    offset, request_headers = _part_request(url, part_path, headers)
+    with client.stream("GET", url, headers=request_headers) as response:
+        result, stale = _response_result(response, offset)
+        if not (result.not_modified or stale):
+            result = replace(
+                result,
+                sha256=_write_part(response, url, part_path, offset),
+            )
+
+    if stale:
+        _discard_part(part_path)
+        return _stream_to_part(client, url, part_path, headers)
+    return result
+
+
+def _finish_download(dest_path: Path, result: DownloadResult) -> None:
+    """Move a completed ``.part`` into place and cache its digest."""
+    if result.not_modified:
+        return
+    part_path = part_path_for(dest_path)
+    part_path.replace(dest_path)
+    _if_range_path(part_path).unlink(missing_ok=True)
+    if result.sha256 is not None:
+        write_digest_sidecar(dest_path, result.sha256)
+
+
+def download_file(
+    url: str,
+    dest_path: Path,
+    *,
+    headers: Mapping[str, str] | None = None,
+) -> DownloadResult:
+    """Download a file via HTTP(S) to the specified destination.
+
+    The body is streamed into ``<dest>.part`` and atomically renamed into place
+    once its size matches Content-Length, so ``dest_path`` never holds a
+    truncated file. A leftover ``.part`` from an interrupted run is resumed
+    with an HTTP Range request guarded by ``If-Range`` when the server supports
+    it; a ``.part`` without a recorded validator is discarded and refetched.
+    The SHA256 digest is computed while streaming and cached in a sidecar, so
+    :func:`calculate_sha256` does not need to re-read the file.
+
+    When ``headers`` carry conditional validators and the server answers
+    ``304 Not Modified``, ``dest_path`` is left untouched and the result has
+    ``not_modified`` set.
+    """
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = part_path_for(dest_path)
+
+    client = get_http_client()
+    try:
+        result = _stream_to_part(client, url, part_path, headers)
+        _finish_download(dest_path, result)
+    except (HTTPErrorType, OSError) as exc:
+        raise _to_download_error(exc, url, dest_path) from exc
+    return result
+
+
+def _conditional_headers(dataset: DatasetConfig, dest_path: Path) -> dict[str, str]:
+    return _validator_headers(get_http_validators(dataset, dest_path), dest_path)
+
+
+def _validator_headers(
+    validators: Mapping[str, str],
+    dest_path: Path,
+) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if "etag" in validators:
+        headers["If-None-Match"] = validators["etag"]
+    # Fall back to the local mtime so files fetched before validators were
+    # recorded can still be revalidated without a full transfer.
+    headers["If-Modified-Since"] = validators.get("last_modified") or formatdate(
+        dest_path.stat().st_mtime,
+        usegmt=True,
+    )
+    return headers
+
+
+def download_if_needed(dataset: DatasetConfig, *, revalidate: bool = True) -> Path:
+    """Download the dataset unless the local raw file is still current.
+
+    An existing raw file is revalidated with a conditional GET
+    (``If-None-Match``/``If-Modified-Since``); a ``304`` keeps the local copy
+    without transferring a body. Pass ``revalidate=False`` to trust any
+    existing file as-is.
+    """
     dest_path = get_raw_path(dataset)
-    if dest_path.exists() and dest_path.stat().st_size > 0:
+    exists = dest_path.exists() and dest_path.stat().st_size > 0
+    if exists and not revalidate:
         logger.info(
             "Raw file already exists; skipping download",
             path=str(dest_path),
@@ -108,14 +392,41 @@ def download_if_needed(dataset: DatasetConfig) -> Path:
         )
         return dest_path
 
+    headers = _conditional_headers(dataset, dest_path) if exists else None
     logger.info(
-        "Starting dataset download",
+        "Revalidating raw file" if exists else "Starting dataset download",
         dataset_id=dataset.dataset_id,
         url=dataset.url,
         dest=str(dest_path),
     )
 
-    download_file(dataset.url, dest_path)
+    try:
+        result = download_file(dataset.url, dest_path, headers=headers)
+    except DownloadError as exc:
+        if not exists:
+            raise
+        logger.warning(
+            "Revalidation failed; using existing raw file",
+            path=str(dest_path),
+            error=str(exc),
+        )
+        return dest_path
+
+    if result.etag or result.last_modified:
+        save_http_validators(
+            dataset,
+            dest_path,
+            etag=result.etag,
+            last_modified=result.last_modified,
+        )
+
+    if result.not_modified:
+        logger.info(
+            "Raw file not modified; skipping download",
+            path=str(dest_path),
+            size=dest_path.stat().st_size,
+        )
+        return dest_path
 
     logger.info(
         "Download completed",
@@ -0,0 +1,157 @@
+"""SQLite-backed index of processed raw files.
+
+A single database in WAL mode replaces the per-file JSON records written by
+:mod:`kawasaki_etl.core.meta_store` when ``META_BACKEND=sqlite`` is set.
+Records are keyed by ``(category, dataset_id, raw_name)`` and stored as JSON
+alongside a few indexed columns so they can be queried in bulk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any
+
+from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+MetaKey = tuple[str, str, str]
+
+# SQLite limits the number of bound parameters per statement; stay well below it.
+_LOOKUP_BATCH_SIZE = 300
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta_records (
+    category TEXT NOT NULL,
+    dataset_id TEXT NOT NULL,
+    raw_name TEXT NOT NULL,
+    source_url TEXT,
+    sha256 TEXT,
+    processed_at TEXT,
+    record TEXT NOT NULL,
+    PRIMARY KEY (category, dataset_id, raw_name)
+)
+"""
+
+logger: LoggerProtocol = get_logger(__name__)
+
+_index_lock = threading.Lock()
+_shared_index: MetaIndex | None = None
+
+
+class MetaIndex:
+    """Thread-safe wrapper around the SQLite meta database."""
+
+    def __init__(self, db_path: Path) -> None:
+        """Open (and create if needed) the database at ``db_path``."""
+        self.db_path = db_path
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @property
+    def is_usable(self) -> bool:
+        """Return whether the connection belongs to the current process."""
+        return self._pid == os.getpid()
+
+    def get(self, key: MetaKey) -> dict[str, Any] | None:
+        """Return the record stored under ``key`` or ``None``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record FROM meta_records "
+                "WHERE category = ? AND dataset_id = ? AND raw_name = ?",
+                key,
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def get_many(self, keys: Iterable[MetaKey]) -> dict[MetaKey, dict[str, Any]]:
+        """Return the stored records for ``keys``; missing keys are omitted."""
+        unique = list(dict.fromkeys(keys))
+        found: dict[MetaKey, dict[str, Any]] = {}
+        for start in range(0, len(unique), _LOOKUP_BATCH_SIZE):
+            batch = unique[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ", ".join("(?, ?, ?)" for _ in batch)
+            query = (
+                "SELECT category, dataset_id, raw_name, record FROM meta_records "  # noqa: S608 - only placeholders are interpolated
+                f"WHERE (category, dataset_id, raw_name) IN ({placeholders})"
+            )
+            params = [value for key in batch for value in key]
+            with self._lock:
+                rows = self._conn.execute(query, params).fetchall()
+            for category, dataset_id, raw_name, record in rows:
+                found[category, dataset_id, raw_name] = json.loads(record)
+        return found
+
+    def put(self, key: MetaKey, record: dict[str, Any]) -> None:
+        """Insert or replace the record stored under ``key``."""
+        self.put_many([(key, record)])
+
+    def put_many(self, items: Iterable[tuple[MetaKey, dict[str, Any]]]) -> int:
+        """Insert or replace several records in one transaction."""
+        rows = [
+            (
+                *key,
+                record.get("source_url"),
+                record.get("sha256"),
+                record.get("processed_at"),
+                json.dumps(record, ensure_ascii=False),
+            )
+            for key, record in items
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO meta_records "
+                "(category, dataset_id, raw_name, source_url, sha256, processed_at, "
+                "record) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (category, dataset_id, raw_name) DO UPDATE SET "
+                "source_url = excluded.source_url, sha256 = excluded.sha256, "
+                "processed_at = excluded.processed_at, record = excluded.record",
+                rows,
+            )
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def get_meta_index(db_path: Path) -> MetaIndex:
+    """Return the process-wide :class:`MetaIndex` for ``db_path``.
+
+    The connection is reopened when the path changes or after a fork.
+    """
+    global _shared_index  # noqa: PLW0603
+    with _index_lock:
+        if (
+            _shared_index is None
+            or _shared_index.db_path != db_path
+            or not _shared_index.is_usable
+        ):
+            if _shared_index is not None and _shared_index.is_usable:
+                _shared_index.close()
+            _shared_index = MetaIndex(db_path)
+            logger.debug("Opened meta index", db_path=str(db_path))
+        return _shared_index
+
+
+def close_meta_index() -> None:
+    """Close the shared index if it was opened. Safe to call repeatedly."""
+    global _shared_index  # noqa: PLW0603
+    with _index_lock:
+        if _shared_index is not None and _shared_index.is_usable:
+            _shared_index.close()
+        _shared_index = None
+
+
+__all__ = ["MetaIndex", "MetaKey", "close_meta_index", "get_meta_index"]
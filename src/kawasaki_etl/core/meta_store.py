@@ -3,15 +3,28 @@ from __future__ import annotations
 import datetime
 import hashlib
 import json
+import sqlite3
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
+from kawasaki_etl.core.meta_index import MetaIndex, MetaKey, get_meta_index
 from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
+from kawasaki_etl.utils.settings import get_meta_store_settings
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
     from kawasaki_etl.core.models import DatasetConfig
 
 META_DATA_DIR = Path("data/meta")
+META_DB_FILENAME = "meta.sqlite3"
+HTTP_VALIDATORS_KEY = "http_validators"
+DIGEST_SIDECAR_SUFFIX = ".sha256.json"
+STAT_SIGNATURE_KEY = "stat_signature"
+STAGES_KEY = "stages"
+# Pipeline stages in execution order; a stage is only reused when every stage
+# before it is reusable too.
+PIPELINE_STAGES = ("download", "normalize", "load")
 
 logger: LoggerProtocol = get_logger(__name__)
 
@@ -24,15 +37,112 @@ def get_meta_path(dataset: DatasetConfig, raw_path: Path) -> Path:
     """Return the metadata path for a given raw file.
 
     The path structure mirrors ``data/raw/<category>/<dataset_id>/`` and appends
-    ``.json`` to the raw filename.
+    ``.json`` to the raw filename. With the SQLite backend the path is only used
+    as a stable identifier in logs.
     """
     return (
         META_DATA_DIR / dataset.category / dataset.dataset_id / f"{raw_path.name}.json"
     )
 
 
-def calculate_sha256(path: Path, chunk_size: int = 65536) -> str:
-    """Calculate the SHA256 hash of a file."""
+def _meta_key(dataset: DatasetConfig, raw_path: Path) -> MetaKey:
+    return (dataset.category, dataset.dataset_id, raw_path.name)
+
+
+def _use_sqlite() -> bool:
+    return get_meta_store_settings().meta_backend == "sqlite"
+
+
+def _meta_index() -> MetaIndex:
+    configured = get_meta_store_settings().meta_db_path
+    db_path = Path(configured) if configured else META_DATA_DIR / META_DB_FILENAME
+    try:
+        return get_meta_index(db_path)
+    except sqlite3.Error as exc:
+        msg = f"Failed to open metadata database: {db_path}"
+        raise MetaStoreError(msg) from exc
+
+
+def _load_record(dataset: DatasetConfig, raw_path: Path) -> dict[str, Any] | None:
+    if not _use_sqlite():
+        return _load_meta(get_meta_path(dataset, raw_path))
+    try:
+        return _meta_index().get(_meta_key(dataset, raw_path))
+    except sqlite3.Error as exc:
+        msg = f"Failed to read metadata for dataset: {dataset.dataset_id}"
+        raise MetaStoreError(msg) from exc
+
+
+def _save_record(
+    dataset: DatasetConfig,
+    raw_path: Path,
+    record: dict[str, Any],
+) -> None:
+    if not _use_sqlite():
+        _write_meta(get_meta_path(dataset, raw_path), record)
+        return
+    try:
+        _meta_index().put(_meta_key(dataset, raw_path), record)
+    except sqlite3.Error as exc:
+        logger.error(
+            "Failed to write metadata",
+            dataset_id=dataset.dataset_id,
+            error=str(exc),
+        )
+        msg = f"Failed to write metadata for dataset: {dataset.dataset_id}"
+        raise MetaStoreError(msg) from exc
+
+
+def get_digest_sidecar_path(path: Path) -> Path:
+    """Return the sidecar path caching the SHA256 digest of ``path``."""
+    return path.with_name(f"{path.name}{DIGEST_SIDECAR_SUFFIX}")
+
+
+def write_digest_sidecar(path: Path, sha256: str) -> Path:
+    """Record ``sha256`` for ``path`` together with its current size and mtime."""
+    stat = path.stat()
+    sidecar = get_digest_sidecar_path(path)
+    record = {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    try:
+        sidecar.write_text(json.dumps(record), encoding="utf-8")
+    except OSError as exc:  # pragma: no cover - unexpected filesystem failure
+        msg = f"Failed to write digest sidecar: {sidecar}"
+        raise MetaStoreError(msg) from exc
+    return sidecar
+
+
+def _read_cached_digest(path: Path) -> str | None:
+    try:
+        record = json.loads(get_digest_sidecar_path(path).read_text(encoding="utf-8"))
+        stat = path.stat()
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(record, dict):
+        return None
+    cached = cast("dict[str, Any]", record)
+    if cached.get("size") != stat.st_size or cached.get("mtime_ns") != stat.st_mtime_ns:
+        return None
+    digest = cached.get("sha256")
+    return digest if isinstance(digest, str) else None
+
+
+def calculate_sha256(
+    path: Path,
+    chunk_size: int = 65536,
+    *,
+    use_cache: bool = True,
+) -> str:
+    """Calculate the SHA256 hash of a file.
+
+    When ``use_cache`` is true and a digest sidecar written at download time
+    still matches the file's size and mtime, the cached digest is returned
+    without reading the file.
+    """
+    if use_cache:
+        cached = _read_cached_digest(path)
+        if cached is not None:
+            return cached
+
     digest = hashlib.sha256()
     try:
         with path.open("rb") as file:
@@ -63,14 +173,14 @@ def mark_loaded(
 ) -> Path:
     """Persist metadata indicating that a dataset file has been processed."""
     meta_path = get_meta_path(dataset, raw_path)
-    meta_path.parent.mkdir(parents=True, exist_ok=True)
 
+    stat = raw_path.stat()
     downloaded_at = datetime.datetime.fromtimestamp(
-        raw_path.stat().st_mtime,
+        stat.st_mtime,
         tz=datetime.UTC,
     ).isoformat()
 
-    record = {
+    record: dict[str, Any] = {
         "dataset_id": dataset.dataset_id,
         "category": dataset.category,
         "source_url": dataset.url,
@@ -78,15 +188,20 @@ def mark_loaded(
         "sha256": sha256,
         "downloaded_at": downloaded_at,
         "processed_at": _ensure_isoformat(processed_at),
+        STAT_SIGNATURE_KEY: {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "inode": stat.st_ino,
+        },
     }
 
-    try:
-        meta_json = json.dumps(record, ensure_ascii=False, indent=2)
-        meta_path.write_text(meta_json, encoding="utf-8")
-    except OSError as exc:  # pragma: no cover - unexpected filesystem failure
-        logger.error("Failed to write metadata", path=str(meta_path), error=str(exc))
-        msg = f"Failed to write metadata file: {meta_path}"
-        raise MetaStoreError(msg) from exc
+    previous = _load_record(dataset, raw_path)
+    if previous is not None:
+        for key in (HTTP_VALIDATORS_KEY, STAGES_KEY):
+            if key in previous:
+                record[key] = previous[key]
+
+    _save_record(dataset, raw_path, record)
 
     logger.info(
         "Saved metadata for dataset",
@@ -97,6 +212,121 @@ def mark_loaded(
     return meta_path
 
 
+def mark_stage_complete(
+    dataset: DatasetConfig,
+    raw_path: Path,
+    stage: str,
+    *,
+    sha256: str,
+    normalizer_version: str | None = None,
+    artifact: Path | None = None,
+) -> Path:
+    """Record that ``stage`` finished for the raw file with digest ``sha256``.
+
+    ``normalizer_version`` identifies the code and settings that produced the
+    normalized data and is stored for the ``normalize`` and ``load`` stages.
+    ``artifact`` is the file written by the stage. Records of later stages are
+    dropped, since they were derived from the previous output of ``stage``.
+
+    Raises:
+        MetaStoreError: If ``stage`` is not one of :data:`PIPELINE_STAGES`.
+
+    """
+    if stage not in PIPELINE_STAGES:
+        msg = f"Unknown pipeline stage: {stage}"
+        raise MetaStoreError(msg)
+    meta_path = get_meta_path(dataset, raw_path)
+    record = _load_record(dataset, raw_path) or {}
+    previous = record.get(STAGES_KEY)
+    stages: dict[str, Any] = (
+        dict(cast("dict[str, Any]", previous)) if isinstance(previous, dict) else {}
+    )
+    entry: dict[str, Any] = {
+        "sha256": sha256,
+        "completed_at": datetime.datetime.now(tz=datetime.UTC).isoformat(),
+    }
+    if stage != "download":
+        entry["normalizer_version"] = normalizer_version
+    if artifact is not None:
+        entry["artifact"] = str(artifact)
+    stages[stage] = entry
+    for later in PIPELINE_STAGES[PIPELINE_STAGES.index(stage) + 1 :]:
+        stages.pop(later, None)
+    record[STAGES_KEY] = stages
+    _save_record(dataset, raw_path, record)
+    logger.debug(
+        "Recorded pipeline stage",
+        dataset_id=dataset.dataset_id,
+        meta_path=str(meta_path),
+        stage=stage,
+        sha256=sha256,
+        normalizer_version=normalizer_version,
+    )
+    return meta_path
+
+
+def _stage_is_current(
+    stage: str,
+    entry: object,
+    sha256: str,
+    normalizer_version: str,
+) -> bool:
+    if not isinstance(entry, dict):
+        return False
+    data = cast("dict[str, Any]", entry)
+    if data.get("sha256") != sha256:
+        return False
+    if stage == "download":
+        return True
+    if data.get("normalizer_version") != normalizer_version:
+        return False
+    artifact = data.get("artifact")
+    return stage != "normalize" or (
+        isinstance(artifact, str) and Path(artifact).exists()
+    )
+
+
+def completed_stages(
+    dataset: DatasetConfig,
+    raw_path: Path,
+    *,
+    sha256: str,
+    normalizer_version: str,
+) -> dict[str, dict[str, Any]] | None:
+    """Return the leading stages already completed for this raw file.
+
+    Stages are checked in :data:`PIPELINE_STAGES` order and the result stops at
+    the first stage that has to run again: a different raw ``sha256``
+    invalidates every stage, a different ``normalizer_version`` invalidates
+    ``normalize`` and ``load``, and a missing normalized artifact invalidates
+    ``normalize`` and everything after it. Returns ``None`` when no stage was
+    ever recorded, e.g. for files loaded before stages were tracked.
+    """
+    record = _load_record(dataset, raw_path)
+    stages = record.get(STAGES_KEY) if record is not None else None
+    if not isinstance(stages, dict):
+        return None
+    recorded = cast("dict[str, Any]", stages)
+    completed: dict[str, dict[str, Any]] = {}
+    for stage in PIPELINE_STAGES:
+        entry = recorded.get(stage)
+        if not _stage_is_current(stage, entry, sha256, normalizer_version):
+            break
+        completed[stage] = cast("dict[str, Any]", entry)
+    return completed
+
+
+def _write_meta(meta_path: Path, record: dict[str, Any]) -> None:
+    meta_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        meta_json = json.dumps(record, ensure_ascii=False, indent=2)
+        meta_path.write_text(meta_json, encoding="utf-8")
+    except OSError as exc:  # pragma: no cover - unexpected filesystem failure
+        logger.error("Failed to write metadata", path=str(meta_path), error=str(exc))
+        msg = f"Failed to write metadata file: {meta_path}"
+        raise MetaStoreError(msg) from exc
+
+
 def _load_meta(meta_path: Path) -> dict[str, Any] | None:
     try:
         return json.loads(meta_path.read_text(encoding="utf-8"))
@@ -115,12 +345,28 @@ def _load_meta(meta_path: Path) -> dict[str, Any] | None:
         raise MetaStoreError(msg) from exc
 
 
-def is_already_loaded(dataset: DatasetConfig, raw_path: Path, sha256: str) -> bool:
-    """Check whether the file has already been processed with the same content."""
+def _stat_signature(path: Path) -> dict[str, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "inode": stat.st_ino}
+
+
+def _matches_meta(
+    dataset: DatasetConfig,
+    raw_path: Path,
+    meta: dict[str, Any],
+    sha256: str | None,
+) -> bool:
     meta_path = get_meta_path(dataset, raw_path)
-    meta = _load_meta(meta_path)
-    if meta is None:
-        return False
+    fast_path = False
+    if sha256 is None:
+        stored_signature = meta.get(STAT_SIGNATURE_KEY)
+        fast_path = stored_signature is not None and stored_signature == (
+            _stat_signature(raw_path)
+        )
+        sha256 = str(meta.get("sha256")) if fast_path else calculate_sha256(raw_path)
 
     matches_dataset = meta.get("dataset_id") == dataset.dataset_id
     matches_category = meta.get("category") == dataset.category
@@ -133,6 +379,7 @@ def is_already_loaded(dataset: DatasetConfig, raw_path: Path, sha256: str) -> bo
             "Dataset already processed; skipping",
             dataset_id=dataset.dataset_id,
             meta_path=str(meta_path),
+            fast_path=fast_path,
         )
         return True
 
@@ -147,3 +394,150 @@ def is_already_loaded(dataset: DatasetConfig, raw_path: Path, sha256: str) -> bo
         matches_sha=matches_sha,
     )
     return False
+
+
+def is_already_loaded(
+    dataset: DatasetConfig,
+    raw_path: Path,
+    sha256: str | None = None,
+) -> bool:
+    """Check whether the file has already been processed with the same content.
+
+    When ``sha256`` is omitted and the raw file's size, mtime and inode still
+    match the signature recorded by :func:`mark_loaded`, the stored digest is
+    trusted without hashing the file. Otherwise the digest is computed with
+    :func:`calculate_sha256`. Pass an explicitly computed ``sha256`` to force a
+    full content comparison.
+    """
+    meta = _load_record(dataset, raw_path)
+    if meta is None:
+        return False
+    return _matches_meta(dataset, raw_path, meta, sha256)
+
+
+def get_loaded_sha256(dataset: DatasetConfig, raw_path: Path) -> str | None:
+    """Return the digest stored by :func:`mark_loaded`, or ``None`` if absent.
+
+    After :func:`is_already_loaded` returned true this is the digest of the
+    current raw file, so callers can use it without hashing the file again.
+    """
+    record = _load_record(dataset, raw_path)
+    digest = record.get("sha256") if record is not None else None
+    return digest if isinstance(digest, str) else None
+
+
+def are_loaded(
+    datasets: Iterable[DatasetConfig],
+    *,
+    raw_paths: Mapping[str, Path] | None = None,
+) -> dict[str, bool]:
+    """Check several datasets at once and return ``{dataset_id: loaded}``.
+
+    Raw paths default to :func:`kawasaki_etl.core.io.get_raw_path`; pass
+    ``raw_paths`` keyed by dataset id to override them. With the SQLite backend
+    all records are fetched in a handful of queries instead of one file read per
+    dataset. Missing raw files are reported as not loaded.
+    """
+    from kawasaki_etl.core.io import get_raw_path
+
+    targets = [
+        (dataset, (raw_paths or {}).get(dataset.dataset_id) or get_raw_path(dataset))
+        for dataset in datasets
+    ]
+    if _use_sqlite():
+        try:
+            records = _meta_index().get_many(
+                _meta_key(dataset, raw_path) for dataset, raw_path in targets
+            )
+        except sqlite3.Error as exc:
+            msg = "Failed to read metadata records"
+            raise MetaStoreError(msg) from exc
+    else:
+        records = {
+            _meta_key(dataset, raw_path): meta
+            for dataset, raw_path in targets
+            if (meta := _load_meta(get_meta_path(dataset, raw_path))) is not None
+        }
+
+    results: dict[str, bool] = {}
+    for dataset, raw_path in targets:
+        meta = records.get(_meta_key(dataset, raw_path))
+        results[dataset.dataset_id] = (
+            meta is not None
+            and raw_path.exists()
+            and _matches_meta(dataset, raw_path, meta, None)
+        )
+    return results
+
+
+def import_json_meta(meta_dir: Path | None = None) -> int:
+    """Copy JSON meta files under ``meta_dir`` into the SQLite index.
+
+    Intended as a one-time migration before switching ``META_BACKEND`` to
+    ``sqlite``. Existing rows with the same key are overwritten and corrupted
+    files are skipped with a warning. Returns the number of imported records.
+    """
+    source_dir = meta_dir or META_DATA_DIR
+    items: list[tuple[MetaKey, dict[str, Any]]] = []
+    for meta_path in sorted(source_dir.rglob("*.json")):
+        relative = meta_path.relative_to(source_dir)
+        if len(relative.parts) != 3:  # noqa: PLR2004 - <category>/<dataset_id>/<file>
+            continue
+        meta = _load_meta(meta_path)
+        if meta is None:
+            continue
+        category, dataset_id, _ = relative.parts
+        items.append(((category, dataset_id, meta_path.stem), meta))
+
+    try:
+        imported = _meta_index().put_many(items)
+    except sqlite3.Error as exc:
+        msg = f"Failed to import metadata from: {source_dir}"
+        raise MetaStoreError(msg) from exc
+
+    logger.info("Imported JSON metadata", meta_dir=str(source_dir), count=imported)
+    return imported
+
+
+def get_http_validators(dataset: DatasetConfig, raw_path: Path) -> dict[str, str]:
+    """Return the stored ``etag``/``last_modified`` validators for a raw file.
+
+    Missing or corrupted metadata yields an empty mapping.
+    """
+    meta = _load_record(dataset, raw_path)
+    if meta is None:
+        return {}
+    validators = meta.get(HTTP_VALIDATORS_KEY)
+    if not isinstance(validators, dict):
+        return {}
+    return {
+        str(key): str(value)
+        for key, value in cast("dict[str, Any]", validators).items()
+        if value
+    }
+
+
+def save_http_validators(
+    dataset: DatasetConfig,
+    raw_path: Path,
+    *,
+    etag: str | None,
+    last_modified: str | None,
+) -> Path:
+    """Persist HTTP cache validators alongside the dataset's meta record."""
+    meta_path = get_meta_path(dataset, raw_path)
+    record = _load_record(dataset, raw_path) or {}
+    record[HTTP_VALIDATORS_KEY] = {
+        key: value
+        for key, value in (("etag", etag), ("last_modified", last_modified))
+        if value
+    }
+    _save_record(dataset, raw_path, record)
+    logger.debug(
+        "Saved HTTP validators",
+        dataset_id=dataset.dataset_id,
+        meta_path=str(meta_path),
+        etag=etag,
+        last_modified=last_modified,
+    )
+    return meta_path
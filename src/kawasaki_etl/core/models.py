@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import pickle
+import threading
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -7,6 +10,22 @@ from typing import Any, cast
 
 import yaml
 
+from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
+
+NORMALIZED_OUTPUT_FORMATS: tuple[str, ...] = ("csv", "parquet")
+COMPILED_CACHE_ENV = "DATASETS_COMPILED_CACHE"
+COMPILED_CACHE_VERSION = 1
+
+_YAMLLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+logger: LoggerProtocol = get_logger(__name__)
+
+# (mtime_ns, size) of the YAML file a cached result was built from.
+_Signature = tuple[int, int]
+
+_config_cache_lock = threading.Lock()
+_config_cache: dict[Path, tuple[_Signature, dict[str, DatasetConfig]]] = {}
+
 
 class DatasetConfigError(Exception):
     """Raised when dataset configuration loading fails."""
@@ -33,6 +52,7 @@ class DatasetConfig:
     key_fields: list[str] = field(default_factory=_default_key_fields)
     snapshot_date: str | None = None
     extra: dict[str, Any] = field(default_factory=_default_extra)
+    output_format: str = "csv"
 
     @classmethod
     def from_mapping(cls, dataset_id: str, data: Mapping[str, Any]) -> DatasetConfig:
@@ -79,6 +99,14 @@ class DatasetConfig:
             )
             raise DatasetConfigError(msg)
 
+        output_format = str(data.get("output_format") or "csv").lower()
+        if output_format not in NORMALIZED_OUTPUT_FORMATS:
+            msg = (
+                f"Dataset '{dataset_id}' has invalid output_format "
+                f"(must be one of: {', '.join(NORMALIZED_OUTPUT_FORMATS)})"
+            )
+            raise DatasetConfigError(msg)
+
         return cls(
             dataset_id=dataset_id,
             category=str(data["category"]),
@@ -91,6 +119,7 @@ class DatasetConfig:
                 str(snapshot_date_raw) if snapshot_date_raw is not None else None
             ),
             extra=extra,
+            output_format=output_format,
         )
 
 
@@ -114,15 +143,7 @@ def _extract_dataset_entries(raw_data: object | None) -> Mapping[str, Any]:
     return cast("Mapping[str, Any]", dataset_entries)
 
 
-def load_dataset_configs(
-    config_path: str | Path = Path("configs/datasets.yml"),
-) -> dict[str, DatasetConfig]:
-    """Load dataset configurations from a YAML file."""
-    path = Path(config_path)
-    if not path.exists():
-        msg = f"Dataset configuration file not found: {path}"
-        raise DatasetConfigError(msg)
-
+def _parse_dataset_configs(path: Path) -> dict[str, DatasetConfig]:
     try:
         raw_yaml = path.read_text(encoding="utf-8")
     except OSError as exc:  # pragma: no cover - extremely rare filesystem errors
@@ -130,7 +151,7 @@ def load_dataset_configs(
         raise DatasetConfigError(msg) from exc
 
     try:
-        loaded = yaml.safe_load(raw_yaml)
+        loaded = yaml.load(raw_yaml, Loader=_YAMLLoader)  # noqa: S506
     except yaml.YAMLError as exc:
         msg = f"Failed to parse YAML in {path}: {exc}"
         raise DatasetConfigError(msg) from exc
@@ -156,12 +177,131 @@ def load_dataset_configs(
     return configs
 
 
+def compiled_cache_path(config_path: str | Path) -> Path:
+    """Return the compiled cache file stored next to ``config_path``."""
+    path = Path(config_path)
+    return path.with_name(f".{path.name}.pickle")
+
+
+def _compiled_cache_enabled() -> bool:
+    return os.environ.get(COMPILED_CACHE_ENV, "").lower() in {"1", "true", "yes", "on"}
+
+
+def _read_compiled_cache(
+    path: Path,
+    signature: _Signature,
+) -> dict[str, DatasetConfig] | None:
+    cache_path = compiled_cache_path(path)
+    try:
+        with cache_path.open("rb") as handle:
+            payload = pickle.load(handle)  # noqa: S301 - written by this module
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError) as exc:
+        logger.debug(
+            "Ignoring unreadable dataset cache",
+            path=str(cache_path),
+            error=str(exc),
+        )
+        return None
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != COMPILED_CACHE_VERSION
+        or payload.get("signature") != signature
+    ):
+        return None
+    return cast("dict[str, DatasetConfig]", payload["configs"])
+
+
+def _write_compiled_cache(
+    path: Path,
+    signature: _Signature,
+    configs: dict[str, DatasetConfig],
+) -> None:
+    cache_path = compiled_cache_path(path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    payload = {
+        "version": COMPILED_CACHE_VERSION,
+        "signature": signature,
+        "configs": configs,
+    }
+    try:
+        with tmp_path.open("wb") as handle:
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(cache_path)
+    except OSError as exc:
+        tmp_path.unlink(missing_ok=True)
+        logger.debug(
+            "Could not write dataset cache",
+            path=str(cache_path),
+            error=str(exc),
+        )
+
+
+def clear_dataset_config_cache() -> None:
+    """Forget every dataset configuration cached in this process."""
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
+def load_dataset_configs(
+    config_path: str | Path = Path("configs/datasets.yml"),
+    *,
+    compiled_cache: bool | None = None,
+) -> dict[str, DatasetConfig]:
+    """Load dataset configurations from a YAML file.
+
+    Results are cached per file and reused until the file's mtime or size
+    changes. The returned dict is a fresh copy, but the ``DatasetConfig``
+    objects are shared between calls and must not be mutated.
+
+    Args:
+        config_path: Path to ``datasets.yml``.
+        compiled_cache: Also keep a pickled copy next to the YAML so new
+            processes skip YAML parsing. Defaults to the
+            ``DATASETS_COMPILED_CACHE`` environment variable.
+
+    """
+    path = Path(config_path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        msg = f"Dataset configuration file not found: {path}"
+        raise DatasetConfigError(msg) from None
+    except OSError as exc:  # pragma: no cover - extremely rare filesystem errors
+        msg = f"Failed to read dataset configuration: {path}"
+        raise DatasetConfigError(msg) from exc
+
+    key = path.resolve()
+    signature: _Signature = (stat.st_mtime_ns, stat.st_size)
+    with _config_cache_lock:
+        cached = _config_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+
+    use_compiled = (
+        _compiled_cache_enabled() if compiled_cache is None else compiled_cache
+    )
+    configs = _read_compiled_cache(path, signature) if use_compiled else None
+    if configs is None:
+        configs = _parse_dataset_configs(path)
+        if use_compiled:
+            _write_compiled_cache(path, signature, configs)
+
+    with _config_cache_lock:
+        _config_cache[key] = (signature, configs)
+    return dict(configs)
+
+
 def get_dataset_config(
     dataset_id: str,
     config_path: str | Path = Path("configs/datasets.yml"),
+    *,
+    compiled_cache: bool | None = None,
 ) -> DatasetConfig:
     """Get a single dataset configuration by ID."""
-    configs = load_dataset_configs(config_path)
+    configs = load_dataset_configs(config_path, compiled_cache=compiled_cache)
     try:
         return configs[dataset_id]
     except KeyError as exc:
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import codecs
+import io
+import multiprocessing
 import re
-import tempfile
 import unicodedata
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
 import pandas as pd
 
+from kawasaki_etl.core.models import NORMALIZED_OUTPUT_FORMATS
+from kawasaki_etl.core.projection import filter_rows
+from kawasaki_etl.core.schema import apply_schema, frame_memory
 from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
 
 DataFrame = pd.DataFrame
@@ -26,11 +35,39 @@ COMMON_ENCODINGS: tuple[str, ...] = (
     "euc_jp",
 )
 
+PARQUET_COMPRESSION = "zstd"
+
+# Rows per chunk for the streaming normalizer.
+DEFAULT_CHUNKSIZE = 100_000
+
+# Bytes inspected by detect_encoding; large enough to cover header and many rows.
+DETECTION_SAMPLE_SIZE = 1024 * 1024
+
+# A Shift-JIS lead byte in 0x81-0x9F (excluding EUC-JP's SS2/SS3 0x8E/0x8F) never
+# appears in EUC-JP text, so its share among high bytes separates the two.
+_SJIS_ONLY_LEAD_BYTES = bytes(sorted(set(range(0x81, 0xA0)) - {0x8E, 0x8F}))
+_HIGH_BYTES = bytes(range(0x80, 0x100))
+_SJIS_LEAD_RATIO_THRESHOLD = 0.05
+
 logger: LoggerProtocol = get_logger(__name__)
 
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+    from typing import IO
+
+    from kawasaki_etl.core.projection import RowPredicate
+    from kawasaki_etl.core.schema import DatasetSchema
+
+
+@dataclass(frozen=True)
+class CSVNormalizationSummary:
+    """Lightweight result of :func:`normalize_csv_chunked`."""
+
+    dest: Path
+    rows: int
+    columns: tuple[str, ...]
+    dtypes: dict[str, str]
 
 
 def normalize_column_name(name: str) -> str:
@@ -47,29 +84,274 @@ def normalize_column_name(name: str) -> str:
     return re.sub(r"\s+", " ", normalized)
 
 
+def _normalized_column_names(df: pd.DataFrame) -> list[str]:
+    return [
+        normalize_column_name(str(col))
+        for col in cast("list[object]", df.columns.to_list())
+    ]
+
+
 def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Return a copy of the DataFrame with normalized column names."""
     copy = df.copy()
-    normalized_columns: list[str] = [
-        normalize_column_name(str(col))
-        for col in cast("list[object]", copy.columns.to_list())
-    ]
-    copy.columns = normalized_columns
+    copy.columns = _normalized_column_names(copy)
     return copy
 
 
+def normalized_dest(dest: Path, output_format: str = "csv") -> Path:
+    """Return ``dest`` with the file suffix used by ``output_format``.
+
+    Raises:
+        NormalizationError: If ``output_format`` is not supported.
+
+    """
+    if output_format not in NORMALIZED_OUTPUT_FORMATS:
+        msg = (
+            f"未対応の出力形式です: {output_format} "
+            f"(対応形式: {', '.join(NORMALIZED_OUTPUT_FORMATS)})"
+        )
+        raise NormalizationError(msg)
+    return dest.with_suffix(f".{output_format}")
+
+
+def _require_pyarrow() -> None:
+    if find_spec("pyarrow") is None:
+        msg = "Parquet 出力には pyarrow が必要です (pip install .[parquet])"
+        raise NormalizationError(msg)
+
+
+def write_normalized(
+    df: pd.DataFrame,
+    dest: Path,
+    *,
+    output_format: str = "csv",
+) -> Path:
+    """Write ``df`` as UTF-8 CSV or zstd-compressed Parquet and return the path.
+
+    The suffix of ``dest`` is replaced to match ``output_format``. Parquet keeps
+    the frame's dtypes so readers do not have to infer them again.
+    """
+    target = normalized_dest(dest, output_format)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if output_format == "parquet":
+        _require_pyarrow()
+        df.to_parquet(  # pyright: ignore[reportUnknownMemberType]
+            target,
+            engine="pyarrow",
+            compression=PARQUET_COMPRESSION,
+            index=False,
+        )
+    else:
+        df.to_csv(target, index=False, encoding="utf-8")  # pyright: ignore[reportUnknownMemberType]
+    return target
+
+
+def _preferred_normalized_path(path: Path) -> Path:
+    parquet_path = path.with_suffix(".parquet")
+    csv_path = path.with_suffix(".csv")
+    if not parquet_path.exists():
+        return csv_path if csv_path.exists() else path
+    csv_is_newer = (
+        csv_path.exists()
+        and csv_path.stat().st_mtime_ns > parquet_path.stat().st_mtime_ns
+    )
+    return csv_path if csv_is_newer else parquet_path
+
+
+def read_normalized(path: Path) -> pd.DataFrame:
+    """Read a normalized file, preferring a Parquet sibling of ``path``.
+
+    ``path`` may point at either the CSV or the Parquet variant; whichever of
+    the two exists (the newer one when both do) is read.
+    """
+    source = _preferred_normalized_path(path)
+    if source.suffix == ".parquet":
+        _require_pyarrow()
+        return pd.read_parquet(source, engine="pyarrow")  # pyright: ignore[reportUnknownMemberType]
+    return pd.read_csv(source, encoding="utf-8")  # pyright: ignore[reportUnknownMemberType]
+
+
+def iter_normalized_chunks(
+    path: Path,
+    *,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Iterator[pd.DataFrame]:
+    """Yield a normalized file in chunks, preferring its Parquet sibling."""
+    source = _preferred_normalized_path(path)
+    if source.suffix == ".parquet":
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(source)
+        for batch in parquet_file.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+        return
+
+    with pd.read_csv(  # pyright: ignore[reportUnknownMemberType]
+        source,
+        encoding="utf-8",
+        chunksize=chunksize,
+    ) as reader:
+        yield from reader
+
+
+def _decodes(samples: Sequence[tuple[bytes, bool]], encoding: str) -> bool:
+    """Strictly decode each ``(bytes, final)`` sample.
+
+    A non-final sample may end in a truncated character, which is tolerated.
+    """
+    try:
+        for sample, final in samples:
+            decoder = codecs.getincrementaldecoder(encoding)("strict")
+            decoder.decode(sample, final=final)
+    except (UnicodeDecodeError, LookupError):
+        return False
+    return True
+
+
+def _read_samples(path: Path, sample_size: int) -> list[tuple[bytes, bool]]:
+    """Return the head of ``path`` and, for large files, a line-aligned tail."""
+    size = path.stat().st_size
+    with path.open("rb") as file:
+        head = file.read(sample_size)
+        if size <= sample_size:
+            return [(head, True)]
+        file.seek(max(size - sample_size // 4, sample_size))
+        tail = file.read()
+    # 0x0A never occurs inside a UTF-8, cp932 or EUC-JP multi-byte character,
+    # so decoding can safely restart after the first newline.
+    newline = tail.find(b"\n")
+    return [(head, False), (tail[newline + 1 :] if newline >= 0 else b"", True)]
+
+
+def _pick_japanese_encoding(sample: bytes, candidates: Sequence[str]) -> str | None:
+    # bytes.translate deletes in C, so counting stays cheap on a 1 MiB sample.
+    high_bytes = len(sample) - len(sample.translate(None, _HIGH_BYTES))
+    if not high_bytes:
+        return None
+    sjis_leads = len(sample) - len(sample.translate(None, _SJIS_ONLY_LEAD_BYTES))
+    looks_sjis = sjis_leads / high_bytes >= _SJIS_LEAD_RATIO_THRESHOLD
+    order = ("cp932", "shift_jis", "euc_jp") if looks_sjis else ("euc_jp",)
+    return next((enc for enc in order if enc in candidates), None)
+
+
+def detect_encoding(
+    path: Path,
+    *,
+    encodings: Sequence[str] | None = None,
+    sample_size: int | None = None,
+) -> str | None:
+    """Guess the encoding of ``path`` from a bounded byte sample.
+
+    The first ``sample_size`` bytes (default :data:`DETECTION_SAMPLE_SIZE`)
+    and, for larger files, the last quarter of that amount are inspected. A BOM
+    wins outright. Otherwise the sample is strictly decoded as UTF-8, and when
+    that fails cp932 and EUC-JP are told apart by lead-byte statistics.
+    Only encodings in ``encodings`` (default :data:`COMMON_ENCODINGS`) are
+    returned; ``None`` means the sample was inconclusive.
+    """
+    candidates = list(encodings) if encodings else list(COMMON_ENCODINGS)
+    try:
+        samples = _read_samples(path, sample_size or DETECTION_SAMPLE_SIZE)
+    except OSError:
+        return None
+    return _detect_from_samples(samples, candidates)
+
+
+def _detect_from_samples(
+    samples: Sequence[tuple[bytes, bool]],
+    candidates: Sequence[str],
+) -> str | None:
+    """Apply the :func:`detect_encoding` rules to already read samples."""
+    if samples[0][0].startswith(codecs.BOM_UTF8):
+        return "utf-8-sig" if "utf-8-sig" in candidates else None
+    if "utf-8" in candidates and _decodes(samples, "utf-8"):
+        return "utf-8"
+
+    decodable = [
+        encoding
+        for encoding in ("cp932", "shift_jis", "euc_jp")
+        if encoding in candidates and _decodes(samples, encoding)
+    ]
+    if len(decodable) <= 1:
+        return decodable[0] if decodable else None
+    picked = _pick_japanese_encoding(b"".join(data for data, _ in samples), decodable)
+    return picked or decodable[0]
+
+
+def _codec_family(encoding: str, *, bom: bool) -> str | None:
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return None
+    # Without a BOM utf-8-sig decodes exactly like utf-8.
+    return "utf-8" if name == "utf-8-sig" and not bom else name
+
+
+def _fallback_encodings(tried: Sequence[str], detected: str | None) -> list[str]:
+    """Return the candidates that can still succeed after ``detected`` failed.
+
+    Aliases of the detected codec would fail on the same bytes, so they are
+    skipped. Detection only returns utf-8-sig for a file starting with a BOM.
+    """
+    if detected is None:
+        return list(tried)
+    bom = _codec_family(detected, bom=True) == "utf-8-sig"
+    failed = _codec_family(detected, bom=bom)
+    return [
+        encoding for encoding in tried if _codec_family(encoding, bom=bom) != failed
+    ]
+
+
+def _read_csv_with_encoding(
+    path: Path | IO[bytes],
+    encoding: str,
+    *,
+    row_filter: Sequence[RowPredicate] | None = None,
+    **kwargs: Any,
+) -> DataFrame:
+    if not row_filter:
+        return pd.read_csv(  # pyright: ignore[reportUnknownMemberType]
+            path,
+            encoding=encoding,
+            iterator=False,
+            chunksize=None,
+            **kwargs,
+        )
+    # Filter chunk by chunk so rejected rows are dropped as soon as they are read.
+    with pd.read_csv(  # pyright: ignore[reportUnknownMemberType]
+        path,
+        encoding=encoding,
+        chunksize=DEFAULT_CHUNKSIZE,
+        **kwargs,
+    ) as reader:
+        frames = [filter_rows(chunk, row_filter) for chunk in reader]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
 def detect_encoding_and_read_csv(
     path: Path,
     *,
     encodings: Sequence[str] | None = None,
+    row_filter: Sequence[RowPredicate] | None = None,
     **kwargs: Any,
 ) -> pd.DataFrame:
-    """Read a CSV file by trying multiple encodings.
+    """Read a CSV file, detecting its encoding from a byte sample first.
+
+    The file is parsed once with the encoding chosen by
+    :func:`detect_encoding`. If detection is inconclusive or the chosen
+    encoding fails past the sampled bytes, the remaining candidates are tried
+    in order.
 
     Args:
         path: Path to the CSV file.
         encodings: Optional custom encoding candidates.
-        **kwargs: Additional arguments forwarded to ``pandas.read_csv``.
+        row_filter: Predicates every kept row must match. The file is then
+            read in chunks and each chunk is filtered before the next is read.
+        **kwargs: Additional arguments forwarded to ``pandas.read_csv``, e.g.
+            ``usecols`` to parse only some columns.
 
     Returns:
         Loaded DataFrame.
@@ -78,20 +360,36 @@ def detect_encoding_and_read_csv(
         NormalizationError: If decoding fails for all encodings.
 
     """
+    if "iterator" in kwargs or "chunksize" in kwargs:
+        msg = "iterator/chunksize options are not supported for normalization"
+        raise NormalizationError(msg)
+
     tried = list(encodings) if encodings else list(COMMON_ENCODINGS)
     last_error: Exception | None = None
 
-    for encoding in tried:
+    detected = detect_encoding(path, encodings=tried)
+    if detected is not None:
         try:
-            if "iterator" in kwargs or "chunksize" in kwargs:
-                msg = "iterator/chunksize options are not supported for normalization"
-                raise NormalizationError(msg)
+            return _read_csv_with_encoding(
+                path,
+                detected,
+                row_filter=row_filter,
+                **kwargs,
+            )
+        except UnicodeDecodeError as exc:
+            last_error = exc
+            logger.debug(
+                "Detected encoding failed; falling back to candidates",
+                path=str(path),
+                encoding=detected,
+            )
 
-            data: DataFrame = pd.read_csv(  # pyright: ignore[reportUnknownMemberType]
+    for encoding in _fallback_encodings(tried, detected):
+        try:
+            data = _read_csv_with_encoding(
                 path,
-                encoding=encoding,
-                iterator=False,
-                chunksize=None,
+                encoding,
+                row_filter=row_filter,
                 **kwargs,
             )
         except UnicodeDecodeError as exc:
@@ -112,17 +410,247 @@ def detect_encoding_and_read_csv(
     raise NormalizationError(msg) from last_error
 
 
-def normalize_csv(path: Path, dest: Path) -> pd.DataFrame:
-    """Normalize a CSV file to UTF-8 with cleaned column names."""
-    df = detect_encoding_and_read_csv(path)
-    df = normalize_columns(df)
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(dest, index=False, encoding="utf-8")  # pyright: ignore[reportUnknownMemberType]
+def read_csv_header(
+    path: Path,
+    *,
+    encodings: Sequence[str] | None = None,
+) -> list[str]:
+    """Return the column names of ``path`` without reading its rows."""
+    header = detect_encoding_and_read_csv(path, encodings=encodings, nrows=0)
+    return [str(column) for column in cast("list[object]", header.columns.to_list())]
+
+
+def _scan_encoding(path: Path, candidates: Sequence[str]) -> str | None:
+    """Return the first candidate that decodes the whole file, block by block."""
+    for encoding in candidates:
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)("strict")
+            with path.open("rb") as file:
+                for block in iter(lambda: file.read(DETECTION_SAMPLE_SIZE), b""):
+                    decoder.decode(block)
+            decoder.decode(b"", final=True)
+        except (UnicodeDecodeError, LookupError):
+            continue
+        return encoding
+    return None
+
+
+def iter_csv_chunks(
+    path: Path,
+    *,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    encodings: Sequence[str] | None = None,
+    **kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """Yield ``path`` as DataFrames of at most ``chunksize`` rows.
+
+    The encoding is chosen once with :func:`detect_encoding`; when the sample is
+    inconclusive the candidates are checked by decoding the file in blocks, so
+    memory stays bounded either way.
+
+    Raises:
+        NormalizationError: If no candidate encoding can decode the file.
+
+    """
+    tried = list(encodings) if encodings else list(COMMON_ENCODINGS)
+    encoding = detect_encoding(path, encodings=tried) or _scan_encoding(path, tried)
+    if encoding is None:
+        msg = (
+            "CSV の読み込みに失敗しました: "
+            f"{path} (試したエンコーディング: {', '.join(tried)})"
+        )
+        raise NormalizationError(msg)
+
+    try:
+        with pd.read_csv(  # pyright: ignore[reportUnknownMemberType]
+            path,
+            encoding=encoding,
+            chunksize=chunksize,
+            **kwargs,
+        ) as reader:
+            yield from reader
+    except UnicodeDecodeError as exc:
+        msg = f"CSV の読み込み中にデコードに失敗しました: {path} ({encoding})"
+        raise NormalizationError(msg) from exc
+
+
+def _merge_dtype(current: np.dtype[Any] | None, new: np.dtype[Any]) -> np.dtype[Any]:
+    # Categorical dtypes of different chunks differ only by their categories.
+    if current is None or current == new or str(current) == str(new):
+        return new
+    if current.kind in "biuf" and new.kind in "biuf":
+        return np.promote_types(current, new)
+    return np.dtype(object)
+
+
+def _write_csv_chunks(chunks: Iterable[pd.DataFrame], output: Path) -> None:
+    with output.open("w", encoding="utf-8", newline="") as handle:
+        for index, chunk in enumerate(chunks):
+            chunk.to_csv(handle, index=False, header=index == 0)  # pyright: ignore[reportUnknownMemberType]
+
+
+def _write_parquet_chunks(chunks: Iterable[pd.DataFrame], output: Path) -> None:
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer: pq.ParquetWriter | None = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                # Dictionary indices are sized to the categories of a chunk, so
+                # widen them to fit the categories of the later chunks too.
+                widened = pa.schema(
+                    [
+                        column.with_type(
+                            pa.dictionary(pa.int32(), column.type.value_type),
+                        )
+                        if pa.types.is_dictionary(column.type)
+                        else column
+                        for column in table.schema
+                    ],
+                    metadata=table.schema.metadata,
+                )
+                table = table.cast(widened)
+                writer = pq.ParquetWriter(
+                    output,
+                    widened,
+                    compression=PARQUET_COMPRESSION,
+                )
+            elif not table.schema.equals(writer.schema, check_metadata=False):
+                try:
+                    table = table.cast(writer.schema)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as exc:
+                    msg = (
+                        "チャンク間で列の型が一致しないため Parquet に書き出せません: "
+                        f"{output.name} ({exc})"
+                    )
+                    raise NormalizationError(msg) from exc
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def normalize_csv_chunked(
+    path: Path,
+    dest: Path,
+    *,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    output_format: str = "csv",
+    usecols: Sequence[str] | None = None,
+    row_filter: Sequence[RowPredicate] | None = None,
+    schema: DatasetSchema | None = None,
+) -> CSVNormalizationSummary:
+    """Stream ``path`` to a normalized file at ``dest`` in bounded chunks.
+
+    Column names are normalized once from the header and every chunk is
+    appended to a temporary file that replaces ``dest`` on success, so peak
+    memory is one chunk regardless of the file size. Dtypes in the summary are
+    merged across chunks (numeric types are promoted, anything else mixed
+    becomes ``object``). With ``output_format="parquet"`` the schema of the
+    first chunk is kept and later chunks are cast to it. ``usecols`` (source
+    header names) limits the parsed columns and ``row_filter`` drops rows from
+    each chunk before it is written; ``rows`` counts the kept rows. ``schema``
+    (normalized column names) is applied to every chunk, and the completed log
+    entry reports the summed chunk memory before and after typing.
+    """
+    target = normalized_dest(dest, output_format)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    part_path = target.with_name(f"{target.name}.part")
+    rows = 0
+    memory_before = 0
+    memory_after = 0
+    columns: list[str] = []
+    dtypes: dict[str, np.dtype[Any]] = {}
+
+    def _normalized_chunks() -> Iterator[pd.DataFrame]:
+        nonlocal rows, memory_before, memory_after, columns
+        read_kwargs: dict[str, Any] = {"usecols": list(usecols)} if usecols else {}
+        chunks = iter_csv_chunks(path, chunksize=chunksize, **read_kwargs)
+        for index, raw_chunk in enumerate(chunks):
+            chunk = filter_rows(raw_chunk, row_filter)
+            if index == 0:
+                columns = _normalized_column_names(chunk)
+            chunk.columns = columns
+            if schema is not None:
+                memory_before += frame_memory(chunk)
+                apply_schema(chunk, schema)
+                memory_after += frame_memory(chunk)
+            rows += len(chunk)
+            for name, dtype in chunk.dtypes.items():
+                dtypes[str(name)] = _merge_dtype(dtypes.get(str(name)), dtype)
+            yield chunk
+
+    writer = _write_parquet_chunks if output_format == "parquet" else _write_csv_chunks
+    try:
+        writer(_normalized_chunks(), part_path)
+        part_path.replace(target)
+    finally:
+        part_path.unlink(missing_ok=True)
+
+    memory: dict[str, Any] = (
+        {"memory_before": memory_before, "memory_after": memory_after}
+        if schema is not None
+        else {}
+    )
+    logger.info(
+        "Normalized CSV written in chunks",
+        source=str(path),
+        dest=str(target),
+        rows=rows,
+        chunksize=chunksize,
+        output_format=output_format,
+        **memory,
+    )
+    return CSVNormalizationSummary(
+        dest=target,
+        rows=rows,
+        columns=tuple(columns),
+        dtypes={name: str(dtype) for name, dtype in dtypes.items()},
+    )
+
+
+def normalize_csv(
+    path: Path,
+    dest: Path,
+    *,
+    output_format: str = "csv",
+    dtype: Mapping[str, str] | None = None,
+    usecols: Sequence[str] | None = None,
+    row_filter: Sequence[RowPredicate] | None = None,
+    schema: DatasetSchema | None = None,
+) -> pd.DataFrame:
+    """Normalize a CSV file to UTF-8 CSV or Parquet with cleaned column names.
+
+    The whole file is held in memory; use :func:`normalize_csv_chunked` for
+    files that may not fit. ``dtype`` and ``usecols`` are passed to
+    ``pandas.read_csv`` and use the source header names, as do the columns of
+    ``row_filter``. ``schema`` uses the normalized column names; the frame is
+    typed before it is written and the completed log entry reports its memory
+    before and after typing.
+    """
+    read_kwargs: dict[str, Any] = {}
+    if dtype:
+        read_kwargs["dtype"] = dict(dtype)
+    if usecols:
+        read_kwargs["usecols"] = list(usecols)
+    df = detect_encoding_and_read_csv(path, row_filter=row_filter, **read_kwargs)
+    # The frame was just read, so rename in place instead of copying it.
+    df.columns = _normalized_column_names(df)
+    memory: dict[str, Any] = {}
+    if schema is not None:
+        memory["memory_before"] = frame_memory(df)
+        apply_schema(df, schema)
+        memory["memory_after"] = frame_memory(df)
+    target = write_normalized(df, dest, output_format=output_format)
     logger.info(
         "Normalized CSV written",
         source=str(path),
-        dest=str(dest),
+        dest=str(target),
         rows=len(df),
+        **memory,
     )
     return df
 
@@ -131,77 +659,289 @@ def _sanitize_sheet_name(name: str) -> str:
     return re.sub(r"[^A-Za-z0-9_-]+", "_", name)
 
 
-def normalize_excel(path: Path, dest_dir: Path) -> dict[str, Path]:
-    """Normalize all sheets in an Excel workbook to UTF-8 CSV files."""
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    sheets: dict[str, DataFrame] = pd.read_excel(  # pyright: ignore[reportUnknownMemberType]
-        path,
-        sheet_name=None,
+def _pool_size(max_workers: int | None, items: int) -> int | None:
+    """Return the process count for ``items`` tasks, or ``None`` to run serially."""
+    if max_workers is not None and max_workers < 1:
+        msg = f"max_workers must be a positive integer: {max_workers}"
+        raise NormalizationError(msg)
+    if max_workers is None or max_workers == 1 or items <= 1:
+        return None
+    return min(max_workers, items)
+
+
+def _map_in_processes(
+    func: Callable[[Any], Path],
+    tasks: Sequence[Any],
+    workers: int,
+) -> list[Path]:
+    """Run ``func`` over ``tasks`` in a process pool, keeping input order."""
+    # Callers may already run threads (e.g. the run-all scheduler); spawn avoids
+    # forking them.
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        return list(executor.map(func, tasks))
+
+
+def _normalize_excel_sheet(
+    workbook: pd.ExcelFile,
+    path: Path,
+    sheet_name: str | int,
+    dest: Path,
+    output_format: str,
+    *,
+    usecols: frozenset[str] | None = None,
+    row_filter: Sequence[RowPredicate] | None = None,
+) -> Path:
+    # A membership test lets sheets that lack some of the columns still load.
+    df = workbook.parse(  # pyright: ignore[reportUnknownMemberType]
+        sheet_name,
+        usecols=usecols.__contains__ if usecols else None,
     )
-    output_paths: dict[str, Path] = {}
-
-    for sheet_name, df in sheets.items():
-        normalized_df = normalize_columns(df)
-        safe_sheet = _sanitize_sheet_name(str(sheet_name)) or "sheet"
-        dest = dest_dir / f"{path.stem}_{safe_sheet}.csv"
-        normalized_df.to_csv(  # pyright: ignore[reportUnknownMemberType]
+    df = filter_rows(df, row_filter)
+    df.columns = _normalized_column_names(df)
+    target = write_normalized(df, dest, output_format=output_format)
+    logger.info(
+        "Normalized Excel sheet",
+        sheet=str(sheet_name),
+        source=str(path),
+        dest=str(target),
+    )
+    return target
+
+
+_ExcelSheetTask = tuple[
+    Path,
+    str | int,
+    Path,
+    str,
+    "frozenset[str] | None",
+    "Sequence[RowPredicate] | None",
+]
+
+
+def _normalize_excel_sheet_task(task: _ExcelSheetTask) -> Path:
+    path, sheet_name, dest, output_format, usecols, row_filter = task
+    with pd.ExcelFile(path) as workbook:
+        return _normalize_excel_sheet(
+            workbook,
+            path,
+            sheet_name,
             dest,
-            index=False,
-            encoding="utf-8",
+            output_format,
+            usecols=usecols,
+            row_filter=row_filter,
         )
-        output_paths[str(sheet_name)] = dest
-        logger.info(
-            "Normalized Excel sheet",
-            sheet=str(sheet_name),
-            source=str(path),
-            dest=str(dest),
+
+
+def normalize_excel(
+    path: Path,
+    dest_dir: Path,
+    *,
+    output_format: str = "csv",
+    max_workers: int | None = None,
+    usecols: Sequence[str] | None = None,
+    row_filter: Sequence[RowPredicate] | None = None,
+) -> dict[str, Path]:
+    """Normalize all sheets in an Excel workbook to UTF-8 CSV or Parquet files.
+
+    With ``max_workers`` greater than 1, sheets are read and written in a
+    process pool; the returned mapping keeps the workbook's sheet order.
+    ``usecols`` (header names) limits the columns parsed from each sheet and
+    ``row_filter`` drops rows before they are normalized.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    columns = frozenset(usecols) if usecols else None
+    predicates = tuple(row_filter) if row_filter else None
+    with pd.ExcelFile(path) as workbook:
+        sheet_names: list[str | int] = list(workbook.sheet_names)
+        used_names: set[Path] = set()
+        tasks: list[_ExcelSheetTask] = []
+        for sheet_name in sheet_names:
+            safe_sheet = _sanitize_sheet_name(str(sheet_name)) or "sheet"
+            # Distinct sheet names can sanitize to the same string; name every
+            # output here so that worker processes never share a destination.
+            dest = dest_dir / f"{path.stem}_{safe_sheet}.csv"
+            counter = 1
+            while dest in used_names:
+                dest = dest_dir / f"{path.stem}_{safe_sheet}_{counter}.csv"
+                counter += 1
+            used_names.add(dest)
+            tasks.append((path, sheet_name, dest, output_format, columns, predicates))
+
+        workers = _pool_size(max_workers, len(tasks))
+        if workers is None:
+            outputs = [
+                _normalize_excel_sheet(
+                    workbook,
+                    path,
+                    sheet_name,
+                    dest,
+                    output_format,
+                    usecols=columns,
+                    row_filter=predicates,
+                )
+                for _, sheet_name, dest, *_ in tasks
+            ]
+    if workers is not None:
+        outputs = _map_in_processes(_normalize_excel_sheet_task, tasks, workers)
+
+    return {
+        str(sheet_name): dest
+        for sheet_name, dest in zip(sheet_names, outputs, strict=True)
+    }
+
+
+class _PrefixedReader(io.RawIOBase):
+    """Replay already read ``prefix`` bytes, then continue from ``stream``."""
+
+    def __init__(self, prefix: bytes, stream: IO[bytes]) -> None:
+        super().__init__()
+        self._prefix = memoryview(prefix)
+        self._offset = 0
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        remaining = len(self._prefix) - self._offset
+        if remaining > 0:
+            size = min(remaining, len(view))
+            view[:size] = self._prefix[self._offset : self._offset + size]
+            self._offset += size
+            return size
+        return self._stream.readinto(view)  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def _read_zip_member_csv(
+    archive: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    *,
+    encodings: Sequence[str] | None = None,
+) -> DataFrame:
+    """Parse a CSV member straight from the archive.
+
+    The encoding is detected from the first :data:`DETECTION_SAMPLE_SIZE`
+    bytes, which are then replayed ahead of the rest of the stream, so the
+    member is decompressed once. The member is only reopened when the detected
+    encoding fails past the sample and other candidates must be tried.
+    """
+    tried = list(encodings) if encodings else list(COMMON_ENCODINGS)
+    last_error: Exception | None = None
+
+    with archive.open(info) as source:
+        head = source.read(DETECTION_SAMPLE_SIZE)
+        detected = _detect_from_samples(
+            [(head, len(head) >= info.file_size)],
+            tried,
         )
+        if detected is not None:
+            try:
+                return _read_csv_with_encoding(
+                    io.BufferedReader(_PrefixedReader(head, source)),
+                    detected,
+                )
+            except UnicodeDecodeError as exc:
+                last_error = exc
+                logger.debug(
+                    "Detected encoding failed; falling back to candidates",
+                    member=info.filename,
+                    encoding=detected,
+                )
+
+    for encoding in _fallback_encodings(tried, detected):
+        try:
+            with archive.open(info) as source:
+                return _read_csv_with_encoding(source, encoding)
+        except UnicodeDecodeError as exc:
+            last_error = exc
+            logger.debug(
+                "Failed to decode CSV with encoding",
+                member=info.filename,
+                encoding=encoding,
+            )
+
+    msg = (
+        "CSV の読み込みに失敗しました: "
+        f"{info.filename} (試したエンコーディング: {', '.join(tried)})"
+    )
+    raise NormalizationError(msg) from last_error
+
+
+def _normalize_zip_member(
+    archive: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    dest: Path,
+    output_format: str,
+) -> Path:
+    df = _read_zip_member_csv(archive, info)
+    # The frame was just read, so rename in place instead of copying it.
+    df.columns = _normalized_column_names(df)
+    write_normalized(df, dest, output_format=output_format)
+    logger.info(
+        "Normalized CSV from ZIP",
+        source=str(archive.filename),
+        member=info.filename,
+        dest=str(dest),
+    )
+    return dest
 
-    return output_paths
+
+def _normalize_zip_member_task(task: tuple[Path, str, Path, str]) -> Path:
+    zip_path, member, dest, output_format = task
+    with zipfile.ZipFile(zip_path) as archive:
+        return _normalize_zip_member(
+            archive,
+            archive.getinfo(member),
+            dest,
+            output_format,
+        )
 
 
-def normalize_zip_of_csv(zip_path: Path, dest_dir: Path) -> list[Path]:
-    """Normalize all CSV files contained in a ZIP archive."""
+def normalize_zip_of_csv(
+    zip_path: Path,
+    dest_dir: Path,
+    *,
+    output_format: str = "csv",
+    max_workers: int | None = None,
+) -> list[Path]:
+    """Normalize all CSV files contained in a ZIP archive.
+
+    Members are parsed directly from the archive without being extracted.
+    Output names are assigned up front in archive order, so the names and the
+    order of the returned paths are the same whether members are processed
+    serially or, with ``max_workers`` greater than 1, in a process pool.
+    """
     dest_dir.mkdir(parents=True, exist_ok=True)
-    output_paths: list[Path] = []
+    suffix = normalized_dest(Path("member.csv"), output_format).suffix
     used_names: set[Path] = set()
+    members: list[tuple[zipfile.ZipInfo, Path]] = []
 
-    with zipfile.ZipFile(zip_path) as archive, tempfile.TemporaryDirectory() as tmpdir:
+    with zipfile.ZipFile(zip_path) as archive:
         for info in archive.infolist():
             if info.is_dir():
                 continue
             if not info.filename.lower().endswith(".csv"):
                 continue
 
-            member_path = Path(info.filename)
-            member_name = member_path.name
-            raw_tmp = Path(tmpdir) / member_name
-            with archive.open(info) as source, raw_tmp.open("wb") as tmp_file:
-                tmp_file.write(source.read())
-
-            df = detect_encoding_and_read_csv(raw_tmp)
-            df = normalize_columns(df)
-
-            member_stem = member_path.stem
-            base_dest = dest_dir / f"{zip_path.stem}_{member_stem}.csv"
-            dest = base_dest
+            member_stem = Path(info.filename).stem
+            dest = dest_dir / f"{zip_path.stem}_{member_stem}{suffix}"
             counter = 1
             while dest in used_names or dest.exists():
-                dest = dest_dir / f"{zip_path.stem}_{member_stem}_{counter}.csv"
+                dest = dest_dir / f"{zip_path.stem}_{member_stem}_{counter}{suffix}"
                 counter += 1
-
-            df.to_csv(  # pyright: ignore[reportUnknownMemberType]
-                dest,
-                index=False,
-                encoding="utf-8",
-            )
             used_names.add(dest)
-            output_paths.append(dest)
-            logger.info(
-                "Normalized CSV from ZIP",
-                source=str(zip_path),
-                member=info.filename,
-                dest=str(dest),
-            )
+            members.append((info, dest))
+
+        workers = _pool_size(max_workers, len(members))
+        if workers is None:
+            return [
+                _normalize_zip_member(archive, info, dest, output_format)
+                for info, dest in members
+            ]
 
-    return output_paths
+    tasks = [(zip_path, info.filename, dest, output_format) for info, dest in members]
+    return _map_in_processes(_normalize_zip_member_task, tasks, workers)
@@ -0,0 +1,226 @@
+"""Column projection and row predicates pushed down into file readers.
+
+Datasets declare the logical columns they need in ``extra.columns`` and an
+optional ``extra.row_filter`` made of ``"<column> <op> <value>"`` conditions
+that must all hold, for example::
+
+    extra:
+      columns: [date, spot_id, connection_count]
+      row_filter: "date >= 2024-01-01"
+
+Pipelines translate the logical names to the source header and pass them to
+the normalizers as ``usecols`` and ``row_filter``, so unused columns are never
+parsed and filtered rows never leave the chunk they were read in.
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, cast
+
+import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from kawasaki_etl.core.models import DatasetConfig
+
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+_CONDITION = re.compile(
+    r"^\s*(?P<column>.+?)\s*(?P<op>==|!=|>=|<=|=|>|<)\s*(?P<value>.+?)\s*$",
+)
+
+
+class ProjectionError(Exception):
+    """Raised when declared columns or row filters are invalid."""
+
+
+def _as_number(value: str) -> float | None:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class RowPredicate:
+    """A single ``column op value`` condition.
+
+    The comparison follows the column's dtype: numeric and datetime columns
+    compare ``value`` as a number or a timestamp. Text columns, as read from
+    CSV, are compared numerically when ``value`` is a number and the column
+    holds numbers, as timestamps when ``value`` is a date and the column holds
+    dates, and as text otherwise. Rows whose value cannot be converted never
+    match.
+    """
+
+    column: str
+    op: str
+    value: str
+
+    @classmethod
+    def parse(cls, condition: str) -> RowPredicate:
+        """Parse ``"<column> <op> <value>"``."""
+        match = _CONDITION.match(condition)
+        if match is None:
+            msg = f"Invalid row filter condition: {condition!r}"
+            raise ProjectionError(msg)
+        value = match.group("value").strip("'\"")
+        return cls(column=match.group("column"), op=match.group("op"), value=value)
+
+    def mask(self, series: pd.Series) -> pd.Series:
+        """Return a boolean mask of the rows of ``series`` that match.
+
+        Raises:
+            ProjectionError: If ``value`` cannot be compared with a numeric or
+                datetime column.
+
+        """
+        left, right = self._operands(series)
+        result = cast("pd.Series", _OPERATORS[self.op](left, right))
+        return result.fillna(value=False).astype(bool)  # pyright: ignore[reportUnknownMemberType]
+
+    def _operands(self, series: pd.Series) -> tuple[Any, Any]:
+        condition = f"{self.column} {self.op} {self.value}"
+        if is_datetime64_any_dtype(series):
+            timestamp = pd.to_datetime(self.value, errors="coerce")  # pyright: ignore[reportUnknownMemberType]
+            if pd.isna(timestamp):
+                msg = f"Row filter needs a date for a date column: {condition!r}"
+                raise ProjectionError(msg)
+            return series, timestamp
+        if is_numeric_dtype(series) and not is_bool_dtype(series):
+            number = _as_number(self.value)
+            if number is None:
+                msg = f"Row filter needs a number for a numeric column: {condition!r}"
+                raise ProjectionError(msg)
+            return series, number
+
+        values = (
+            series.astype(object)  # pyright: ignore[reportUnknownMemberType]
+            if isinstance(series.dtype, pd.CategoricalDtype)
+            else series
+        )
+        present = values.notna()
+        # A reading that turns every present value into NaN would silently
+        # drop every row, so fall through to the next one instead.
+        number = _as_number(self.value)
+        if number is not None:
+            numeric = pd.to_numeric(values, errors="coerce")  # pyright: ignore[reportUnknownMemberType]
+            if not present.any() or numeric[present].notna().any():
+                return numeric, number
+        timestamp = pd.to_datetime(self.value, errors="coerce")  # pyright: ignore[reportUnknownMemberType]
+        if pd.notna(timestamp):
+            parsed = pd.to_datetime(values, errors="coerce")  # pyright: ignore[reportUnknownMemberType]
+            if not present.any() or parsed[present].notna().any():
+                return parsed, timestamp
+        return values.astype("string"), self.value  # pyright: ignore[reportUnknownMemberType]
+
+
+@dataclass(frozen=True)
+class ReadProjection:
+    """Columns and row predicates a dataset needs, in logical names."""
+
+    columns: tuple[str, ...] | None = None
+    predicates: tuple[RowPredicate, ...] = ()
+
+    def renamed(self, source_names: Mapping[str, str]) -> ReadProjection:
+        """Return the projection with logical names replaced by source names.
+
+        Raises:
+            ProjectionError: If a predicate uses a column that is not mapped.
+
+        """
+        missing = sorted(
+            {pred.column for pred in self.predicates} - set(source_names),
+        )
+        if missing:
+            msg = f"Row filter uses undeclared columns: {', '.join(missing)}"
+            raise ProjectionError(msg)
+        columns = (
+            tuple(source_names.get(name, name) for name in self.columns)
+            if self.columns is not None
+            else None
+        )
+        predicates = tuple(
+            replace(pred, column=source_names[pred.column]) for pred in self.predicates
+        )
+        return ReadProjection(columns=columns, predicates=predicates)
+
+
+def filter_rows(
+    df: pd.DataFrame,
+    predicates: Sequence[RowPredicate] | None,
+) -> pd.DataFrame:
+    """Return the rows of ``df`` matching every predicate.
+
+    Raises:
+        ProjectionError: If a predicate column is missing from ``df``.
+
+    """
+    if not predicates or df.empty:
+        return df
+    mask = pd.Series(data=True, index=df.index)
+    for predicate in predicates:
+        if predicate.column not in df.columns:
+            msg = f"Row filter column not found: {predicate.column}"
+            raise ProjectionError(msg)
+        mask &= predicate.mask(cast("pd.Series", df[predicate.column]))
+    # The selection already owns its data; drop pandas' link to ``df`` so that
+    # callers can assign columns without a SettingWithCopyWarning.
+    return df.loc[mask].copy(deep=False)
+
+
+def _string_list(value: object, field_name: str) -> list[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [str(item) for item in cast("list[object]", value)]
+    msg = f"extra.{field_name} must be a string or a list of strings"
+    raise ProjectionError(msg)
+
+
+def get_projection(
+    config: DatasetConfig,
+    default_columns: Sequence[str] | None = None,
+) -> ReadProjection:
+    """Build the projection declared in ``config.extra``.
+
+    ``default_columns`` is used when the dataset does not list its columns.
+    """
+    raw_columns = config.extra.get("columns")
+    columns = (
+        _string_list(raw_columns, "columns")
+        if raw_columns is not None
+        else default_columns
+    )
+    raw_filter = config.extra.get("row_filter")
+    conditions = _string_list(raw_filter, "row_filter") if raw_filter else []
+    predicates = tuple(RowPredicate.parse(item) for item in conditions)
+    return ReadProjection(
+        columns=tuple(columns) if columns is not None else None,
+        predicates=predicates,
+    )
+
+
+__all__ = [
+    "ProjectionError",
+    "ReadProjection",
+    "RowPredicate",
+    "filter_rows",
+    "get_projection",
+]
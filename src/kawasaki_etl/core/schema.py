@@ -0,0 +1,257 @@
+"""Per-dataset dtype schemas for normalized frames.
+
+A schema maps logical column names to one of :data:`SCHEMA_TYPES`. Pipelines
+look it up with :func:`get_schema`, which prefers an inline ``extra.schema``
+mapping (or the name of a registered schema) from ``datasets.yml`` and falls
+back to the schema registered for the dataset's parser.
+
+Free-text label columns can be typed while the CSV is read (see
+:meth:`DatasetSchema.read_dtypes`); numbers and dates need coercion of blank
+or malformed values, so :func:`apply_schema` converts them after reading.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, cast
+
+import pandas as pd
+
+from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from kawasaki_etl.core.models import DatasetConfig
+
+# Logical type -> pandas dtype. pandas has no day-resolution datetime64, so
+# dates use second resolution normalized to midnight.
+SCHEMA_TYPES: dict[str, str] = {
+    "category": "category",
+    "string": "string",
+    "int32": "Int32",
+    "int64": "Int64",
+    "float32": "Float32",
+    "float64": "Float64",
+    "boolean": "boolean",
+    "date": "datetime64[s]",
+}
+_READ_TIME_TYPES = frozenset({"category", "string"})
+_NUMERIC_TYPES = frozenset({"int32", "int64", "float32", "float64"})
+
+logger: LoggerProtocol = get_logger(__name__)
+
+
+class SchemaError(Exception):
+    """Raised when a schema is invalid or cannot be applied."""
+
+
+def _default_columns() -> dict[str, str]:
+    return {}
+
+
+@dataclass(frozen=True)
+class DatasetSchema:
+    """Logical column name to schema type mapping.
+
+    A ``strict`` schema raises :class:`SchemaError` when a column cannot be
+    converted; otherwise the column keeps its dtype and a warning is logged.
+    """
+
+    columns: dict[str, str] = field(default_factory=_default_columns)
+    strict: bool = True
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> DatasetSchema:
+        """Build a schema from a ``datasets.yml`` mapping, validating types."""
+        columns = {str(name): str(kind).lower() for name, kind in data.items()}
+        unknown = sorted(
+            f"{name}={kind}"
+            for name, kind in columns.items()
+            if kind not in SCHEMA_TYPES
+        )
+        if unknown:
+            msg = (
+                f"Unknown schema types: {', '.join(unknown)} "
+                f"(supported: {', '.join(SCHEMA_TYPES)})"
+            )
+            raise SchemaError(msg)
+        return cls(columns=columns)
+
+    def read_dtypes(
+        self,
+        source_names: Mapping[str, Iterable[str]] | None = None,
+        *,
+        exclude: Iterable[str] = (),
+    ) -> dict[str, str]:
+        """Return a ``dtype=`` mapping for the label columns of this schema.
+
+        Args:
+            source_names: Candidate header names per logical column, for files
+                whose header still uses the source names. Unknown names are
+                ignored by ``pandas.read_csv``.
+            exclude: Logical columns to leave untyped, e.g. key columns whose
+                values are post-processed before typing.
+
+        """
+        skipped = set(exclude)
+        dtypes: dict[str, str] = {}
+        for name, kind in self.columns.items():
+            if kind not in _READ_TIME_TYPES or name in skipped:
+                continue
+            names = source_names.get(name, (name,)) if source_names else (name,)
+            for source in names:
+                dtypes[str(source)] = SCHEMA_TYPES[kind]
+        return dtypes
+
+    def renamed(
+        self,
+        names: Mapping[str, str],
+        *,
+        exclude: Iterable[str] = (),
+    ) -> DatasetSchema:
+        """Return the schema for the columns in ``names``, keyed by their new names.
+
+        Columns missing from ``names`` or listed in ``exclude`` are dropped.
+        """
+        skipped = set(exclude)
+        return DatasetSchema(
+            columns={
+                names[name]: kind
+                for name, kind in self.columns.items()
+                if name in names and name not in skipped
+            },
+            strict=self.strict,
+        )
+
+    def date_columns(self) -> list[str]:
+        """Return the logical columns typed as ``date``."""
+        return [name for name, kind in self.columns.items() if kind == "date"]
+
+
+def _convert(series: pd.Series, kind: str) -> pd.Series:
+    if kind == "date":
+        parsed = pd.to_datetime(series, errors="coerce")  # pyright: ignore[reportUnknownMemberType]
+        return parsed.dt.normalize().astype(SCHEMA_TYPES[kind])  # pyright: ignore[reportUnknownMemberType]
+    if kind in _NUMERIC_TYPES:
+        numeric = pd.to_numeric(series, errors="coerce")  # pyright: ignore[reportUnknownMemberType]
+        return pd.Series(numeric, index=series.index).astype(SCHEMA_TYPES[kind])  # pyright: ignore[reportUnknownMemberType]
+    return series.astype(SCHEMA_TYPES[kind])  # pyright: ignore[reportUnknownMemberType]
+
+
+def apply_schema(df: pd.DataFrame, schema: DatasetSchema) -> pd.DataFrame:
+    """Convert the columns of ``df`` named in ``schema`` in place and return it.
+
+    Columns missing from ``df`` are skipped, and so are columns that cannot
+    be converted when the schema is not strict.
+
+    Raises:
+        SchemaError: If a column of a strict schema cannot be represented by
+            its schema type, e.g. fractional values in an integer column.
+
+    """
+    for name, kind in schema.columns.items():
+        if name not in df.columns or str(df[name].dtype) == SCHEMA_TYPES[kind]:
+            continue
+        try:
+            df[name] = _convert(cast("pd.Series", df[name]), kind)
+        except (TypeError, ValueError) as exc:
+            if schema.strict:
+                msg = f"Column '{name}' cannot be converted to {kind}: {exc}"
+                raise SchemaError(msg) from exc
+            logger.warning(
+                "Column kept its dtype; schema conversion failed",
+                column=str(name),
+                schema_type=kind,
+                dtype=str(df[name].dtype),
+                error=str(exc),
+            )
+    return df
+
+
+def with_python_dates(df: pd.DataFrame, schema: DatasetSchema) -> pd.DataFrame:
+    """Return ``df`` with the schema's date columns as ``datetime.date`` objects.
+
+    Used right before writing to the database so that date values keep the
+    ``YYYY-MM-DD`` representation they had before typing.
+    """
+    date_columns = [name for name in schema.date_columns() if name in df.columns]
+    if not date_columns:
+        return df
+    converted = df.copy(deep=False)
+    for name in date_columns:
+        converted[name] = converted[name].dt.date  # pyright: ignore[reportUnknownMemberType]
+    return converted
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """Return the deep memory usage of ``df`` in bytes."""
+    return int(df.memory_usage(deep=True).sum())  # pyright: ignore[reportUnknownMemberType]
+
+
+WIFI_SCHEMA = DatasetSchema(
+    columns={
+        "dataset_id": "category",
+        "date": "date",
+        "spot_id": "category",
+        "spot_name": "category",
+        "connection_count": "int32",
+        "snapshot_date": "category",
+    },
+)
+
+_registry_lock = threading.Lock()
+_registry: dict[str, DatasetSchema] = {"wifi_usage_parser": WIFI_SCHEMA}
+
+
+def register_schema(name: str, schema: DatasetSchema) -> None:
+    """Register ``schema`` under ``name`` (a parser or a schema name)."""
+    with _registry_lock:
+        _registry[name] = schema
+
+
+def unregister_schema(name: str) -> None:
+    """Remove the schema registered under ``name`` if present."""
+    with _registry_lock:
+        _registry.pop(name, None)
+
+
+def get_schema(config: DatasetConfig) -> DatasetSchema | None:
+    """Return the schema for ``config`` or ``None`` when it has none.
+
+    ``extra.schema`` may be a column-to-type mapping or the name of a
+    registered schema; otherwise the schema registered for ``parser`` is used.
+    That fallback is not strict, so datasets that did not ask for a schema
+    keep loading values it cannot represent.
+    """
+    declared = config.extra.get("schema")
+    if isinstance(declared, Mapping):
+        return DatasetSchema.from_mapping(cast("Mapping[str, Any]", declared))
+    with _registry_lock:
+        if isinstance(declared, str):
+            try:
+                return _registry[declared]
+            except KeyError:
+                msg = f"Schema '{declared}' is not registered"
+                raise SchemaError(msg) from None
+        if declared is not None:
+            msg = "extra.schema must be a mapping or a registered schema name"
+            raise SchemaError(msg)
+        fallback = _registry.get(config.parser) if config.parser else None
+    return replace(fallback, strict=False) if fallback is not None else None
+
+
+__all__ = [
+    "SCHEMA_TYPES",
+    "WIFI_SCHEMA",
+    "DatasetSchema",
+    "SchemaError",
+    "apply_schema",
+    "frame_memory",
+    "get_schema",
+    "register_schema",
+    "unregister_schema",
+    "with_python_dates",
+]
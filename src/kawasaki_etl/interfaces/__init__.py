@@ -1,8 +1,36 @@
-"""Interfaces package for kawasaki_etl."""
+"""Interfaces package for kawasaki_etl.
 
-from .base import BaseInterface
-from .cli import CLIInterface
-from .factory import InterfaceFactory
-from .restapi import RestAPIInterface
+Interface classes are imported on first access so that selecting one interface
+does not import the frameworks (Typer, FastAPI/uvicorn, fastmcp) of the others.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "BaseInterface": "kawasaki_etl.interfaces.base",
+    "CLIInterface": "kawasaki_etl.interfaces.cli",
+    "InterfaceFactory": "kawasaki_etl.interfaces.factory",
+    "RestAPIInterface": "kawasaki_etl.interfaces.restapi",
+}
 
 __all__ = ["BaseInterface", "CLIInterface", "InterfaceFactory", "RestAPIInterface"]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_ATTRIBUTES.get(name)
+    if module_path is None:
+        message = f"module {__name__!s} has no attribute {name!s}"
+        raise AttributeError(message)
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .base import BaseInterface
+    from .cli import CLIInterface
+    from .factory import InterfaceFactory
+    from .restapi import RestAPIInterface
@@ -1,38 +1,91 @@
-"""CLI interface implementation using Typer."""
+"""CLI interface implementation using Typer.
+
+Commands import the download, database and meta store modules inside their
+bodies so that light commands such as ``etl list`` start without loading
+pandas, SQLAlchemy or httpx.
+"""
+
+from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.console import Console
-from sqlalchemy.engine import Engine
+from rich.table import Table
 
-from kawasaki_etl.core import (
-    DBConnectionError,
+from kawasaki_etl.core.models import (
     DatasetConfig,
     DatasetConfigError,
-    DownloadError,
-    UpsertError,
-    download_if_needed,
     get_dataset_config,
     load_dataset_configs,
-    get_engine,
-)
-from kawasaki_etl.pipelines import (
-    run_childcare_opendata,
-    run_tourism_irikomi,
-    run_wifi_count,
 )
 from kawasaki_etl.models.io import WelcomeMessage
-from kawasaki_etl.pipelines.childcare import ChildcarePipelineError
-from kawasaki_etl.pipelines.tourism import TourismPipelineError
-from kawasaki_etl.pipelines.wifi import WifiPipelineError
+from kawasaki_etl.pipelines.registry import (
+    PipelineError,
+    PipelineNotFoundError,
+    get_pipeline,
+)
+from kawasaki_etl.pipelines.scheduler import STAGES, DatasetRunResult, run_datasets
 
 from .base import BaseInterface
 
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
 # Configure console for better test compatibility
 # Force terminal mode even in non-TTY environments
 console = Console(force_terminal=True, force_interactive=False)
 
+VerifyOption = Annotated[
+    bool,
+    typer.Option(
+        "--verify",
+        help="raw ファイルを再ハッシュして処理済み判定を行う (stat 署名を信用しない)",
+    ),
+]
+
+JobsOption = Annotated[
+    int,
+    typer.Option(
+        "--jobs",
+        "-j",
+        min=1,
+        help="並列数。2 以上でダウンロード・正規化・ロードを並列実行する",
+    ),
+]
+DbWritersOption = Annotated[
+    int | None,
+    typer.Option(
+        "--db-writers",
+        min=1,
+        help="--jobs 指定時に同時に DB へ書き込むワーカー数 (既定: min(jobs, 2))",
+    ),
+]
+
+
+def _format_seconds(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds:.2f}s"
+
+
+def _print_run_summary(results: list[DatasetRunResult]) -> None:
+    table = Table(title="run-all summary")
+    table.add_column("dataset")
+    table.add_column("status")
+    for stage in STAGES:
+        table.add_column(stage, justify="right")
+    table.add_column("total", justify="right")
+    table.add_column("error")
+    for result in results:
+        table.add_row(
+            result.dataset_id,
+            result.status,
+            *(_format_seconds(result.timings.get(stage)) for stage in STAGES),
+            _format_seconds(result.total_seconds),
+            result.error or "",
+        )
+    console.print(table)
+
 
 class CLIInterface(BaseInterface):
     """Command Line Interface implementation."""
@@ -72,6 +125,7 @@ class CLIInterface(BaseInterface):
         etl_app.command(name="list")(self.list_datasets)
         etl_app.command(name="run")(self.run_dataset)
         etl_app.command(name="run-all")(self.run_all_datasets)
+        etl_app.command(name="meta-import")(self.import_meta)
         self.app.add_typer(etl_app, name="etl")
 
         # Add a callback that shows welcome when no command is specified
@@ -136,6 +190,8 @@ class CLIInterface(BaseInterface):
             )
             raise typer.Exit(code=1) from exc
 
+        from kawasaki_etl.core.io import DownloadError, download_if_needed
+
         try:
             dest_path = download_if_needed(dataset)
         except DownloadError as exc:
@@ -155,6 +211,8 @@ class CLIInterface(BaseInterface):
         console.print(f"ダウンロード先: {dest_path}")
 
     def _get_engine(self, alias: str) -> Engine:
+        from kawasaki_etl.core.db import DBConnectionError, get_engine
+
         try:
             return get_engine(alias)
         except DBConnectionError as exc:
@@ -169,24 +227,24 @@ class CLIInterface(BaseInterface):
             raise typer.Exit(code=1) from exc
 
     def _run_pipeline(
-        self, dataset: DatasetConfig, engine: Engine | None = None,
+        self,
+        dataset: DatasetConfig,
+        engine: Engine | None = None,
+        *,
+        verify: bool = False,
     ) -> None:
-        db_engine = engine or self._get_engine("default")
-        if dataset.category == "wifi" or dataset.parser == "wifi_usage_parser":
-            run_wifi_count(dataset, engine=db_engine)
-            return
-        if dataset.category == "tourism" or dataset.parser == "tourism_irikomi_pdf":
-            run_tourism_irikomi(dataset)
-            return
-        if dataset.category == "childcare" or dataset.parser == "childcare_opendata":
-            run_childcare_opendata(dataset)
-            return
+        try:
+            pipeline = get_pipeline(dataset)
+        except PipelineNotFoundError as exc:
+            typer.secho(str(exc), err=True, fg=typer.colors.RED)
+            raise typer.Exit(code=1) from exc
 
-        msg = f"Unsupported dataset category: {dataset.category}"
-        typer.secho(msg, err=True, fg=typer.colors.RED)
-        raise typer.Exit(code=1)
+        db_engine = engine
+        if pipeline.uses_engine and db_engine is None:
+            db_engine = self._get_engine("default")
+        pipeline.run_dataset(dataset, db_engine, verify=verify)
 
-    def run_dataset(self, dataset_id: str) -> None:
+    def run_dataset(self, dataset_id: str, verify: VerifyOption = False) -> None:
         """Run a single ETL pipeline for the given dataset id."""
         try:
             dataset = get_dataset_config(dataset_id, self.datasets_config_path)
@@ -203,19 +261,26 @@ class CLIInterface(BaseInterface):
             )
             raise typer.Exit(code=1) from exc
 
+        from kawasaki_etl.core.db import UpsertError
+
         try:
-            self._run_pipeline(dataset)
-        except (
-            WifiPipelineError,
-            TourismPipelineError,
-            ChildcarePipelineError,
-            UpsertError,
-        ) as exc:
+            self._run_pipeline(dataset, verify=verify)
+        except (PipelineError, UpsertError) as exc:
             typer.secho(str(exc), err=True, fg=typer.colors.RED)
             raise typer.Exit(code=1) from exc
 
-    def run_all_datasets(self) -> None:
-        """Run all ETL pipelines defined in datasets.yml."""
+    def run_all_datasets(
+        self,
+        verify: VerifyOption = False,
+        jobs: JobsOption = 1,
+        db_writers: DbWritersOption = None,
+    ) -> None:
+        """Run all ETL pipelines defined in datasets.yml.
+
+        With ``--jobs`` above 1 the stages of different datasets run in
+        parallel, a failing dataset does not stop the others, and a table of
+        per-stage timings is printed at the end.
+        """
         try:
             configs = load_dataset_configs(self.datasets_config_path)
         except DatasetConfigError as exc:
@@ -235,9 +300,64 @@ class CLIInterface(BaseInterface):
             return
 
         engine = self._get_engine("default")
+        if jobs > 1:
+            self._run_all_parallel(
+                [dataset for _, dataset in sorted(configs.items())],
+                engine,
+                jobs=jobs,
+                db_writers=db_writers,
+                verify=verify,
+            )
+            return
+
         for dataset_id, dataset in sorted(configs.items()):
             console.print(f"[bold]Run:[/bold] {dataset_id}")
-            self._run_pipeline(dataset, engine=engine)
+            self._run_pipeline(dataset, engine=engine, verify=verify)
+
+    def _run_all_parallel(
+        self,
+        datasets: list[DatasetConfig],
+        engine: Engine,
+        *,
+        jobs: int,
+        db_writers: int | None,
+        verify: bool,
+    ) -> None:
+        console.print(f"[bold]Run:[/bold] {len(datasets)} datasets (jobs={jobs})")
+        results = run_datasets(
+            datasets,
+            engine,
+            jobs=jobs,
+            db_writers=db_writers,
+            verify=verify,
+        )
+        _print_run_summary(results)
+        failed = [result.dataset_id for result in results if result.status == "failed"]
+        if failed:
+            self.logger.error("Datasets failed in run-all", dataset_ids=failed)
+            typer.secho(
+                f"失敗したデータセット: {', '.join(failed)}",
+                err=True,
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit(code=1)
+
+    def import_meta(self) -> None:
+        """Import JSON meta files under data/meta into the SQLite meta index."""
+        from kawasaki_etl.core.meta_store import MetaStoreError, import_json_meta
+
+        try:
+            imported = import_json_meta()
+        except MetaStoreError as exc:
+            self.logger.error("Failed to import metadata", error=str(exc))
+            typer.secho(
+                f"メタ情報の取り込みに失敗しました: {exc}",
+                err=True,
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit(code=1) from exc
+
+        console.print(f"メタ情報を取り込みました: {imported} 件")
 
     def run(self) -> None:
         """Run the CLI interface."""
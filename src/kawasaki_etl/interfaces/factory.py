@@ -1,12 +1,14 @@
 """Factory pattern implementation for creating interfaces."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from kawasaki_etl.types import InterfaceType
 from kawasaki_etl.utils.settings import get_interface_settings
 
-from .base import BaseInterface
-from .cli import CLIInterface
-from .mcp import MCPInterface
-from .restapi import RestAPIInterface
+if TYPE_CHECKING:
+    from .base import BaseInterface
 
 
 class InterfaceFactory:
@@ -25,11 +27,18 @@ class InterfaceFactory:
             ValueError: If the interface type is unknown
 
         """
+        # Import only the selected interface; each pulls in its own framework.
         if interface_type == InterfaceType.CLI:
+            from .cli import CLIInterface
+
             return CLIInterface()
         if interface_type == InterfaceType.RESTAPI:
+            from .restapi import RestAPIInterface
+
             return RestAPIInterface()
         if interface_type == InterfaceType.MCP:
+            from .mcp import MCPInterface
+
             return MCPInterface()
 
         msg = f"Unknown interface type: {interface_type}"
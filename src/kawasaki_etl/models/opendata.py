@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from pathlib import Path
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
 from urllib.parse import urlparse
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenDataResource:
     """単一のオープンデータファイルに関するメタデータ."""
 
@@ -14,15 +14,16 @@ class OpenDataResource:
     file_format: str
     updated_at: str
     description: str | None = None
+    # リソースURLから取得したファイル名. 生成時に一度だけ計算する.
+    filename: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def filename(self) -> str:
-        """リソースURLから取得したファイル名."""
-        parsed = urlparse(self.url)
-        return Path(parsed.path).name
+    def __post_init__(self) -> None:
+        """URL からファイル名を求めて保持する."""
+        filename = PurePosixPath(urlparse(self.url).path).name
+        object.__setattr__(self, "filename", filename)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenDataPage:
     """オープンデータページ内のリンク群とメタデータ."""
 
@@ -5,13 +5,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 __all__ = [
+    "PipelineSpec",
     "download_disaster_prevention_pages",
     "download_opendata_page",
     "download_population_2024_pages",
     "download_population_2025_pages",
+    "get_pipeline",
     "iter_disaster_prevention_pages",
     "iter_population_2024_pages",
     "iter_population_2025_pages",
+    "register_pipeline",
     "run_childcare_opendata",
     "run_tourism_irikomi",
     "run_wifi_count",
@@ -20,6 +23,9 @@ __all__ = [
 
 def __getattr__(name: str) -> Any:  # pragma: no cover - thin lazy import wrapper
     mapping = {
+        "PipelineSpec": ("kawasaki_etl.pipelines.registry", "PipelineSpec"),
+        "get_pipeline": ("kawasaki_etl.pipelines.registry", "get_pipeline"),
+        "register_pipeline": ("kawasaki_etl.pipelines.registry", "register_pipeline"),
         "run_tourism_irikomi": (
             "kawasaki_etl.pipelines.tourism",
             "run_tourism_irikomi",
@@ -81,5 +87,10 @@ if TYPE_CHECKING:  # pragma: no cover
         iter_population_2024_pages,
         iter_population_2025_pages,
     )
+    from kawasaki_etl.pipelines.registry import (
+        PipelineSpec,
+        get_pipeline,
+        register_pipeline,
+    )
     from kawasaki_etl.pipelines.tourism import run_tourism_irikomi
     from kawasaki_etl.pipelines.wifi import run_wifi_count
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from kawasaki_etl.configs import CHILDCARE_PAGES_BY_ID
 from kawasaki_etl.pipelines.opendata import DEFAULT_BASE_DIR as OPEN_DATA_BASE_DIR
 from kawasaki_etl.pipelines.opendata import download_opendata_page
+from kawasaki_etl.pipelines.registry import PipelineError
 from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -16,7 +17,7 @@ logger: LoggerProtocol = get_logger(__name__)
 DEFAULT_BASE_DIR = OPEN_DATA_BASE_DIR / "childcare"
 
 
-class ChildcarePipelineError(Exception):
+class ChildcarePipelineError(PipelineError):
     """Raised when childcare pipeline fails."""
 
 
@@ -48,3 +49,9 @@ def run_childcare_opendata(
         url=config.url,
     )
     return download_opendata_page(page, base_dir=base_dir)
+
+
+def fetch_childcare(config: DatasetConfig, *, verify: bool = False) -> None:
+    """Download the resources of ``config``; the scheduler's only stage."""
+    _ = verify
+    run_childcare_opendata(config)
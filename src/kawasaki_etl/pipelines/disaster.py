@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from kawasaki_etl.configs import DISASTER_PREVENTION_PAGES
 from kawasaki_etl.pipelines.opendata import DEFAULT_BASE_DIR as OPEN_DATA_BASE_DIR
-from kawasaki_etl.pipelines.opendata import download_opendata_page
+from kawasaki_etl.pipelines.opendata import download_opendata_pages
 from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -20,6 +20,9 @@ DEFAULT_BASE_DIR = OPEN_DATA_BASE_DIR / "disaster_prevention"
 
 def download_disaster_prevention_pages(
     base_dir: Path = DEFAULT_BASE_DIR,
+    *,
+    max_concurrency: int | None = None,
+    per_host_limit: int | None = None,
 ) -> list[Path]:
     """防災カテゴリに含まれるオープンデータを一括取得する."""
     logger.info(
@@ -27,10 +30,12 @@ def download_disaster_prevention_pages(
         count=len(DISASTER_PREVENTION_PAGES),
         destination=str(base_dir),
     )
-    outputs: list[Path] = []
-    for page in DISASTER_PREVENTION_PAGES:
-        outputs.extend(download_opendata_page(page, base_dir=base_dir))
-    return outputs
+    return download_opendata_pages(
+        DISASTER_PREVENTION_PAGES,
+        base_dir=base_dir,
+        max_concurrency=max_concurrency,
+        per_host_limit=per_host_limit,
+    )
 
 
 def iter_disaster_prevention_pages() -> Iterator[OpenDataPage]:
@@ -4,10 +4,12 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 
-from kawasaki_etl.core.io import download_file
+from kawasaki_etl.core.async_io import DownloadJob, download_files
 from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
     from kawasaki_etl.models import OpenDataPage
 
 logger: LoggerProtocol = get_logger(__name__)
@@ -19,14 +21,11 @@ def _ensure_absolute(url: str, base: str) -> str:
     return url if url.startswith("http") else urljoin(base, url)
 
 
-def download_opendata_page(
-    page: OpenDataPage, base_dir: Path = DEFAULT_BASE_DIR,
-) -> list[Path]:
-    """指定したオープンデータページに含まれるファイルをすべて保存する."""
+def _collect_jobs(page: OpenDataPage, base_dir: Path) -> list[DownloadJob]:
     target_dir = base_dir / page.storage_dirname
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    downloaded: list[Path] = []
+    jobs: list[DownloadJob] = []
     for resource in page.resources:
         url = _ensure_absolute(resource.url, page.page_url)
         dest = target_dir / resource.filename
@@ -39,10 +38,43 @@ def download_opendata_page(
             updated_at=resource.updated_at,
             format=resource.file_format,
         )
-        download_file(url, dest)
-        downloaded.append(dest)
+        jobs.append(DownloadJob(url=url, dest=dest))
+    return jobs
+
+
+def download_opendata_pages(
+    pages: Iterable[OpenDataPage],
+    base_dir: Path = DEFAULT_BASE_DIR,
+    *,
+    max_concurrency: int | None = None,
+    per_host_limit: int | None = None,
+) -> list[Path]:
+    """複数ページのファイルを並行ダウンロードし、ページ・リソース順に返す."""
+    jobs: list[DownloadJob] = []
+    for page in pages:
+        jobs.extend(_collect_jobs(page, base_dir))
+
+    return download_files(
+        jobs,
+        max_concurrency=max_concurrency,
+        per_host_limit=per_host_limit,
+    )
+
 
-    return downloaded
+def download_opendata_page(
+    page: OpenDataPage,
+    base_dir: Path = DEFAULT_BASE_DIR,
+    *,
+    max_concurrency: int | None = None,
+    per_host_limit: int | None = None,
+) -> list[Path]:
+    """指定したオープンデータページに含まれるファイルをすべて保存する."""
+    return download_opendata_pages(
+        [page],
+        base_dir=base_dir,
+        max_concurrency=max_concurrency,
+        per_host_limit=per_host_limit,
+    )
 
 
-__all__ = ["download_opendata_page"]
+__all__ = ["download_opendata_page", "download_opendata_pages"]
@@ -2,14 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from kawasaki_etl.configs.population import (
-    POPULATION_2022_PAGES,
-    POPULATION_2023_PAGES,
-    POPULATION_2024_PAGES,
-    POPULATION_2025_PAGES,
-)
+from kawasaki_etl.configs.population import get_population_pages
 from kawasaki_etl.pipelines.opendata import DEFAULT_BASE_DIR as OPEN_DATA_BASE_DIR
-from kawasaki_etl.pipelines.opendata import download_opendata_page
+from kawasaki_etl.pipelines.opendata import download_opendata_pages
 from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -26,86 +21,113 @@ DEFAULT_BASE_DIR_2024 = OPEN_DATA_BASE_DIR / "population_2024"
 DEFAULT_BASE_DIR_2025 = OPEN_DATA_BASE_DIR / "population_2025"
 
 
-def _download_population_pages(
+def download_population_pages(
+    year: int | str,
+    base_dir: Path | None = None,
     *,
-    pages: tuple[OpenDataPage, ...],
-    base_dir: Path,
-    year_label: str,
+    max_concurrency: int | None = None,
+    per_host_limit: int | None = None,
 ) -> list[Path]:
+    """人口・世帯カテゴリの指定年度のオープンデータを一括取得する."""
+    pages = get_population_pages(year)
+    destination = base_dir or OPEN_DATA_BASE_DIR / f"population_{year}"
     logger.info(
         "Downloading population open data",
-        year=year_label,
+        year=str(year),
         count=len(pages),
-        destination=str(base_dir),
+        destination=str(destination),
     )
-    outputs: list[Path] = []
-    for page in pages:
-        outputs.extend(download_opendata_page(page, base_dir=base_dir))
-    return outputs
+    return download_opendata_pages(
+        pages,
+        base_dir=destination,
+        max_concurrency=max_concurrency,
+        per_host_limit=per_host_limit,
+    )
+
+
+def iter_population_pages(year: int | str) -> Iterator[OpenDataPage]:
+    """人口・世帯カテゴリの指定年度のページ定義を列挙する."""
+    return iter(get_population_pages(year))
 
 
 def download_population_2024_pages(
     base_dir: Path = DEFAULT_BASE_DIR_2024,
+    *,
+    max_concurrency: int | None = None,
+    per_host_limit: int | None = None,
 ) -> list[Path]:
     """人口・世帯カテゴリ(2024年度)のオープンデータを一括取得する."""
-    return _download_population_pages(
-        pages=POPULATION_2024_PAGES,
-        base_dir=base_dir,
-        year_label="2024",
+    return download_population_pages(
+        "2024",
+        base_dir,
+        max_concurrency=max_concurrency,
+        per_host_limit=per_host_limit,
     )
 
 
 def download_population_2023_pages(
     base_dir: Path = DEFAULT_BASE_DIR_2023,
+    *,
+    max_concurrency: int | None = None,
+    per_host_limit: int | None = None,
 ) -> list[Path]:
     """人口・世帯カテゴリ(2023年度)のオープンデータを一括取得する."""
-    return _download_population_pages(
-        pages=POPULATION_2023_PAGES,
-        base_dir=base_dir,
-        year_label="2023",
+    return download_population_pages(
+        "2023",
+        base_dir,
+        max_concurrency=max_concurrency,
+        per_host_limit=per_host_limit,
     )
 
 
 def download_population_2022_pages(
     base_dir: Path = DEFAULT_BASE_DIR_2022,
+    *,
+    max_concurrency: int | None = None,
+    per_host_limit: int | None = None,
 ) -> list[Path]:
     """人口・世帯カテゴリ(2022年度)のオープンデータを一括取得する."""
-    return _download_population_pages(
-        pages=POPULATION_2022_PAGES,
-        base_dir=base_dir,
-        year_label="2022",
+    return download_population_pages(
+        "2022",
+        base_dir,
+        max_concurrency=max_concurrency,
+        per_host_limit=per_host_limit,
     )
 
 
 def download_population_2025_pages(
     base_dir: Path = DEFAULT_BASE_DIR_2025,
+    *,
+    max_concurrency: int | None = None,
+    per_host_limit: int | None = None,
 ) -> list[Path]:
     """人口・世帯カテゴリ(2025年度)のオープンデータを一括取得する."""
-    return _download_population_pages(
-        pages=POPULATION_2025_PAGES,
-        base_dir=base_dir,
-        year_label="2025",
+    return download_population_pages(
+        "2025",
+        base_dir,
+        max_concurrency=max_concurrency,
+        per_host_limit=per_host_limit,
     )
 
 
 def iter_population_2024_pages() -> Iterator[OpenDataPage]:
     """人口・世帯カテゴリ(2024年度)のページ定義を列挙する."""
-    return iter(POPULATION_2024_PAGES)
+    return iter_population_pages("2024")
 
 
 def iter_population_2023_pages() -> Iterator[OpenDataPage]:
     """人口・世帯カテゴリ(2023年度)のページ定義を列挙する."""
-    return iter(POPULATION_2023_PAGES)
+    return iter_population_pages("2023")
 
 
 def iter_population_2022_pages() -> Iterator[OpenDataPage]:
     """人口・世帯カテゴリ(2022年度)のページ定義を列挙する."""
-    return iter(POPULATION_2022_PAGES)
+    return iter_population_pages("2022")
 
 
 def iter_population_2025_pages() -> Iterator[OpenDataPage]:
     """人口・世帯カテゴリ(2025年度)のページ定義を列挙する."""
-    return iter(POPULATION_2025_PAGES)
+    return iter_population_pages("2025")
 
 
 __all__ = [
@@ -113,8 +135,10 @@ __all__ = [
     "download_population_2023_pages",
     "download_population_2024_pages",
     "download_population_2025_pages",
+    "download_population_pages",
     "iter_population_2022_pages",
     "iter_population_2023_pages",
     "iter_population_2024_pages",
     "iter_population_2025_pages",
+    "iter_population_pages",
 ]
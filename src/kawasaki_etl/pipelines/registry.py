@@ -0,0 +1,185 @@
+"""Registry mapping dataset parsers to their pipeline implementations.
+
+Pipelines are declared by import path and only imported when a dataset needs
+them, so commands such as ``etl list`` never load pandas or pypdf. Built-in
+pipelines are listed in :data:`BUILTIN_PIPELINES`; third-party packages can
+add more through the ``kawasaki_etl.pipelines`` entry point group, whose
+entries must point at a :class:`PipelineSpec`.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING, Any
+
+from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.engine import Engine
+
+    from kawasaki_etl.core.models import DatasetConfig
+    from kawasaki_etl.pipelines.scheduler import PipelineStages
+
+ENTRY_POINT_GROUP = "kawasaki_etl.pipelines"
+
+logger: LoggerProtocol = get_logger(__name__)
+
+
+class PipelineError(Exception):
+    """Base class for errors raised by dataset pipelines."""
+
+
+class PipelineNotFoundError(PipelineError):
+    """Raised when no pipeline is registered for a dataset."""
+
+
+@dataclass(frozen=True)
+class PipelineSpec:
+    """Where a pipeline lives and how to call it.
+
+    ``run`` and the optional stage names are attributes of ``module``; they are
+    resolved on every call, so nothing is imported until a dataset needs it.
+    ``category`` lets datasets without a ``parser`` fall back to this pipeline.
+    """
+
+    parser: str
+    module: str
+    run: str
+    category: str | None = None
+    uses_engine: bool = False
+    accepts_verify: bool = False
+    fetch: str | None = None
+    normalize: str | None = None
+    load: str | None = None
+
+    def _attr(self, name: str) -> Callable[..., Any]:
+        return getattr(import_module(self.module), name)
+
+    def run_dataset(
+        self,
+        config: DatasetConfig,
+        engine: Engine | None = None,
+        *,
+        verify: bool = False,
+    ) -> None:
+        """Run the whole pipeline for ``config``."""
+        kwargs: dict[str, Any] = {}
+        if self.uses_engine:
+            kwargs["engine"] = engine
+        if self.accepts_verify:
+            kwargs["verify"] = verify
+        self._attr(self.run)(config, **kwargs)
+
+    def stages(self) -> PipelineStages:
+        """Return the stage callables used by the parallel scheduler."""
+        from kawasaki_etl.pipelines.scheduler import PipelineStages
+
+        if self.fetch is None:
+            msg = f"Pipeline '{self.parser}' does not define stages"
+            raise PipelineError(msg)
+        return PipelineStages(
+            fetch=self._attr(self.fetch),
+            normalize=self._attr(self.normalize) if self.normalize else None,
+            load=self._attr(self.load) if self.load else None,
+        )
+
+
+BUILTIN_PIPELINES: tuple[PipelineSpec, ...] = (
+    PipelineSpec(
+        parser="wifi_usage_parser",
+        category="wifi",
+        module="kawasaki_etl.pipelines.wifi",
+        run="run_wifi_count",
+        uses_engine=True,
+        accepts_verify=True,
+        fetch="fetch_wifi_raw",
+        normalize="normalize_wifi",
+        load="load_wifi",
+    ),
+    PipelineSpec(
+        parser="tourism_irikomi_pdf",
+        category="tourism",
+        module="kawasaki_etl.pipelines.tourism",
+        run="run_tourism_irikomi",
+        accepts_verify=True,
+        fetch="fetch_tourism_raw",
+        normalize="normalize_tourism",
+        load="load_tourism",
+    ),
+    PipelineSpec(
+        parser="childcare_opendata",
+        category="childcare",
+        module="kawasaki_etl.pipelines.childcare",
+        run="run_childcare_opendata",
+        fetch="fetch_childcare",
+    ),
+)
+
+_registry_lock = threading.Lock()
+_registry: dict[str, PipelineSpec] = {spec.parser: spec for spec in BUILTIN_PIPELINES}
+
+
+def register_pipeline(spec: PipelineSpec) -> None:
+    """Register ``spec``, replacing any pipeline with the same parser name."""
+    with _registry_lock:
+        _registry[spec.parser] = spec
+
+
+def unregister_pipeline(parser: str) -> None:
+    """Remove the pipeline registered under ``parser`` if present."""
+    with _registry_lock:
+        _registry.pop(parser, None)
+
+
+def _load_entry_point(parser: str) -> PipelineSpec | None:
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP, name=parser):
+        spec = entry_point.load()
+        if not isinstance(spec, PipelineSpec):
+            msg = f"Entry point '{entry_point.value}' is not a PipelineSpec"
+            raise PipelineError(msg)
+        logger.debug("Loaded pipeline entry point", parser=parser)
+        register_pipeline(spec)
+        return spec
+    return None
+
+
+def get_pipeline(dataset: DatasetConfig) -> PipelineSpec:
+    """Return the pipeline for ``dataset``.
+
+    The ``parser`` name is looked up first (registered pipelines, then entry
+    points); datasets without a known parser fall back to their ``category``.
+    """
+    if dataset.parser:
+        with _registry_lock:
+            spec = _registry.get(dataset.parser)
+        if spec is None:
+            spec = _load_entry_point(dataset.parser)
+        if spec is not None:
+            return spec
+
+    with _registry_lock:
+        for spec in _registry.values():
+            if spec.category == dataset.category:
+                return spec
+
+    msg = f"Unsupported dataset category: {dataset.category}"
+    if dataset.parser:
+        msg = f"{msg} (parser: {dataset.parser})"
+    raise PipelineNotFoundError(msg)
+
+
+__all__ = [
+    "BUILTIN_PIPELINES",
+    "ENTRY_POINT_GROUP",
+    "PipelineError",
+    "PipelineNotFoundError",
+    "PipelineSpec",
+    "get_pipeline",
+    "register_pipeline",
+    "unregister_pipeline",
+]
@@ -0,0 +1,240 @@
+"""Concurrent scheduler behind ``etl run-all --jobs N``.
+
+Every dataset moves through up to three stages, each served by its own pool:
+
+- ``download``: I/O-bound fetch and change detection on a thread pool.
+- ``normalize``: CPU-bound parsing on a process pool.
+- ``load``: database writes on a small, bounded thread pool.
+
+The dispatcher hands each finished stage result to the next pool as soon as it
+is ready, so downloads, parsing and loads of different datasets overlap. A
+failure in any stage only marks that dataset as failed; the others continue.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from sqlalchemy.engine import Engine
+
+    from kawasaki_etl.core import DatasetConfig
+
+STAGES: tuple[str, ...] = ("download", "normalize", "load")
+DEFAULT_DB_WRITERS = 2
+
+logger: LoggerProtocol = get_logger(__name__)
+
+
+class SchedulerError(Exception):
+    """Raised when a dataset cannot be scheduled."""
+
+
+@dataclass(frozen=True)
+class PipelineStages:
+    """Stage callables of one pipeline.
+
+    ``fetch(config, verify=...)`` returns the raw input, or ``None`` when the
+    dataset was already loaded. ``normalize(config, raw)`` must be picklable
+    because it runs in a worker process. ``load(config, normalized, engine)``
+    writes the result. Pipelines without later stages finish after ``fetch``.
+    """
+
+    fetch: Callable[..., Any]
+    normalize: Callable[[DatasetConfig, Any], Any] | None = None
+    load: Callable[[DatasetConfig, Any, Engine | None], Any] | None = None
+
+
+@dataclass
+class DatasetRunResult:
+    """Outcome and per-stage wall time of one dataset."""
+
+    dataset_id: str
+    status: str = "pending"
+    timings: dict[str, float] = field(default_factory=dict[str, float])
+    error: str | None = None
+
+    @property
+    def total_seconds(self) -> float:
+        """Return the summed stage time."""
+        return sum(self.timings.values())
+
+
+def stages_for(dataset: DatasetConfig) -> PipelineStages:
+    """Return the stages of the registered pipeline that handles ``dataset``."""
+    from kawasaki_etl.pipelines.registry import PipelineError, get_pipeline
+
+    try:
+        return get_pipeline(dataset).stages()
+    except PipelineError as exc:
+        raise SchedulerError(str(exc)) from exc
+
+
+def _timed(func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[Any, float]:
+    """Call ``func`` and return its result with the elapsed seconds."""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def _parse_executor(workers: int, *, use_processes: bool) -> Executor:
+    if not use_processes:
+        return ThreadPoolExecutor(workers, thread_name_prefix="etl-normalize")
+    # Download threads are running when workers start; spawn avoids forking them.
+    return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class _Dispatcher:
+    def __init__(
+        self,
+        engine: Engine | None,
+        *,
+        downloads: Executor,
+        parsers: Executor,
+        writers: Executor,
+        verify: bool,
+        resolve_stages: Callable[[DatasetConfig], PipelineStages],
+    ) -> None:
+        self._engine = engine
+        self._pools = {"download": downloads, "normalize": parsers, "load": writers}
+        self._verify = verify
+        self._resolve_stages = resolve_stages
+        self._pending: dict[Future[tuple[Any, float]], tuple[str, DatasetConfig]] = {}
+        self._stages: dict[str, PipelineStages] = {}
+        self.results: dict[str, DatasetRunResult] = {}
+
+    def start(self, dataset: DatasetConfig) -> None:
+        result = DatasetRunResult(dataset_id=dataset.dataset_id)
+        self.results[dataset.dataset_id] = result
+        try:
+            stages = self._resolve_stages(dataset)
+        except SchedulerError as exc:
+            self._fail(dataset, "download", exc)
+            return
+        self._stages[dataset.dataset_id] = stages
+        self._submit("download", dataset, stages.fetch, dataset, verify=self._verify)
+
+    def _submit(
+        self,
+        stage: str,
+        dataset: DatasetConfig,
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self.results[dataset.dataset_id].status = stage
+        future = self._pools[stage].submit(_timed, func, *args, **kwargs)
+        self._pending[future] = (stage, dataset)
+
+    def _fail(self, dataset: DatasetConfig, stage: str, exc: BaseException) -> None:
+        result = self.results[dataset.dataset_id]
+        result.status = "failed"
+        result.error = f"{stage}: {exc}"
+        logger.error(
+            "Dataset pipeline failed",
+            dataset_id=dataset.dataset_id,
+            stage=stage,
+            error=str(exc),
+        )
+
+    def _advance(self, stage: str, dataset: DatasetConfig, value: Any) -> None:
+        stages = self._stages[dataset.dataset_id]
+        result = self.results[dataset.dataset_id]
+        if stage == "download" and stages.normalize is not None:
+            if value is None:
+                result.status = "skipped"
+                return
+            self._submit("normalize", dataset, stages.normalize, dataset, value)
+        elif stage == "normalize" and stages.load is not None:
+            self._submit("load", dataset, stages.load, dataset, value, self._engine)
+        else:
+            result.status = "completed"
+
+    def run(self) -> None:
+        while self._pending:
+            done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, dataset = self._pending.pop(future)
+                try:
+                    value, elapsed = future.result()
+                except Exception as exc:  # isolate per-dataset failures
+                    self._fail(dataset, stage, exc)
+                    continue
+                self.results[dataset.dataset_id].timings[stage] = elapsed
+                self._advance(stage, dataset, value)
+
+
+def run_datasets(
+    datasets: Sequence[DatasetConfig],
+    engine: Engine | None = None,
+    *,
+    jobs: int,
+    db_writers: int | None = None,
+    verify: bool = False,
+    use_processes: bool = True,
+    resolve_stages: Callable[[DatasetConfig], PipelineStages] = stages_for,
+) -> list[DatasetRunResult]:
+    """Run ``datasets`` through the download, normalize and load pools.
+
+    Args:
+        datasets: Datasets to run.
+        engine: Engine shared by the DB writers.
+        jobs: Size of the download thread pool and the parse process pool.
+        db_writers: Concurrent DB writers; defaults to ``min(jobs, 2)``.
+        verify: Rehash raw files instead of trusting stored stat signatures.
+        use_processes: Parse in worker processes; threads are used otherwise.
+        resolve_stages: Maps a dataset to its pipeline stages.
+
+    Returns:
+        One result per dataset in input order. Failed datasets carry the stage
+        and message in ``error``.
+
+    """
+    if jobs < 1:
+        msg = f"jobs must be a positive integer: {jobs}"
+        raise SchedulerError(msg)
+    writers = db_writers or min(jobs, DEFAULT_DB_WRITERS)
+
+    with (
+        ThreadPoolExecutor(jobs, thread_name_prefix="etl-download") as downloads,
+        _parse_executor(jobs, use_processes=use_processes) as parsers,
+        ThreadPoolExecutor(writers, thread_name_prefix="etl-load") as load_pool,
+    ):
+        dispatcher = _Dispatcher(
+            engine,
+            downloads=downloads,
+            parsers=parsers,
+            writers=load_pool,
+            verify=verify,
+            resolve_stages=resolve_stages,
+        )
+        for dataset in datasets:
+            dispatcher.start(dataset)
+        dispatcher.run()
+
+    return [dispatcher.results[dataset.dataset_id] for dataset in datasets]
+
+
+__all__ = [
+    "STAGES",
+    "DatasetRunResult",
+    "PipelineStages",
+    "SchedulerError",
+    "run_datasets",
+    "stages_for",
+]
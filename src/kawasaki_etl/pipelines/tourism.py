@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+from dataclasses import dataclass
 from pathlib import Path
 
 from typing import TYPE_CHECKING
@@ -9,72 +10,224 @@ from typing import TYPE_CHECKING
 from kawasaki_etl.core import (
     DatasetConfig,
     DownloadError,
+    NormalizationError,
     calculate_sha256,
+    completed_stages,
     download_if_needed,
+    get_loaded_sha256,
     is_already_loaded,
     mark_loaded,
+    mark_stage_complete,
+    normalized_dest,
+    write_normalized,
 )
 from kawasaki_etl.core.pdf_utils import (
     TourismPdfExtractionError,
     extract_tables_from_tourism_irikomi,
 )
+from kawasaki_etl.pipelines.registry import PipelineError
 from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
 
 if TYPE_CHECKING:
     import pandas as pd
+    from sqlalchemy.engine import Engine
 
 
 NORMALIZED_DATA_DIR = Path("data/normalized")
+# Bump when the PDF extraction changes, so cached outputs are rebuilt.
+TOURISM_NORMALIZER_VERSION = "1"
 
 logger: LoggerProtocol = get_logger(__name__)
 
 
-class TourismPipelineError(Exception):
+class TourismPipelineError(PipelineError):
     """Raised when tourism pipelines fail."""
 
 
 def _normalized_path(dataset: DatasetConfig, raw_path: Path) -> Path:
     directory = NORMALIZED_DATA_DIR / dataset.category / dataset.dataset_id
     directory.mkdir(parents=True, exist_ok=True)
-    return directory / f"{raw_path.stem}_extracted.csv"
+    return normalized_dest(
+        directory / f"{raw_path.stem}_extracted.csv",
+        dataset.output_format,
+    )
 
 
-def run_tourism_irikomi(config: DatasetConfig) -> Path:
-    """Run the tourism visitor PDF pipeline."""
-    logger.info(
-        "Starting tourism PDF pipeline",
-        dataset_id=config.dataset_id,
-        url=config.url,
-    )
-    try:
-        raw_path = download_if_needed(config)
-        sha256 = calculate_sha256(raw_path)
+def normalizer_version(config: DatasetConfig) -> str:
+    """Return the version of the extracted output produced for ``config``."""
+    return f"{TOURISM_NORMALIZER_VERSION}-{config.output_format}"
 
-        if is_already_loaded(config, raw_path, sha256):
-            normalized_path = _normalized_path(config, raw_path)
-            logger.info(
-                "Already processed tourism PDF; skipping extraction",
-                dataset_id=config.dataset_id,
-                normalized_path=str(normalized_path),
-            )
-        else:
-            extracted: pd.DataFrame = extract_tables_from_tourism_irikomi(raw_path)
-            normalized_path = _normalized_path(config, raw_path)
-            normalized_path_str = str(normalized_path)
-            extracted.to_csv(normalized_path_str, index=False)  # pyright: ignore[reportUnknownMemberType]
 
-            mark_loaded(
+@dataclass(frozen=True)
+class TourismRawFile:
+    """A downloaded tourism PDF that still has to be extracted.
+
+    ``normalized_path`` points at tables an earlier run extracted from the same
+    PDF with the current normalizer version, if any.
+    """
+
+    raw_path: Path
+    sha256: str
+    normalized_path: Path | None = None
+
+
+@dataclass(frozen=True)
+class TourismNormalized:
+    """Output of :func:`normalize_tourism`, recorded by :func:`load_tourism`."""
+
+    raw: TourismRawFile
+    normalized_path: Path
+    reused: bool = False
+
+
+def _download_unprocessed(
+    config: DatasetConfig,
+    *,
+    verify: bool,
+) -> tuple[Path, TourismRawFile | None]:
+    raw_path = download_if_needed(config)
+    sha256 = calculate_sha256(raw_path, use_cache=False) if verify else None
+    version = normalizer_version(config)
+    if is_already_loaded(config, raw_path, sha256):
+        # The load record matches the file, so its digest is the file's digest
+        # and the PDF does not have to be hashed again.
+        stored = sha256 or get_loaded_sha256(config, raw_path)
+        stages = (
+            completed_stages(
                 config,
                 raw_path,
-                sha256,
-                processed_at=datetime.datetime.now(tz=datetime.UTC),
+                sha256=stored,
+                normalizer_version=version,
             )
+            if stored
+            else None
+        )
+        # Files processed before stages were recorded have no stage records.
+        if stored is None or stages is None or "load" in stages:
             logger.info(
-                "Tourism PDF pipeline completed",
+                "Already processed tourism PDF; skipping extraction",
                 dataset_id=config.dataset_id,
-                normalized_path=str(normalized_path),
+                normalized_path=str(_normalized_path(config, raw_path)),
             )
-    except (DownloadError, TourismPdfExtractionError) as exc:
+            return raw_path, None
+        digest = stored
+    else:
+        digest = sha256 or calculate_sha256(raw_path)
+        stages = completed_stages(
+            config,
+            raw_path,
+            sha256=digest,
+            normalizer_version=version,
+        )
+        if stages and "load" in stages:
+            # The load record no longer matches, so the stage records are stale.
+            stages = {}
+    if not stages:
+        mark_stage_complete(config, raw_path, "download", sha256=digest)
+
+    normalized = (stages or {}).get("normalize")
+    raw = TourismRawFile(
+        raw_path=raw_path,
+        sha256=digest,
+        normalized_path=Path(normalized["artifact"]) if normalized else None,
+    )
+    return raw_path, raw
+
+
+def fetch_tourism_raw(
+    config: DatasetConfig,
+    *,
+    verify: bool = False,
+) -> TourismRawFile | None:
+    """Download the PDF and return it, or ``None`` when already processed."""
+    return _download_unprocessed(config, verify=verify)[1]
+
+
+def normalize_tourism(config: DatasetConfig, raw: TourismRawFile) -> TourismNormalized:
+    """Extract the PDF tables and write them as normalized data.
+
+    Tables extracted by an earlier run are reused instead. Only touches
+    files, so it can run in a worker process.
+    """
+    if raw.normalized_path is not None:
+        logger.info(
+            "Reusing extracted tourism tables",
+            dataset_id=config.dataset_id,
+            normalized_path=str(raw.normalized_path),
+        )
+        return TourismNormalized(
+            raw=raw,
+            normalized_path=raw.normalized_path,
+            reused=True,
+        )
+    extracted: pd.DataFrame = extract_tables_from_tourism_irikomi(raw.raw_path)
+    normalized_path = write_normalized(
+        extracted,
+        _normalized_path(config, raw.raw_path),
+        output_format=config.output_format,
+    )
+    return TourismNormalized(raw=raw, normalized_path=normalized_path)
+
+
+def load_tourism(
+    config: DatasetConfig,
+    normalized: TourismNormalized,
+    engine: Engine | None = None,
+) -> None:
+    """Record the extracted PDF as processed. The data is not loaded into a DB."""
+    _ = engine
+    raw = normalized.raw
+    version = normalizer_version(config)
+    if not normalized.reused:
+        mark_stage_complete(
+            config,
+            raw.raw_path,
+            "normalize",
+            sha256=raw.sha256,
+            normalizer_version=version,
+            artifact=normalized.normalized_path,
+        )
+    mark_loaded(
+        config,
+        raw.raw_path,
+        raw.sha256,
+        processed_at=datetime.datetime.now(tz=datetime.UTC),
+    )
+    mark_stage_complete(
+        config,
+        raw.raw_path,
+        "load",
+        sha256=raw.sha256,
+        normalizer_version=version,
+    )
+    logger.info(
+        "Tourism PDF pipeline completed",
+        dataset_id=config.dataset_id,
+        normalized_path=str(normalized.normalized_path),
+    )
+
+
+def run_tourism_irikomi(config: DatasetConfig, *, verify: bool = False) -> Path:
+    """Run the tourism visitor PDF pipeline.
+
+    Args:
+        config: Dataset configuration.
+        verify: Rehash the raw file instead of trusting the stored stat
+            signature when checking whether it was already processed.
+
+    """
+    logger.info(
+        "Starting tourism PDF pipeline",
+        dataset_id=config.dataset_id,
+        url=config.url,
+    )
+    try:
+        raw_path, raw = _download_unprocessed(config, verify=verify)
+        if raw is None:
+            return _normalized_path(config, raw_path)
+        normalized = normalize_tourism(config, raw)
+        load_tourism(config, normalized)
+    except (DownloadError, NormalizationError, TourismPdfExtractionError) as exc:
         logger.error(
             "Tourism PDF pipeline failed",
             dataset_id=config.dataset_id,
@@ -82,5 +235,4 @@ def run_tourism_irikomi(config: DatasetConfig) -> Path:
         )
         raise TourismPipelineError(str(exc)) from exc
 
-    return normalized_path
-
+    return normalized.normalized_path
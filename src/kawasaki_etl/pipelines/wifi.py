@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
+import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
@@ -12,22 +15,48 @@ from kawasaki_etl.core import (
     DownloadError,
     NormalizationError,
     calculate_sha256,
+    completed_stages,
     download_if_needed,
+    get_loaded_sha256,
     is_already_loaded,
+    iter_normalized_chunks,
     mark_loaded,
+    mark_stage_complete,
     normalize_column_name,
     normalize_csv,
+    normalize_csv_chunked,
+    normalized_dest,
+    read_csv_header,
 )
+from kawasaki_etl.core.normalize import DEFAULT_CHUNKSIZE
 from kawasaki_etl.core.db import UpsertError, get_engine, upsert_dataframe
+from kawasaki_etl.core.projection import (
+    ProjectionError,
+    ReadProjection,
+    get_projection,
+)
+from kawasaki_etl.core.schema import (
+    SchemaError,
+    apply_schema,
+    get_schema,
+    with_python_dates,
+)
+from kawasaki_etl.pipelines.registry import PipelineError
 from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
     from sqlalchemy.engine import Engine
 
 NORMALIZED_DATA_DIR = Path("data/normalized")
 DEFAULT_TABLE_NAME = "wifi_access_counts"
 DEFAULT_KEY_FIELDS = ["date", "spot_id"]
+REQUIRED_COLUMNS = ["date", "spot_id", "connection_count"]
+# Bump when normalize_wifi starts producing different output for the same raw
+# file, so that cached normalized files are rebuilt and reloaded.
+WIFI_NORMALIZER_VERSION = "1"
+# Dataset settings that change the normalized file.
+_NORMALIZER_SETTINGS = ("column_mapping", "columns", "row_filter")
 
 logger: LoggerProtocol = get_logger(__name__)
 
@@ -39,7 +68,7 @@ DEFAULT_COLUMN_CANDIDATES: dict[str, list[str]] = {
 }
 
 
-class WifiPipelineError(Exception):
+class WifiPipelineError(PipelineError):
     """Raised when Wi-Fi pipeline fails."""
 
 
@@ -62,13 +91,13 @@ def _resolve_column_name(  # pyright: ignore[reportUnknownArgumentType,reportUnk
     raise WifiPipelineError(msg)
 
 
-def _rename_wifi_columns(df: DataFrame, config: DatasetConfig) -> DataFrame:
+def _column_candidates(config: DatasetConfig) -> dict[str, list[str]]:
     column_mapping_raw = config.extra.get("column_mapping", {})
     column_mapping: dict[str, list[str] | str] = cast(
         "dict[str, list[str] | str]",
         column_mapping_raw,
     )
-    resolved: dict[str, str] = {}
+    candidates_by_name: dict[str, list[str]] = {}
 
     for logical_name, default_candidates in DEFAULT_COLUMN_CANDIDATES.items():
         custom_candidates_raw = column_mapping.get(logical_name)
@@ -81,8 +110,80 @@ def _rename_wifi_columns(df: DataFrame, config: DatasetConfig) -> DataFrame:
         else:
             msg = f"column_mapping for '{logical_name}' must be string or list"
             raise WifiPipelineError(msg)
+        candidates_by_name[logical_name] = candidates
+
+    return candidates_by_name
+
+
+def _wifi_projection(config: DatasetConfig) -> ReadProjection:
+    """Return the logical columns and row filter requested for ``config``.
+
+    ``columns`` is ``None`` unless ``extra.columns`` is set, so every column
+    of the source file is kept by default.
+    """
+    projection = get_projection(config)
+    if projection.columns is None:
+        return projection
+    unknown = [
+        name for name in projection.columns if name not in DEFAULT_COLUMN_CANDIDATES
+    ]
+    if unknown:
+        msg = f"Unknown Wi-Fi columns in extra.columns: {unknown}"
+        raise WifiPipelineError(msg)
+    missing = [name for name in REQUIRED_COLUMNS if name not in projection.columns]
+    if missing:
+        msg = f"extra.columns must include the required columns: {missing}"
+        raise WifiPipelineError(msg)
+    return projection
+
+
+def _logical_columns(projection: ReadProjection) -> tuple[str, ...]:
+    if projection.columns is None:
+        return tuple(DEFAULT_COLUMN_CANDIDATES)
+    return projection.columns
+
+
+def _source_projection(
+    config: DatasetConfig,
+    raw_path: Path,
+) -> tuple[ReadProjection, dict[str, str]]:
+    """Translate the Wi-Fi projection to the header names of ``raw_path``.
+
+    Also returns the header name resolved for each logical column.
+    """
+    projection = _wifi_projection(config)
+    header = DataFrame(columns=read_csv_header(raw_path))
+    candidates = _column_candidates(config)
+    logical_names = {
+        *_logical_columns(projection),
+        *(predicate.column for predicate in projection.predicates),
+    }
+    source_names = {
+        name: _resolve_column_name(header, name, candidates[name])
+        for name in logical_names
+        if name in candidates
+    }
+    renamed = projection.renamed(source_names)
+    if renamed.columns is None:
+        return renamed, source_names
+    # Predicate columns have to be parsed even when they are not kept.
+    columns = dict.fromkeys(
+        [
+            *renamed.columns,
+            *(predicate.column for predicate in renamed.predicates),
+        ],
+    )
+    return (
+        ReadProjection(columns=tuple(columns), predicates=renamed.predicates),
+        source_names,
+    )
+
 
-        source_name = _resolve_column_name(df, logical_name, candidates)
+def _rename_wifi_columns(df: DataFrame, config: DatasetConfig) -> DataFrame:
+    candidates = _column_candidates(config)
+    resolved: dict[str, str] = {}
+    for logical_name in _logical_columns(_wifi_projection(config)):
+        source_name = _resolve_column_name(df, logical_name, candidates[logical_name])
         resolved[source_name] = logical_name
 
     return df.rename(columns=resolved)
@@ -90,9 +191,8 @@ def _rename_wifi_columns(df: DataFrame, config: DatasetConfig) -> DataFrame:
 
 def _prepare_wifi_dataframe(df: DataFrame, config: DatasetConfig) -> DataFrame:
     renamed = _rename_wifi_columns(df, config)
-    required_columns = ["date", "spot_id", "connection_count"]
 
-    missing = [col for col in required_columns if col not in renamed.columns]
+    missing = [col for col in REQUIRED_COLUMNS if col not in renamed.columns]
     if missing:
         msg = f"Missing required columns after renaming: {missing}"
         raise WifiPipelineError(msg)
@@ -154,35 +254,322 @@ def _normalized_path(dataset: DatasetConfig, raw_path: Path) -> Path:
     return directory / f"{raw_path.stem}_normalized.csv"
 
 
-def run_wifi_count(config: DatasetConfig, engine: Engine | None = None) -> None:
-    """Run Wi-Fi connection count pipeline."""
-    logger.info("Starting Wi-Fi pipeline", dataset_id=config.dataset_id)
-
-    table_name = config.table or DEFAULT_TABLE_NAME
-    key_fields = config.key_fields or DEFAULT_KEY_FIELDS
-
+def _stream_chunksize(config: DatasetConfig) -> int | None:
+    raw_value = config.extra.get("chunksize")
+    if raw_value is None:
+        return None
     try:
-        raw_path = download_if_needed(config)
-        sha256 = calculate_sha256(raw_path)
+        chunksize = int(raw_value)
+    except (TypeError, ValueError) as exc:
+        msg = f"chunksize must be a positive integer: {raw_value!r}"
+        raise WifiPipelineError(msg) from exc
+    if chunksize <= 0:
+        msg = f"chunksize must be a positive integer: {raw_value!r}"
+        raise WifiPipelineError(msg)
+    return chunksize
 
-        if is_already_loaded(config, raw_path, sha256):
-            return
 
-        normalized_path = _normalized_path(config, raw_path)
-        normalized_df = normalize_csv(raw_path, normalized_path)
-        prepared_df = _prepare_wifi_dataframe(normalized_df, config)
+def _load_method(config: DatasetConfig) -> str | None:
+    raw_value = config.extra.get("load_method")
+    return str(raw_value) if raw_value is not None else None
 
-        db_engine = engine or get_engine()
-        upsert_dataframe(prepared_df, table_name, key_fields, db_engine)
 
-        mark_loaded(
+def _skip_unchanged(config: DatasetConfig) -> bool | None:
+    raw_value = config.extra.get("skip_unchanged")
+    if raw_value is None:
+        return None
+    if not isinstance(raw_value, bool):
+        msg = f"skip_unchanged must be true or false: {raw_value!r}"
+        raise WifiPipelineError(msg)
+    return raw_value
+
+
+def normalizer_version(config: DatasetConfig) -> str:
+    """Return the version of the normalized output produced for ``config``.
+
+    Combines :data:`WIFI_NORMALIZER_VERSION` with a digest of the dataset
+    settings that shape the normalized file, so editing ``extra.columns`` or
+    ``extra.row_filter`` also invalidates the cached output.
+    """
+    settings = {
+        "output_format": config.output_format,
+        **{name: config.extra.get(name) for name in _NORMALIZER_SETTINGS},
+    }
+    encoded = json.dumps(settings, sort_keys=True, ensure_ascii=False, default=str)
+    digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:12]
+    return f"{WIFI_NORMALIZER_VERSION}-{digest}"
+
+
+@dataclass(frozen=True)
+class WifiRawFile:
+    """A downloaded Wi-Fi CSV that still has to be loaded.
+
+    ``normalized_path`` points at a normalized file that an earlier run wrote
+    for the same raw content and normalizer version, if any.
+    """
+
+    raw_path: Path
+    sha256: str
+    normalized_path: Path | None = None
+
+
+@dataclass(frozen=True)
+class WifiNormalized:
+    """Output of :func:`normalize_wifi`, ready for :func:`load_wifi`.
+
+    ``frame`` holds the prepared rows; in streaming mode, or when an earlier
+    run's file is ``reused``, it is ``None`` and the normalized file at
+    ``normalized_path`` is read back in ``chunksize`` rows.
+    """
+
+    raw: WifiRawFile
+    normalized_path: Path
+    frame: DataFrame | None = None
+    chunksize: int | None = None
+    reused: bool = False
+
+
+def fetch_wifi_raw(
+    config: DatasetConfig,
+    *,
+    verify: bool = False,
+) -> WifiRawFile | None:
+    """Download the raw CSV and return it, or ``None`` when already loaded.
+
+    Stage records kept by the meta store decide where the run resumes: a file
+    loaded with the current :func:`normalizer_version` is skipped, and a
+    normalized file left by a run whose load failed is handed on for reuse.
+    """
+    raw_path = download_if_needed(config)
+    sha256 = calculate_sha256(raw_path, use_cache=False) if verify else None
+    version = normalizer_version(config)
+    if is_already_loaded(config, raw_path, sha256):
+        # The load record matches the file, so its digest is the file's digest
+        # and the stat-signature fast path does not have to be undone here.
+        stored = sha256 or get_loaded_sha256(config, raw_path)
+        stages = (
+            completed_stages(
+                config,
+                raw_path,
+                sha256=stored,
+                normalizer_version=version,
+            )
+            if stored
+            else None
+        )
+        # Files loaded before stages were recorded have no stage records at all.
+        if stored is None or stages is None or "load" in stages:
+            return None
+        digest = stored
+    else:
+        digest = sha256 or calculate_sha256(raw_path)
+        stages = completed_stages(
             config,
             raw_path,
-            sha256,
-            processed_at=datetime.datetime.now(tz=datetime.UTC),
+            sha256=digest,
+            normalizer_version=version,
+        )
+        if stages and "load" in stages:
+            # The load record no longer matches, so the stage records are stale.
+            stages = {}
+    if not stages:
+        mark_stage_complete(config, raw_path, "download", sha256=digest)
+
+    normalized = (stages or {}).get("normalize")
+    return WifiRawFile(
+        raw_path=raw_path,
+        sha256=digest,
+        normalized_path=Path(normalized["artifact"]) if normalized else None,
+    )
+
+
+def normalize_wifi(config: DatasetConfig, raw: WifiRawFile) -> WifiNormalized:
+    """Normalize the raw CSV and prepare the rows for loading.
+
+    When ``extra.columns`` is set only those columns are parsed (every column
+    is kept otherwise), and rows failing ``extra.row_filter`` are dropped while
+    reading. A normalized file reused from an earlier run is returned as is.
+    Only touches files, so it can run in a worker process.
+    """
+    chunksize = _stream_chunksize(config)
+    if raw.normalized_path is not None:
+        logger.info(
+            "Reusing normalized file",
+            dataset_id=config.dataset_id,
+            normalized_path=str(raw.normalized_path),
+        )
+        return WifiNormalized(
+            raw=raw,
+            normalized_path=raw.normalized_path,
+            chunksize=chunksize or DEFAULT_CHUNKSIZE,
+            reused=True,
+        )
+
+    normalized_path = _normalized_path(config, raw.raw_path)
+    projection, source_names = _source_projection(config, raw.raw_path)
+    schema = get_schema(config)
+    key_fields = config.key_fields or DEFAULT_KEY_FIELDS
+    # Key columns are post-processed by _prepare_wifi_dataframe before typing.
+    source_schema = (
+        schema.renamed(
+            {
+                name: normalize_column_name(source)
+                for name, source in source_names.items()
+            },
+            exclude=key_fields,
+        )
+        if schema
+        else None
+    )
+    if chunksize is not None:
+        summary = normalize_csv_chunked(
+            raw.raw_path,
+            normalized_path,
+            chunksize=chunksize,
+            output_format=config.output_format,
+            usecols=projection.columns,
+            row_filter=projection.predicates,
+            schema=source_schema,
+        )
+        return WifiNormalized(
+            raw=raw,
+            normalized_path=summary.dest,
+            chunksize=chunksize,
+        )
+
+    normalized_df = normalize_csv(
+        raw.raw_path,
+        normalized_path,
+        output_format=config.output_format,
+        dtype=(
+            schema.read_dtypes(_column_candidates(config), exclude=key_fields)
+            if schema
+            else None
+        ),
+        usecols=projection.columns,
+        row_filter=projection.predicates,
+        schema=source_schema,
+    )
+    frame = _prepare_wifi_dataframe(normalized_df, config)
+    if schema is not None:
+        # Types the key and derived columns added by _prepare_wifi_dataframe.
+        apply_schema(frame, schema)
+    return WifiNormalized(
+        raw=raw,
+        normalized_path=normalized_dest(normalized_path, config.output_format),
+        frame=frame,
+    )
+
+
+def _iter_prepared_frames(
+    config: DatasetConfig,
+    normalized: WifiNormalized,
+) -> Iterator[DataFrame]:
+    schema = get_schema(config)
+    if normalized.frame is not None:
+        frames: Iterable[DataFrame] = [normalized.frame]
+    elif normalized.chunksize is not None:
+        frames = (
+            apply_schema(_prepare_wifi_dataframe(chunk, config), schema)
+            if schema
+            else _prepare_wifi_dataframe(chunk, config)
+            for chunk in iter_normalized_chunks(
+                normalized.normalized_path,
+                chunksize=normalized.chunksize,
+            )
         )
+    else:
+        frames = []
+    for frame in frames:
+        # Dates go to the database as datetime.date, as before typing.
+        yield with_python_dates(frame, schema) if schema else frame
+
+
+def load_wifi(
+    config: DatasetConfig,
+    normalized: WifiNormalized,
+    engine: Engine | None = None,
+) -> None:
+    """UPSERT the prepared rows and record the raw file as loaded.
+
+    The normalize stage is recorded here, before writing to the database, so
+    that a failed load can reuse the normalized file on the next run.
+    """
+    table_name = config.table or DEFAULT_TABLE_NAME
+    key_fields = config.key_fields or DEFAULT_KEY_FIELDS
+    raw = normalized.raw
+    version = normalizer_version(config)
+    if not normalized.reused:
+        mark_stage_complete(
+            config,
+            raw.raw_path,
+            "normalize",
+            sha256=raw.sha256,
+            normalizer_version=version,
+            artifact=normalized.normalized_path,
+        )
+    db_engine = engine or get_engine()
+    for frame in _iter_prepared_frames(config, normalized):
+        upsert_dataframe(
+            frame,
+            table_name,
+            key_fields,
+            db_engine,
+            method=_load_method(config),
+            skip_unchanged=_skip_unchanged(config),
+        )
+
+    mark_loaded(
+        config,
+        raw.raw_path,
+        raw.sha256,
+        processed_at=datetime.datetime.now(tz=datetime.UTC),
+    )
+    mark_stage_complete(
+        config,
+        raw.raw_path,
+        "load",
+        sha256=raw.sha256,
+        normalizer_version=version,
+    )
+
+
+def run_wifi_count(
+    config: DatasetConfig,
+    engine: Engine | None = None,
+    *,
+    verify: bool = False,
+) -> None:
+    """Run Wi-Fi connection count pipeline.
+
+    Args:
+        config: Dataset configuration.
+        engine: Optional SQLAlchemy engine; created from config when omitted.
+            With ``chunksize`` in the dataset's ``extra`` settings, the file is
+            normalized and upserted in chunks of that many rows, and
+            ``load_method`` (``insert`` / ``copy`` / ``auto``) selects how rows
+            are written to the database. ``skip_unchanged`` leaves rows whose
+            ``row_hash`` already matches untouched.
+        verify: Rehash the raw file instead of trusting the stored stat
+            signature when checking whether it was already loaded.
+
+    """
+    logger.info("Starting Wi-Fi pipeline", dataset_id=config.dataset_id)
+
+    try:
+        raw = fetch_wifi_raw(config, verify=verify)
+        if raw is None:
+            return
+        load_wifi(config, normalize_wifi(config, raw), engine)
         logger.info("Wi-Fi pipeline completed", dataset_id=config.dataset_id)
-    except (DownloadError, NormalizationError, UpsertError, WifiPipelineError) as exc:
+    except (
+        DownloadError,
+        NormalizationError,
+        ProjectionError,
+        SchemaError,
+        UpsertError,
+        WifiPipelineError,
+    ) as exc:
         logger.error(
             "Wi-Fi pipeline failed", dataset_id=config.dataset_id, error=str(exc),
         )
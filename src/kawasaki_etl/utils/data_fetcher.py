@@ -5,16 +5,15 @@ from __future__ import annotations
 # pyright: reportUnknownMemberType=false, reportAttributeAccessIssue=false
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Self, cast
+from typing import TYPE_CHECKING, Any, Self
 
-import httpx
 from kawasaki_etl.base import BaseComponent
+from kawasaki_etl.utils.http_client import get_http_client
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
 HTTPClient = Any
-httpx = cast("Any", httpx)
 
 TimeoutType = float | None
 
@@ -31,17 +30,15 @@ class WebDataFetcher(BaseComponent):
         """Initialize the fetcher.
 
         Args:
-            client: Optional pre-configured ``httpx.Client`` to reuse.
+            client: Optional pre-configured ``httpx.Client`` to reuse. When omitted,
+                the process-wide pooled client is used and never closed here.
             default_timeout: Default timeout applied when a per-call override is not
                 provided.
 
         """
         super().__init__()
-        self._client: HTTPClient = client or httpx.Client(
-            follow_redirects=True,
-            timeout=default_timeout,
-        )  # type: ignore[reportAttributeAccessIssue]
-        self._owns_client = client is None
+        self._client: HTTPClient = client or get_http_client()
+        self._uses_shared_client = client is None
         self._default_timeout: TimeoutType = default_timeout
 
     def _resolve_timeout(
@@ -162,14 +159,20 @@ class WebDataFetcher(BaseComponent):
         return target_path
 
     def close(self, *, force: bool = False) -> None:
-        """Close the internal HTTP client.
+        """Close the HTTP client provided by the caller when ``force`` is set.
+
+        The shared pooled client is always left open, even with ``force``; it is
+        closed once at application shutdown via
+        :func:`kawasaki_etl.utils.http_client.close_http_client`.
 
         Args:
             force: When ``True``, close the client even if it was provided by the
-                caller.
+                caller. Has no effect on the shared pooled client.
 
         """
-        if (self._owns_client or force) and not self._client.is_closed:
+        if self._uses_shared_client:
+            return
+        if force and not self._client.is_closed:
             self._client.close()
 
     @property
@@ -192,7 +195,7 @@ def fetch_json(
     timeout: TimeoutType = 10.0,
     headers: Mapping[str, str] | None = None,
 ) -> Any:
-    """Fetch JSON content with a short-lived client."""
+    """Fetch JSON content using the shared pooled client."""
     with WebDataFetcher(default_timeout=timeout) as fetcher:
         return fetcher.fetch_json(url, headers=headers)
 
@@ -0,0 +1,81 @@
+"""Process-wide pooled HTTP client shared by downloaders and fetchers."""
+
+from __future__ import annotations
+
+import threading
+from importlib.util import find_spec
+from typing import Any
+
+import httpx
+
+from kawasaki_etl.utils.logger import LoggerProtocol, get_logger
+from kawasaki_etl.utils.settings import get_download_settings
+
+logger: LoggerProtocol = get_logger(__name__)
+
+_client_lock = threading.Lock()
+_shared_client: httpx.Client | None = None
+
+
+def _accept_encoding() -> str:
+    encodings = ["gzip", "deflate"]
+    # httpx only decodes brotli bodies when one of these packages is present.
+    if find_spec("brotli") is not None or find_spec("brotlicffi") is not None:
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+def _http2_enabled(requested: bool) -> bool:
+    if not requested:
+        return False
+    if find_spec("h2") is None:
+        logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def _client_options() -> dict[str, Any]:
+    settings = get_download_settings()
+    return {
+        "timeout": settings.download_timeout,
+        "follow_redirects": True,
+        "http2": _http2_enabled(settings.http_http2),
+        "headers": {"Accept-Encoding": _accept_encoding()},
+        "limits": httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+    }
+
+
+def get_http_client() -> httpx.Client:
+    """Return the process-wide pooled ``httpx.Client``, creating it on first use."""
+    global _shared_client  # noqa: PLW0603
+    with _client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = httpx.Client(**_client_options())
+            logger.debug("Created shared HTTP client")
+        return _shared_client
+
+
+def build_async_http_client() -> httpx.AsyncClient:
+    """Return a new ``httpx.AsyncClient`` configured like the shared client.
+
+    Async clients are bound to the event loop that uses them, so callers own the
+    returned client and must close it.
+    """
+    return httpx.AsyncClient(**_client_options())
+
+
+def close_http_client() -> None:
+    """Close the shared client if it was created. Safe to call repeatedly."""
+    global _shared_client  # noqa: PLW0603
+    with _client_lock:
+        if _shared_client is not None and not _shared_client.is_closed:
+            _shared_client.close()
+            logger.debug("Closed shared HTTP client")
+        _shared_client = None
+
+
+__all__ = ["build_async_http_client", "close_http_client", "get_http_client"]
@@ -153,6 +153,140 @@ class InterfaceSettings(BaseSettings):
         return InterfaceType(self.interface_type)
 
 
+class DownloadSettings(BaseSettings):
+    """HTTP download configuration settings."""
+
+    instance: ClassVar[Any] = None
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    download_max_concurrency: int = Field(
+        default=8,
+        description="Maximum number of concurrent downloads across all hosts",
+        ge=1,
+    )
+
+    download_per_host_concurrency: int = Field(
+        default=4,
+        description="Maximum number of concurrent downloads against a single host",
+        ge=1,
+    )
+
+    download_timeout: float = Field(
+        default=30.0,
+        description="Timeout in seconds applied to each download request",
+        gt=0,
+    )
+
+    http_max_connections: int = Field(
+        default=20,
+        description="Maximum number of pooled HTTP connections",
+        ge=1,
+    )
+
+    http_max_keepalive_connections: int = Field(
+        default=10,
+        description="Maximum number of idle keep-alive connections kept in the pool",
+        ge=0,
+    )
+
+    http_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle keep-alive connection stays in the pool",
+        ge=0,
+    )
+
+    http_http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 when the optional 'h2' package is installed",
+    )
+
+
+class DBLoadSettings(BaseSettings):
+    """Database load (UPSERT) batching settings."""
+
+    instance: ClassVar[Any] = None
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    upsert_batch_size: int = Field(
+        default=1000,
+        description="Rows per INSERT ... ON CONFLICT statement",
+        ge=1,
+    )
+
+    upsert_batches_per_transaction: int = Field(
+        default=10,
+        description="Statements executed before each commit",
+        ge=1,
+    )
+
+    upsert_commit_per_batch: bool = Field(
+        default=False,
+        description="Commit after every statement (overrides batches per transaction)",
+    )
+
+    upsert_log_progress: bool = Field(
+        default=False,
+        description="Log loaded rows and rows per second after each commit",
+    )
+
+    upsert_method: Literal["auto", "insert", "copy"] = Field(
+        default="auto",
+        description="Load strategy: batched INSERT, PostgreSQL COPY staging, or auto",
+    )
+
+    upsert_copy_threshold: int = Field(
+        default=50_000,
+        description="Row count from which 'auto' switches to COPY on PostgreSQL",
+        ge=1,
+    )
+
+    upsert_skip_unchanged: bool = Field(
+        default=False,
+        description="Skip rows whose row_hash column already matches",
+    )
+
+    upsert_reflection_ttl: float | None = Field(
+        default=None,
+        description="Seconds a reflected table is reused (unset: whole process)",
+        ge=0,
+    )
+
+
+class MetaStoreSettings(BaseSettings):
+    """Metadata store backend settings."""
+
+    instance: ClassVar[Any] = None
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    meta_backend: Literal["json", "sqlite"] = Field(
+        default="json",
+        description="Where processed-file metadata is stored (json files or sqlite)",
+    )
+
+    meta_db_path: str | None = Field(
+        default=None,
+        description="SQLite database path; defaults to data/meta/meta.sqlite3",
+    )
+
+
 def get_settings() -> LoggingSettings:
     """Get the global settings instance.
 
@@ -191,3 +325,63 @@ def reset_interface_settings() -> None:
     This is mainly useful for testing.
     """
     InterfaceSettings.instance = None
+
+
+def get_download_settings() -> DownloadSettings:
+    """Get the global download settings instance.
+
+    Returns:
+        DownloadSettings: The download settings instance
+
+    """
+    if DownloadSettings.instance is None:
+        DownloadSettings.instance = DownloadSettings()
+    return DownloadSettings.instance
+
+
+def reset_download_settings() -> None:
+    """Reset the global download settings instance.
+
+    This is mainly useful for testing.
+    """
+    DownloadSettings.instance = None
+
+
+def get_meta_store_settings() -> MetaStoreSettings:
+    """Get the global metadata store settings instance.
+
+    Returns:
+        MetaStoreSettings: The metadata store settings instance
+
+    """
+    if MetaStoreSettings.instance is None:
+        MetaStoreSettings.instance = MetaStoreSettings()
+    return MetaStoreSettings.instance
+
+
+def reset_meta_store_settings() -> None:
+    """Reset the global metadata store settings instance.
+
+    This is mainly useful for testing.
+    """
+    MetaStoreSettings.instance = None
+
+
+def get_db_load_settings() -> DBLoadSettings:
+    """Get the global database load settings instance.
+
+    Returns:
+        DBLoadSettings: The database load settings instance
+
+    """
+    if DBLoadSettings.instance is None:
+        DBLoadSettings.instance = DBLoadSettings()
+    return DBLoadSettings.instance
+
+
+def reset_db_load_settings() -> None:
+    """Reset the global database load settings instance.
+
+    This is mainly useful for testing.
+    """
+    DBLoadSettings.instance = None
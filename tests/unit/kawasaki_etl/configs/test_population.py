@@ -0,0 +1,65 @@
+"""Tests for the data-file-backed population catalog."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from kawasaki_etl.configs import POPULATION_2024_PAGES, population
+from kawasaki_etl.models import OpenDataResource
+
+
+def test_population_catalog_indexes_pages_by_year_and_identifier() -> None:
+    """Year and identifier lookups return the same shared page objects."""
+    assert population.population_years() == ("2022", "2023", "2024", "2025")
+    assert population.get_population_pages(2024) is POPULATION_2024_PAGES
+
+    page = POPULATION_2024_PAGES[0]
+    assert population.get_population_page(page.identifier) is page
+    assert all(
+        resource.url.startswith("https://") and resource.filename
+        for page in POPULATION_2024_PAGES
+        for resource in page.resources
+    )
+
+
+def test_population_catalog_unknown_entries_raise() -> None:
+    """Unknown years and identifiers raise PopulationCatalogError."""
+    with pytest.raises(population.PopulationCatalogError):
+        population.get_population_pages(1999)
+    with pytest.raises(population.PopulationCatalogError):
+        population.get_population_page("missing")
+    with pytest.raises(AttributeError):
+        _ = population.POPULATION_1999_PAGES
+
+
+def test_open_data_resource_precomputes_filename() -> None:
+    """The filename is derived from the URL once and records use slots."""
+    resource = OpenDataResource(
+        title="sample",
+        url="https://example.com/files/data.csv?download=1",
+        file_format="csv",
+        updated_at="2025-01-01",
+    )
+
+    assert resource.filename == "data.csv"
+    assert not hasattr(resource, "__dict__")
+
+
+def test_configs_import_does_not_load_population_catalog() -> None:
+    """Importing kawasaki_etl.configs leaves the catalog unloaded."""
+    code = (
+        "import kawasaki_etl.configs\n"
+        "from kawasaki_etl.configs import population\n"
+        "print(population._catalog is None)\n"
+    )
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))},
+    )
+
+    assert completed.stdout.strip() == "True"
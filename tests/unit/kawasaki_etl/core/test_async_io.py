@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from kawasaki_etl.core.async_io import (
+    DownloadJob,
+    download_files,
+    download_files_async,
+)
+from kawasaki_etl.core.io import DownloadError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _run(
+    jobs: list[DownloadJob],
+    handler: httpx.AsyncBaseTransport,
+    **kwargs: int,
+) -> list[Path]:
+    async def _inner() -> list[Path]:
+        async with httpx.AsyncClient(transport=handler) as client:
+            return await download_files_async(jobs, client=client, **kwargs)
+
+    return asyncio.run(_inner())
+
+
+def test_download_files_preserves_order(tmp_path: Path) -> None:
+    """入力順に保存先パスが返り、内容が書き込まれることを確認."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # Finish later URLs first to make ordering bugs visible.
+        delay = 0.02 if request.url.path.endswith("a.csv") else 0.0
+        await asyncio.sleep(delay)
+        return httpx.Response(200, content=request.url.path.encode())
+
+    jobs = [
+        DownloadJob(url="https://example.com/a.csv", dest=tmp_path / "a.csv"),
+        DownloadJob(url="https://example.com/b.csv", dest=tmp_path / "sub" / "b.csv"),
+    ]
+
+    outputs = _run(jobs, httpx.MockTransport(handler))
+
+    assert outputs == [job.dest for job in jobs]
+    assert (tmp_path / "a.csv").read_bytes() == b"/a.csv"
+    assert (tmp_path / "sub" / "b.csv").read_bytes() == b"/b.csv"
+
+
+def test_download_files_respects_per_host_limit(tmp_path: Path) -> None:
+    """同一ホストへの同時接続数が上限を超えないことを確認."""
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, content=b"ok")
+
+    jobs = [
+        DownloadJob(
+            url=f"https://{host}/{index}.csv",
+            dest=tmp_path / host / f"{index}.csv",
+        )
+        for host in ("a.example.com", "b.example.com")
+        for index in range(6)
+    ]
+
+    _run(jobs, httpx.MockTransport(handler), max_concurrency=8, per_host_limit=2)
+
+    assert peak == {"a.example.com": 2, "b.example.com": 2}
+
+
+def test_download_files_raises_and_cleans_up(tmp_path: Path) -> None:
+    """HTTP エラー時に DownloadError を送出し、ファイルを残さない."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("missing.csv"):
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"ok")
+
+    jobs = [
+        DownloadJob(url="https://example.com/missing.csv", dest=tmp_path / "m.csv"),
+        DownloadJob(url="https://example.com/ok.csv", dest=tmp_path / "ok.csv"),
+    ]
+
+    with pytest.raises(DownloadError):
+        _run(jobs, httpx.MockTransport(handler))
+
+    assert not (tmp_path / "m.csv").exists()
+
+
+def test_download_files_rejects_truncated_body(tmp_path: Path) -> None:
+    """Content-Length より短い応答は DownloadError とし、ファイルを残さない."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+        return httpx.Response(200, headers={"Content-Length": "10"}, content=b"abc")
+
+    jobs = [DownloadJob(url="https://example.com/a.csv", dest=tmp_path / "a.csv")]
+
+    with pytest.raises(DownloadError, match="Content-Length"):
+        _run(jobs, httpx.MockTransport(handler))
+
+    assert not (tmp_path / "a.csv").exists()
+    assert not (tmp_path / "a.csv.sha256.json").exists()
+
+
+def test_download_files_resumes_part_and_records_validators(tmp_path: Path) -> None:
+    """検証子付きの .part は Range で再開し、完了後に ETag を保存すること."""
+    dest = tmp_path / "a.csv"
+    (tmp_path / "a.csv.part").write_bytes(b"abc")
+    (tmp_path / "a.csv.part.validator").write_text('"v1"', encoding="utf-8")
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            206,
+            headers={"Content-Range": "bytes 3-5/6", "ETag": '"v1"'},
+            content=b"def",
+        )
+
+    _run(
+        [DownloadJob(url="https://example.com/a.csv", dest=dest)],
+        httpx.MockTransport(handler),
+    )
+
+    assert requests[0].headers["Range"] == "bytes=3-"
+    assert requests[0].headers["If-Range"] == '"v1"'
+    assert dest.read_bytes() == b"abcdef"
+    assert not (tmp_path / "a.csv.part").exists()
+    assert json.loads((tmp_path / "a.csv.http.json").read_text()) == {"etag": '"v1"'}
+
+
+def test_download_files_revalidates_existing_file(tmp_path: Path) -> None:
+    """保存済みの ETag で条件付き GET を送り、304 なら既存ファイルを残すこと."""
+    dest = tmp_path / "a.csv"
+    dest.write_bytes(b"old")
+    (tmp_path / "a.csv.http.json").write_text(json.dumps({"etag": '"v1"'}))
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(304)
+
+    outputs = _run(
+        [DownloadJob(url="https://example.com/a.csv", dest=dest)],
+        httpx.MockTransport(handler),
+    )
+
+    assert outputs == [dest]
+    assert requests[0].headers["If-None-Match"] == '"v1"'
+    assert dest.read_bytes() == b"old"
+
+
+def test_download_files_rejects_running_event_loop(tmp_path: Path) -> None:
+    """イベントループ内から同期版を呼ぶと DownloadError になること."""
+    jobs = [DownloadJob(url="https://example.com/a.csv", dest=tmp_path / "a.csv")]
+
+    async def _inner() -> None:
+        download_files(jobs)
+
+    with pytest.raises(DownloadError, match="download_files_async"):
+        asyncio.run(_inner())
+
+
+def test_download_files_empty_jobs() -> None:
+    """ジョブが空の場合は通信せずに空リストを返す."""
+    assert asyncio.run(download_files_async([])) == []
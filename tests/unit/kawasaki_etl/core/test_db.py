@@ -1,12 +1,48 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pandas as pd
 import pytest
-from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, text
+from sqlalchemy import (
+    Column,
+    Date,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    event,
+    text,
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import SQLAlchemyError
 
 from kawasaki_etl.core import db
-from kawasaki_etl.core.db import DBConnectionError, get_engine, upsert_dataframe
+from kawasaki_etl.core.db import (
+    DBConfig,
+    DBConfigError,
+    DBConnectionError,
+    UpsertError,
+    dispose_engines,
+    get_engine,
+    invalidate_table_cache,
+    upsert_dataframe,
+)
+from kawasaki_etl.utils.settings import reset_db_load_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from sqlalchemy.engine import Engine
+
+
+@pytest.fixture(autouse=True)
+def _clear_engine_cache() -> Iterator[None]:
+    dispose_engines()
+    yield
+    dispose_engines()
 
 
 def test_get_engine_prefers_env(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -18,6 +54,148 @@ def test_get_engine_prefers_env(monkeypatch: pytest.MonkeyPatch) -> None:
         assert conn.execute(text("select 1")).scalar() == 1
 
 
+def test_get_engine_reuses_cached_engine_without_probe(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """同じ alias と DSN では Engine を再利用し、疎通確認を繰り返さないこと."""
+    monkeypatch.setenv("DB_DSN", "sqlite+pysqlite:///:memory:")
+    first = get_engine()
+    probes: list[str] = []
+    event.listen(
+        first,
+        "before_cursor_execute",
+        lambda *args, **_kwargs: probes.append(args[2]),  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
+    )
+
+    second = get_engine()
+
+    assert second is first
+    assert probes == []
+
+    dispose_engines()
+    assert get_engine() is not first
+
+
+def test_get_engine_caches_per_dsn(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    """DSN が変わると別の Engine が生成されること."""
+    monkeypatch.setenv("DB_DSN", f"sqlite+pysqlite:///{tmp_path / 'a.db'}")
+    first = get_engine()
+    monkeypatch.setenv("DB_DSN", f"sqlite+pysqlite:///{tmp_path / 'b.db'}")
+
+    assert get_engine() is not first
+
+
+def test_get_engine_applies_pool_options_from_yaml(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    """db.yml のプール設定が create_engine に渡されること."""
+    config_path = tmp_path / "db.yml"
+    config_path.write_text(
+        "default:\n"
+        f"  dsn: sqlite+pysqlite:///{tmp_path / 'pool.db'}\n"
+        "  pool_size: 3\n"
+        "  max_overflow: 2\n"
+        "  pool_recycle: 600\n",
+        encoding="utf-8",
+    )
+    monkeypatch.delenv("DB_DSN", raising=False)
+
+    engine = get_engine(config_path=config_path)
+
+    assert engine.pool.size() == 3  # pyright: ignore[reportAttributeAccessIssue]
+    assert engine.pool._max_overflow == 2  # pyright: ignore[reportAttributeAccessIssue, reportPrivateUsage]  # noqa: SLF001
+    assert engine.pool._recycle == 600  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert engine.pool._pre_ping is False  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+def test_get_engine_enables_pre_ping_only_when_configured(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    """pool_pre_ping は db.yml で指定した alias だけで有効になること."""
+    config_path = tmp_path / "db.yml"
+    config_path.write_text(
+        "default:\n"
+        f"  dsn: sqlite+pysqlite:///{tmp_path / 'ping.db'}\n"
+        "  pool_pre_ping: true\n",
+        encoding="utf-8",
+    )
+    invalid_path = tmp_path / "invalid.yml"
+    invalid_path.write_text(
+        "default:\n"
+        f"  dsn: sqlite+pysqlite:///{tmp_path / 'invalid.db'}\n"
+        "  pool_pre_ping: sometimes\n",
+        encoding="utf-8",
+    )
+    monkeypatch.delenv("DB_DSN", raising=False)
+
+    engine = get_engine(config_path=config_path)
+
+    assert engine.pool._pre_ping is True  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    with pytest.raises(DBConfigError, match="pool_pre_ping"):
+        get_engine(config_path=invalid_path)
+
+
+def test_get_engine_parses_yaml_only_when_it_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    """db.yml は変更されたときだけ読み直され、キャッシュ済みの Engine を返すこと."""
+    config_path = tmp_path / "db.yml"
+    config_path.write_text(
+        f"default:\n  dsn: sqlite+pysqlite:///{tmp_path / 'a.db'}\n",
+        encoding="utf-8",
+    )
+    monkeypatch.delenv("DB_DSN", raising=False)
+    parsed: list[object] = []
+    original_safe_load = db.yaml.safe_load
+
+    def _safe_load(stream: str) -> object:
+        parsed.append(stream)
+        return original_safe_load(stream)
+
+    monkeypatch.setattr(db.yaml, "safe_load", _safe_load)
+
+    first = get_engine(config_path=config_path)
+    assert get_engine(config_path=config_path) is first
+    assert len(parsed) == 1
+
+    config_path.write_text(
+        f"default:\n  dsn: sqlite+pysqlite:///{tmp_path / 'other.db'}\n",
+        encoding="utf-8",
+    )
+
+    assert get_engine(config_path=config_path) is not first
+    assert len(parsed) == 2
+
+
+def test_db_config_statement_timeout_extends_options() -> None:
+    """statement_timeout_ms が既存の options に追記されること."""
+    config = DBConfig.from_mapping(
+        {
+            "host": "localhost",
+            "port": 5432,
+            "user": "user",
+            "password": "secret",
+            "database": "example",
+            "options": "-c search_path=public",
+            "statement_timeout_ms": 5000,
+        },
+    )
+
+    options = config.engine_options(config.as_dsn())
+
+    assert options["connect_args"] == {
+        "options": "-c search_path=public -c statement_timeout=5000",
+    }
+
+
+def test_db_config_rejects_non_integer_pool_option() -> None:
+    """プール設定が整数でない場合は DBConfigError になること."""
+    with pytest.raises(DBConfigError):
+        DBConfig.from_mapping({"dsn": "sqlite://", "pool_size": "many"})
+
+
 def test_get_engine_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     """接続失敗時にわかりやすい例外が出ること."""
     class DummyError(SQLAlchemyError): ...
@@ -153,3 +331,405 @@ def test_upsert_dataframe_updates_existing() -> None:
         ("2020-01-01", "A", 50),
         ("2020-01-02", "A", 5),
     ]
+
+
+def test_upsert_dataframe_batches_statements_and_transactions() -> None:
+    """行数・トランザクション単位でバッチ分割して UPSERT されること."""
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    metadata = MetaData()
+    Table(
+        "wifi_access_counts",
+        metadata,
+        Column("date", String, nullable=False),
+        Column("spot_id", String, nullable=False),
+        Column("connection_count", Integer, nullable=False),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE UNIQUE INDEX idx_wifi_pk ON wifi_access_counts(date, spot_id)",
+            ),
+        )
+
+    inserts: list[str] = []
+    commits: list[bool] = []
+
+    def _before_cursor_execute(
+        _conn: object,
+        _cursor: object,
+        statement: str,
+        _parameters: object,
+        _context: object,
+        _executemany: object,
+    ) -> None:
+        if statement.startswith("INSERT"):
+            inserts.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "commit", lambda _conn: commits.append(True))
+
+    df = pd.DataFrame(
+        {
+            "date": [f"2020-01-{day:02d}" for day in range(1, 26)],
+            "spot_id": ["A"] * 25,
+            "connection_count": list(range(25)),
+        },
+    )
+    upsert_dataframe(
+        df,
+        "wifi_access_counts",
+        ["date", "spot_id"],
+        engine,
+        batch_size=10,
+        batches_per_transaction=2,
+    )
+
+    assert len(inserts) == 3
+    assert len(commits) == 2
+    with engine.connect() as conn:
+        count = conn.execute(text("select count(*) from wifi_access_counts")).scalar()
+    assert count == 25
+
+
+def _reflection_probe_engine() -> tuple[Engine, list[str]]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE wifi_access_counts ("
+                "date TEXT NOT NULL, spot_id TEXT NOT NULL, connection_count INTEGER, "
+                "PRIMARY KEY (date, spot_id))",
+            ),
+        )
+    reflections: list[str] = []
+
+    def _before_cursor_execute(
+        _conn: object,
+        _cursor: object,
+        statement: str,
+        _parameters: object,
+        _context: object,
+        _executemany: object,
+    ) -> None:
+        if statement.startswith("PRAGMA") and "table_info" in statement:
+            reflections.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    return engine, reflections
+
+
+def _one_row(count: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        [{"date": "2020-01-01", "spot_id": "A", "connection_count": count}],
+    )
+
+
+def test_upsert_dataframe_reflects_table_once_per_engine() -> None:
+    """同じ Engine への繰り返しロードではテーブル定義を 1 回だけ取得すること."""
+    engine, reflections = _reflection_probe_engine()
+    invalidate_table_cache()
+
+    upsert_dataframe(_one_row(1), "wifi_access_counts", ["date", "spot_id"], engine)
+    first = len(reflections)
+    upsert_dataframe(_one_row(2), "wifi_access_counts", ["date", "spot_id"], engine)
+
+    assert first > 0
+    assert len(reflections) == first
+
+    invalidate_table_cache(engine, "wifi_access_counts")
+    upsert_dataframe(_one_row(3), "wifi_access_counts", ["date", "spot_id"], engine)
+
+    assert len(reflections) == 2 * first
+    with engine.connect() as conn:
+        count = conn.execute(text("select connection_count from wifi_access_counts"))
+        assert count.scalar() == 3
+
+
+def test_upsert_dataframe_reflection_ttl_expires(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """UPSERT_REFLECTION_TTL を過ぎたキャッシュは再取得されること."""
+    monkeypatch.setenv("UPSERT_REFLECTION_TTL", "0")
+    reset_db_load_settings()
+    engine, reflections = _reflection_probe_engine()
+    try:
+        upsert_dataframe(_one_row(1), "wifi_access_counts", ["date", "spot_id"], engine)
+        first = len(reflections)
+        upsert_dataframe(_one_row(2), "wifi_access_counts", ["date", "spot_id"], engine)
+    finally:
+        reset_db_load_settings()
+
+    assert len(reflections) == 2 * first
+
+
+def test_upsert_dataframe_reflects_again_when_key_column_is_missing() -> None:
+    """キャッシュにないキー列が追加された場合は再取得してロードできること."""
+    engine, _ = _reflection_probe_engine()
+    upsert_dataframe(_one_row(1), "wifi_access_counts", ["date", "spot_id"], engine)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE wifi_access_counts ADD COLUMN area TEXT"))
+        conn.execute(
+            text(
+                "CREATE UNIQUE INDEX wifi_area ON wifi_access_counts "
+                "(date, spot_id, area)",
+            ),
+        )
+
+    summary = upsert_dataframe(
+        _one_row(2).assign(spot_id="B", area="north"),
+        "wifi_access_counts",
+        ["date", "spot_id", "area"],
+        engine,
+    )
+
+    assert summary.rows == 1
+
+
+def _hashed_wifi_engine() -> Engine:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE wifi_access_counts ("
+                "date TEXT NOT NULL, spot_id TEXT NOT NULL, connection_count INTEGER, "
+                "row_hash TEXT, PRIMARY KEY (date, spot_id))",
+            ),
+        )
+    return engine
+
+
+def test_upsert_dataframe_skip_unchanged_reports_counts() -> None:
+    """変更のない行は書き込まれず、新規・更新・変更なしの件数が返ること."""
+    engine = _hashed_wifi_engine()
+    initial = pd.DataFrame(
+        {
+            "date": ["2020-01-01", "2020-01-02"],
+            "spot_id": ["A", "A"],
+            "connection_count": [10, 5],
+        },
+    )
+    first = upsert_dataframe(
+        initial, "wifi_access_counts", ["date", "spot_id"], engine, skip_unchanged=True,
+    )
+    assert (first.inserted, first.updated, first.unchanged) == (2, 0, 0)
+
+    written: list[int] = []
+
+    def _before_cursor_execute(
+        _conn: object,
+        _cursor: object,
+        statement: str,
+        parameters: tuple[object, ...],
+        _context: object,
+        _executemany: object,
+    ) -> None:
+        if statement.startswith("INSERT"):
+            # Four bound values per row: date, spot_id, connection_count, row_hash.
+            written.append(len(parameters) // 4)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    rerun = pd.DataFrame(
+        {
+            "date": ["2020-01-01", "2020-01-02", "2020-01-03"],
+            "spot_id": ["A", "A", "A"],
+            "connection_count": [10, 7, 3],
+        },
+    )
+    summary = upsert_dataframe(
+        rerun, "wifi_access_counts", ["date", "spot_id"], engine, skip_unchanged=True,
+    )
+
+    assert (summary.inserted, summary.updated, summary.unchanged) == (1, 1, 1)
+    assert summary.rows == 2
+    assert sum(written) == 2
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("select date, connection_count from wifi_access_counts order by date"),
+        ).all()
+    assert [tuple(row) for row in rows] == [
+        ("2020-01-01", 10),
+        ("2020-01-02", 7),
+        ("2020-01-03", 3),
+    ]
+
+
+def test_upsert_dataframe_skip_unchanged_matches_datetime64_keys_to_dates() -> None:
+    """datetime64 のキーが DATE 列から読んだキーと一致し、再実行で書き込まれないこと."""
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    metadata = MetaData()
+    Table(
+        "wifi_access_counts",
+        metadata,
+        Column("date", Date, primary_key=True),
+        Column("spot_id", String, primary_key=True),
+        Column("connection_count", Integer),
+        Column("row_hash", String),
+    )
+    metadata.create_all(engine)
+    frame = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2020-01-01", "2020-01-02"]).astype(
+                "datetime64[s]",
+            ),
+            "spot_id": ["A", "A"],
+            "connection_count": [10, 5],
+        },
+    )
+
+    first = upsert_dataframe(
+        frame,
+        "wifi_access_counts",
+        ["date", "spot_id"],
+        engine,
+        skip_unchanged=True,
+    )
+    rerun = upsert_dataframe(
+        frame,
+        "wifi_access_counts",
+        ["date", "spot_id"],
+        engine,
+        skip_unchanged=True,
+    )
+
+    assert (first.inserted, first.updated, first.unchanged) == (2, 0, 0)
+    assert (rerun.inserted, rerun.updated, rerun.unchanged) == (0, 0, 2)
+    assert rerun.rows == 0
+
+
+def test_upsert_dataframe_skip_unchanged_ignores_numeric_dtype() -> None:
+    """同じ値なら int と float の表現の違いで行が書き換えられないこと."""
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    metadata = MetaData()
+    Table(
+        "wifi_access_counts",
+        metadata,
+        Column("date", String, primary_key=True),
+        Column("spot_id", String, primary_key=True),
+        Column("connection_count", Integer),
+        Column("row_hash", String),
+    )
+    metadata.create_all(engine)
+    as_int = pd.DataFrame(
+        {"date": ["2020-01-01"], "spot_id": ["A"], "connection_count": [5]},
+    )
+    as_float = as_int.astype({"connection_count": "float64"})
+
+    upsert_dataframe(
+        as_int,
+        "wifi_access_counts",
+        ["date", "spot_id"],
+        engine,
+        skip_unchanged=True,
+    )
+    rerun = upsert_dataframe(
+        as_float,
+        "wifi_access_counts",
+        ["date", "spot_id"],
+        engine,
+        skip_unchanged=True,
+    )
+
+    assert (rerun.inserted, rerun.updated, rerun.unchanged) == (0, 0, 1)
+
+
+def test_upsert_dataframe_skip_unchanged_requires_row_hash_column() -> None:
+    """row_hash 列がないテーブルでは UpsertError になること."""
+    engine, _ = _reflection_probe_engine()
+
+    with pytest.raises(UpsertError, match="row_hash"):
+        upsert_dataframe(
+            _one_row(1),
+            "wifi_access_counts",
+            ["date", "spot_id"],
+            engine,
+            skip_unchanged=True,
+        )
+
+
+def test_only_changed_upsert_compiles_is_distinct_from() -> None:
+    """ON CONFLICT DO UPDATE に row_hash の IS DISTINCT FROM 条件が付くこと."""
+    table = Table(
+        "wifi_access_counts",
+        MetaData(),
+        Column("date", String, primary_key=True),
+        Column("spot_id", String, primary_key=True),
+        Column("connection_count", Integer),
+        Column("row_hash", String),
+    )
+    statement = db._apply_on_conflict(  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        postgresql.insert(table).values(
+            date="2020-01-01", spot_id="A", connection_count=1, row_hash="x",
+        ),
+        table,
+        ["date", "spot_id"],
+        only_changed=True,
+    )
+
+    sql = str(statement.compile(dialect=postgresql.dialect()))  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+
+    assert (
+        "WHERE wifi_access_counts.row_hash IS DISTINCT FROM excluded.row_hash"
+    ) in sql
+
+
+def test_rows_per_statement_respects_bind_parameter_limit() -> None:
+    """SQLite のバインド変数上限を超えないよう 1 文あたりの行数が制限されること."""
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    limit = db._MAX_BIND_PARAMETERS["sqlite"]  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    rows = db._rows_per_statement(engine, 10**9, 7)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    assert rows == limit // 7
+
+
+def test_resolve_load_method_uses_copy_only_on_postgresql(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """COPY は PostgreSQL(psycopg) かつ閾値以上の場合にのみ自動選択されること."""
+    monkeypatch.setenv("UPSERT_COPY_THRESHOLD", "100")
+    reset_db_load_settings()
+    try:
+        pg_engine = create_engine("postgresql+psycopg://user:pw@localhost/db")
+        sqlite_engine = create_engine("sqlite+pysqlite:///:memory:")
+        resolve = db._resolve_load_method  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+        assert resolve(None, pg_engine, 100) == "copy"
+        assert resolve(None, pg_engine, 99) == "insert"
+        assert resolve("insert", pg_engine, 10**6) == "insert"
+        assert resolve("copy", pg_engine, 1) == "copy"
+        assert resolve(None, sqlite_engine, 10**6) == "insert"
+        with pytest.raises(UpsertError, match="COPY loading requires PostgreSQL"):
+            resolve("copy", sqlite_engine, 1)
+        with pytest.raises(UpsertError, match="Unsupported load method"):
+            resolve("bulk", sqlite_engine, 1)
+    finally:
+        reset_db_load_settings()
+
+
+def test_build_upsert_from_staging_compiles_insert_select() -> None:
+    """ステージングテーブルから INSERT ... SELECT ... ON CONFLICT を生成すること."""
+    metadata = MetaData()
+    table = Table(
+        "wifi_access_counts",
+        metadata,
+        Column("date", String, nullable=False),
+        Column("spot_id", String, nullable=False),
+        Column("connection_count", Integer, nullable=False),
+    )
+    staging = db._build_staging_table(table, ["date", "spot_id", "connection_count"])  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    stmt = db._build_upsert_from_staging(table, staging, ["date", "spot_id"])  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith(
+        "INSERT INTO wifi_access_counts (date, spot_id, connection_count)",
+    )
+    assert f"FROM {staging.name}" in sql
+    assert (
+        "ON CONFLICT (date, spot_id) DO UPDATE SET "
+        "connection_count = excluded.connection_count"
+    ) in sql
+
+    with pytest.raises(UpsertError, match="not present"):
+        db._build_staging_table(table, ["date", "unknown"])  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
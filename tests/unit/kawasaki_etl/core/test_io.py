@@ -1,27 +1,39 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import TYPE_CHECKING, Self
 
+import httpx
 import pytest
 
 import kawasaki_etl.core.io as io_module
+from kawasaki_etl.core import meta_store
 from kawasaki_etl.core.io import (
     DownloadError,
     download_file,
     download_if_needed,
     get_raw_path,
+    part_path_for,
 )
+from kawasaki_etl.core.meta_store import get_digest_sidecar_path
 from kawasaki_etl.core.models import DatasetConfig
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator, Mapping
     from pathlib import Path
 
 
 class _DummyStream:
-    def __init__(self, body: bytes, status_code: int = 200) -> None:
+    def __init__(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         self.body = body
         self.status_code = status_code
+        self.headers = headers or {}
 
     def iter_bytes(self, chunk_size: int) -> Iterator[bytes]:
         _ = chunk_size
@@ -35,30 +47,46 @@ class _DummyStream:
 
 
 class _DummyClient:
-    def __init__(self, body: bytes, status_code: int = 200) -> None:
+    def __init__(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         self.body = body
         self.status_code = status_code
-
-    def __enter__(self) -> Self:
-        return self
-
-    def __exit__(self, exc_type: object, exc: object, tb: object) -> bool:
-        return False
-
-    def stream(self, method: str, url: str) -> _DummyStream:
+        self.headers = headers
+        self.request_headers: list[Mapping[str, str] | None] = []
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+    ) -> _DummyStream:
         _ = (method, url)
-        return _DummyStream(self.body, self.status_code)
+        self.request_headers.append(headers)
+        return _DummyStream(self.body, self.status_code, self.headers)
 
 
 def _patch_http_client(
     monkeypatch: pytest.MonkeyPatch,
     body: bytes,
     status_code: int = 200,
-) -> None:
-    def dummy_factory(*_args: object, **_kwargs: object) -> _DummyClient:
-        return _DummyClient(body, status_code)
+    headers: dict[str, str] | None = None,
+) -> _DummyClient:
+    client = _DummyClient(body, status_code, headers)
+
+    def dummy_factory() -> _DummyClient:
+        return client
+
+    monkeypatch.setattr(io_module, "get_http_client", dummy_factory)
+    return client
+
 
-    monkeypatch.setattr(io_module.httpx, "Client", dummy_factory)
+@pytest.fixture(autouse=True)
+def _isolate_meta_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(meta_store, "META_DATA_DIR", tmp_path / "meta")
 
 
 @pytest.fixture
@@ -115,6 +143,117 @@ def test_download_file_raises_on_error(
     assert not dest.exists()
 
 
+def _patch_transport(
+    monkeypatch: pytest.MonkeyPatch,
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> None:
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(io_module, "get_http_client", lambda: client)
+
+
+def test_download_file_resumes_partial_file(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """.part が残っていれば Range リクエストで続きから取得する."""
+    body = b"0123456789"
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        start = int(request.headers["Range"].removeprefix("bytes=").rstrip("-"))
+        return httpx.Response(
+            206,
+            content=body[start:],
+            headers={"Content-Range": f"bytes {start}-9/{len(body)}"},
+        )
+
+    _patch_transport(monkeypatch, handler)
+    dest = tmp_path / "data.zip"
+    part_path = part_path_for(dest)
+    part_path.write_bytes(body[:4])
+    part_path.with_name(f"{part_path.name}.validator").write_text('"v1"')
+
+    download_file("https://example.com/data.zip", dest)
+
+    assert dest.read_bytes() == body
+    assert not part_path_for(dest).exists()
+    assert json.loads(get_digest_sidecar_path(dest).read_text())["sha256"] == (
+        hashlib.sha256(body).hexdigest()
+    )
+    assert seen[0].headers["Range"] == "bytes=4-"
+    assert seen[0].headers["Accept-Encoding"] == "identity"
+    assert seen[0].headers["If-Range"] == '"v1"'
+
+
+def test_download_file_restarts_part_without_validator(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """検証子のない .part は再開せず、最初から取得し直すこと."""
+    body = b"0123456789"
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if "Range" in request.headers:
+            return httpx.Response(
+                206,
+                content=b"CHANGED",
+                headers={"Content-Range": "bytes 4-10/11"},
+            )
+        return httpx.Response(200, content=body)
+
+    _patch_transport(monkeypatch, handler)
+    dest = tmp_path / "data.zip"
+    part_path_for(dest).write_bytes(b"old-")
+
+    download_file("https://example.com/data.zip", dest)
+
+    assert dest.read_bytes() == body
+    assert "Range" not in seen[0].headers
+    assert json.loads(get_digest_sidecar_path(dest).read_text())["sha256"] == (
+        hashlib.sha256(body).hexdigest()
+    )
+
+
+def test_download_file_restarts_when_range_ignored(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """サーバーが Range を無視して 200 を返した場合は最初から書き直す."""
+    _patch_transport(monkeypatch, lambda _request: httpx.Response(200, content=b"full"))
+    dest = tmp_path / "data.csv"
+    part_path_for(dest).write_bytes(b"stale-partial")
+
+    download_file("https://example.com/data.csv", dest)
+
+    assert dest.read_bytes() == b"full"
+
+
+def test_download_file_keeps_part_on_short_body(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Content-Length に満たない場合は dest を作らず .part を残す."""
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=b"abc",
+            headers={"Content-Length": "10"},
+        )
+
+    _patch_transport(monkeypatch, handler)
+    dest = tmp_path / "data.pdf"
+
+    with pytest.raises(DownloadError):
+        download_file("https://example.com/data.pdf", dest)
+
+    assert not dest.exists()
+    assert part_path_for(dest).read_bytes() == b"abc"
+
+
 def test_download_if_needed_downloads_when_missing(
     sample_dataset: DatasetConfig,
     monkeypatch: pytest.MonkeyPatch,
@@ -130,23 +269,96 @@ def test_download_if_needed_downloads_when_missing(
     assert dest_path.read_bytes() == b"data"
 
 
-def test_download_if_needed_skips_existing(
+def test_download_if_needed_skips_existing_without_revalidation(
     sample_dataset: DatasetConfig,
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
-    """既存ファイルがあれば再ダウンロードされない."""
+    """revalidate=False の場合は既存ファイルがあれば通信しない."""
     monkeypatch.setattr(io_module, "RAW_DATA_DIR", tmp_path)
 
-    def _raise_download(*_args: object, **_kwargs: object) -> _DummyClient:
+    def _raise_download() -> _DummyClient:
         raise AssertionError("should not download")
 
-    monkeypatch.setattr(io_module.httpx, "Client", _raise_download)
+    monkeypatch.setattr(io_module, "get_http_client", _raise_download)
     existing_path = get_raw_path(sample_dataset)
     existing_path.parent.mkdir(parents=True, exist_ok=True)
     existing_path.write_bytes(b"cached")
 
-    dest_path = download_if_needed(sample_dataset)
+    dest_path = download_if_needed(sample_dataset, revalidate=False)
 
     assert dest_path == existing_path
     assert dest_path.read_bytes() == b"cached"
+
+
+def test_download_if_needed_keeps_existing_on_not_modified(
+    sample_dataset: DatasetConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """304 応答では既存ファイルを保持し、保存済みの検証子を送る."""
+    monkeypatch.setattr(io_module, "RAW_DATA_DIR", tmp_path)
+    existing_path = get_raw_path(sample_dataset)
+    existing_path.parent.mkdir(parents=True, exist_ok=True)
+    existing_path.write_bytes(b"cached")
+    meta_store.save_http_validators(
+        sample_dataset,
+        existing_path,
+        etag='"v1"',
+        last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+    )
+    client = _patch_http_client(monkeypatch, body=b"", status_code=304)
+
+    dest_path = download_if_needed(sample_dataset)
+
+    assert dest_path.read_bytes() == b"cached"
+    assert client.request_headers == [
+        {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        },
+    ]
+
+
+def test_download_if_needed_replaces_modified_file(
+    sample_dataset: DatasetConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """更新されていれば再取得し、新しい検証子を保存する."""
+    monkeypatch.setattr(io_module, "RAW_DATA_DIR", tmp_path)
+    existing_path = get_raw_path(sample_dataset)
+    existing_path.parent.mkdir(parents=True, exist_ok=True)
+    existing_path.write_bytes(b"old")
+    client = _patch_http_client(
+        monkeypatch,
+        body=b"new",
+        headers={"ETag": '"v2"'},
+    )
+
+    dest_path = download_if_needed(sample_dataset)
+
+    assert dest_path.read_bytes() == b"new"
+    sent = client.request_headers[0]
+    assert sent is not None
+    assert "If-Modified-Since" in sent
+    assert meta_store.get_http_validators(sample_dataset, dest_path) == {
+        "etag": '"v2"',
+    }
+
+
+def test_download_if_needed_uses_existing_when_revalidation_fails(
+    sample_dataset: DatasetConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """再検証に失敗しても既存ファイルがあればそれを使う."""
+    monkeypatch.setattr(io_module, "RAW_DATA_DIR", tmp_path)
+    existing_path = get_raw_path(sample_dataset)
+    existing_path.parent.mkdir(parents=True, exist_ok=True)
+    existing_path.write_bytes(b"cached")
+    _patch_http_client(monkeypatch, body=b"oops", status_code=503)
+
+    dest_path = download_if_needed(sample_dataset)
+
+    assert dest_path.read_bytes() == b"cached"
@@ -4,17 +4,27 @@ import datetime
 import json
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
 from kawasaki_etl.core import meta_store
+from kawasaki_etl.core.meta_index import close_meta_index
 from kawasaki_etl.core.meta_store import (
+    are_loaded,
     calculate_sha256,
+    completed_stages,
     get_meta_path,
+    import_json_meta,
     is_already_loaded,
     mark_loaded,
+    mark_stage_complete,
 )
 from kawasaki_etl.core.models import DatasetConfig
+from kawasaki_etl.utils.settings import reset_meta_store_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 @pytest.fixture
@@ -52,6 +62,20 @@ def test_calculate_sha256_returns_digest(tmp_path: Path) -> None:
     assert digest == "b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9"
 
 
+def test_calculate_sha256_uses_matching_sidecar(tmp_path: Path) -> None:
+    """A digest sidecar is trusted only while size and mtime still match."""
+    target = tmp_path / "file.bin"
+    target.write_bytes(b"hello world")
+    meta_store.write_digest_sidecar(target, "cached-digest")
+
+    assert calculate_sha256(target) == "cached-digest"
+    assert calculate_sha256(target, use_cache=False) != "cached-digest"
+
+    target.write_bytes(b"hello world, again")
+
+    assert calculate_sha256(target) != "cached-digest"
+
+
 def test_mark_loaded_and_is_already_loaded(
     sample_dataset: DatasetConfig,
     monkeypatch: pytest.MonkeyPatch,
@@ -100,3 +124,225 @@ def test_is_already_loaded_returns_false_for_corrupted_meta(
     meta_path.write_text("{not-json", encoding="utf-8")
 
     assert is_already_loaded(sample_dataset, raw_path, "ignored") is False
+
+
+def test_mark_loaded_preserves_http_validators(
+    sample_dataset: DatasetConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """HTTP validators saved at download time survive mark_loaded."""
+    monkeypatch.setattr(meta_store, "META_DATA_DIR", tmp_path / "meta")
+
+    raw_path = tmp_path / "wifi.csv"
+    raw_path.write_text("data", encoding="utf-8")
+    meta_store.save_http_validators(
+        sample_dataset,
+        raw_path,
+        etag='"abc"',
+        last_modified=None,
+    )
+
+    mark_loaded(sample_dataset, raw_path, "sha", datetime.datetime.now(tz=datetime.UTC))
+
+    assert meta_store.get_http_validators(sample_dataset, raw_path) == {
+        "etag": '"abc"',
+    }
+    assert is_already_loaded(sample_dataset, raw_path, "sha") is True
+
+
+def test_stage_records_resume_and_invalidate(
+    sample_dataset: DatasetConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Stages are reused per raw digest and normalizer version, in order."""
+    monkeypatch.setattr(meta_store, "META_DATA_DIR", tmp_path / "meta")
+    raw_path = tmp_path / "wifi.csv"
+    raw_path.write_text("data", encoding="utf-8")
+    artifact = tmp_path / "wifi_normalized.csv"
+    artifact.write_text("col\n1\n", encoding="utf-8")
+
+    assert completed_stages(
+        sample_dataset,
+        raw_path,
+        sha256="sha",
+        normalizer_version="v1",
+    ) is None
+
+    mark_stage_complete(sample_dataset, raw_path, "download", sha256="sha")
+    mark_stage_complete(
+        sample_dataset,
+        raw_path,
+        "normalize",
+        sha256="sha",
+        normalizer_version="v1",
+        artifact=artifact,
+    )
+    mark_loaded(sample_dataset, raw_path, "sha", datetime.datetime.now(tz=datetime.UTC))
+    mark_stage_complete(
+        sample_dataset,
+        raw_path,
+        "load",
+        sha256="sha",
+        normalizer_version="v1",
+    )
+
+    def _stages(sha256: str, version: str) -> list[str]:
+        stages = completed_stages(
+            sample_dataset,
+            raw_path,
+            sha256=sha256,
+            normalizer_version=version,
+        )
+        assert stages is not None
+        return list(stages)
+
+    assert _stages("sha", "v1") == ["download", "normalize", "load"]
+    assert _stages("sha", "v2") == ["download"]
+    assert _stages("other", "v1") == []
+
+    mark_stage_complete(
+        sample_dataset,
+        raw_path,
+        "normalize",
+        sha256="sha",
+        normalizer_version="v1",
+        artifact=artifact,
+    )
+    assert _stages("sha", "v1") == ["download", "normalize"]
+
+    artifact.unlink()
+    assert _stages("sha", "v1") == ["download"]
+    with pytest.raises(meta_store.MetaStoreError):
+        mark_stage_complete(sample_dataset, raw_path, "publish", sha256="sha")
+
+
+def test_is_already_loaded_fast_path_skips_hashing(
+    sample_dataset: DatasetConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """A matching stat signature short-circuits hashing; a change forces it."""
+    monkeypatch.setattr(meta_store, "META_DATA_DIR", tmp_path / "meta")
+
+    raw_path = tmp_path / "wifi.csv"
+    raw_path.write_text("data", encoding="utf-8")
+    sha256 = calculate_sha256(raw_path)
+    loaded_at = datetime.datetime.now(tz=datetime.UTC)
+    mark_loaded(sample_dataset, raw_path, sha256, loaded_at)
+
+    hashed: list[Path] = []
+
+    def _tracking_sha256(path: Path, *_args: object, **_kwargs: object) -> str:
+        hashed.append(path)
+        return calculate_sha256(path, use_cache=False)
+
+    monkeypatch.setattr(meta_store, "calculate_sha256", _tracking_sha256)
+
+    assert is_already_loaded(sample_dataset, raw_path) is True
+    assert hashed == []
+
+    raw_path.write_text("changed", encoding="utf-8")
+
+    assert is_already_loaded(sample_dataset, raw_path) is False
+    assert hashed == [raw_path]
+
+
+@pytest.fixture
+def sqlite_backend(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> Iterator[Path]:
+    """Switch the meta store to the SQLite backend under ``tmp_path``."""
+    meta_dir = tmp_path / "meta"
+    monkeypatch.setattr(meta_store, "META_DATA_DIR", meta_dir)
+    monkeypatch.setenv("META_BACKEND", "sqlite")
+    monkeypatch.delenv("META_DB_PATH", raising=False)
+    reset_meta_store_settings()
+    yield meta_dir
+    close_meta_index()
+    reset_meta_store_settings()
+
+
+def test_sqlite_backend_round_trip(
+    sample_dataset: DatasetConfig,
+    sqlite_backend: Path,
+    tmp_path: Path,
+) -> None:
+    """The SQLite backend answers the same API without writing JSON files."""
+    raw_path = tmp_path / "wifi.csv"
+    raw_path.write_text("data", encoding="utf-8")
+    sha256 = calculate_sha256(raw_path)
+
+    assert is_already_loaded(sample_dataset, raw_path, sha256) is False
+
+    mark_loaded(sample_dataset, raw_path, sha256, "2024-01-01T00:00:00+00:00")
+
+    assert is_already_loaded(sample_dataset, raw_path, sha256) is True
+    assert is_already_loaded(sample_dataset, raw_path) is True
+    assert (sqlite_backend / meta_store.META_DB_FILENAME).exists()
+    assert not get_meta_path(sample_dataset, raw_path).exists()
+
+
+def test_are_loaded_batches_lookup(
+    sample_dataset: DatasetConfig,
+    sqlite_backend: Path,
+    tmp_path: Path,
+) -> None:
+    """are_loaded reports each dataset, treating missing files as unloaded."""
+    _ = sqlite_backend
+    other = DatasetConfig(
+        dataset_id="wifi_2021_count",
+        category="connectivity",
+        url="https://example.com/data/wifi2021.csv",
+        type="csv",
+    )
+    loaded_path = tmp_path / "wifi.csv"
+    loaded_path.write_text("data", encoding="utf-8")
+    mark_loaded(
+        sample_dataset,
+        loaded_path,
+        calculate_sha256(loaded_path),
+        "2024-01-01T00:00:00+00:00",
+    )
+
+    result = are_loaded(
+        [sample_dataset, other],
+        raw_paths={
+            sample_dataset.dataset_id: loaded_path,
+            other.dataset_id: tmp_path / "missing.csv",
+        },
+    )
+
+    assert result == {"wifi_2020_count": True, "wifi_2021_count": False}
+
+
+def test_import_json_meta_populates_sqlite(
+    sample_dataset: DatasetConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Existing JSON records become visible once imported into SQLite."""
+    meta_dir = tmp_path / "meta"
+    monkeypatch.setattr(meta_store, "META_DATA_DIR", meta_dir)
+    monkeypatch.setenv("META_BACKEND", "json")
+    reset_meta_store_settings()
+
+    raw_path = tmp_path / "wifi.csv"
+    raw_path.write_text("data", encoding="utf-8")
+    sha256 = calculate_sha256(raw_path)
+    mark_loaded(sample_dataset, raw_path, sha256, "2024-01-01T00:00:00+00:00")
+    corrupted = meta_dir / "connectivity" / "broken" / "x.csv.json"
+    corrupted.parent.mkdir(parents=True)
+    corrupted.write_text("{not json", encoding="utf-8")
+
+    monkeypatch.setenv("META_BACKEND", "sqlite")
+    reset_meta_store_settings()
+    try:
+        assert is_already_loaded(sample_dataset, raw_path, sha256) is False
+        assert import_json_meta() == 1
+        assert is_already_loaded(sample_dataset, raw_path, sha256) is True
+    finally:
+        close_meta_index()
+        reset_meta_store_settings()
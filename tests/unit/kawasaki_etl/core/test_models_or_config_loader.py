@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import os
 import textwrap
 from typing import TYPE_CHECKING
 
 import pytest
 
+from kawasaki_etl.core import models
 from kawasaki_etl.core.models import (
+    DatasetConfig,
     DatasetConfigError,
+    clear_dataset_config_cache,
+    compiled_cache_path,
     get_dataset_config,
     load_dataset_configs,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 
@@ -102,6 +108,49 @@ class TestDatasetConfigLoader:
         with pytest.raises(DatasetConfigError, match="missing required fields"):
             load_dataset_configs(config_path)
 
+    def test_output_format_is_parsed_and_validated(self, tmp_path: Path) -> None:
+        """output_format defaults to csv, accepts parquet and rejects others."""
+        config_path = tmp_path / "datasets.yml"
+        config_path.write_text(
+            textwrap.dedent(
+                """
+                datasets:
+                  default_format:
+                    category: wifi
+                    url: https://example.com/a.csv
+                    type: csv
+                  parquet_format:
+                    category: wifi
+                    url: https://example.com/b.csv
+                    type: csv
+                    output_format: Parquet
+                """,
+            ),
+            encoding="utf-8",
+        )
+
+        configs = load_dataset_configs(config_path)
+
+        assert configs["default_format"].output_format == "csv"
+        assert configs["parquet_format"].output_format == "parquet"
+
+        config_path.write_text(
+            textwrap.dedent(
+                """
+                datasets:
+                  broken:
+                    category: wifi
+                    url: https://example.com/a.csv
+                    type: csv
+                    output_format: xlsx
+                """,
+            ),
+            encoding="utf-8",
+        )
+
+        with pytest.raises(DatasetConfigError, match="invalid output_format"):
+            load_dataset_configs(config_path)
+
     def test_get_dataset_config_handles_unknown_id(self, tmp_path: Path) -> None:
         """Unknown dataset IDs raise DatasetConfigError."""
         config_path = tmp_path / "datasets.yml"
@@ -120,3 +169,78 @@ class TestDatasetConfigLoader:
 
         with pytest.raises(DatasetConfigError, match="not defined"):
             get_dataset_config("unknown", config_path)
+
+
+_CACHE_YAML = """
+datasets:
+  wifi_counts:
+    category: connectivity
+    url: https://example.com/wifi.csv
+    type: csv
+"""
+
+
+class TestDatasetConfigCache:
+    """Verify parsed configs are cached and invalidated on change."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Iterator[None]:
+        clear_dataset_config_cache()
+        yield
+        clear_dataset_config_cache()
+
+    def test_reuses_parsed_configs_until_file_changes(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The YAML is parsed once and re-parsed after the file changes."""
+        config_path = tmp_path / "datasets.yml"
+        config_path.write_text(_CACHE_YAML, encoding="utf-8")
+        parse_calls: list[Path] = []
+        original_parse = models._parse_dataset_configs  # noqa: SLF001
+
+        def _counting_parse(path: Path) -> dict[str, DatasetConfig]:
+            parse_calls.append(path)
+            return original_parse(path)
+
+        monkeypatch.setattr(models, "_parse_dataset_configs", _counting_parse)
+
+        first = load_dataset_configs(config_path)
+        second = get_dataset_config("wifi_counts", config_path)
+        assert len(parse_calls) == 1
+        assert second is first["wifi_counts"]
+
+        config_path.write_text(
+            _CACHE_YAML.replace("connectivity", "network"),
+            encoding="utf-8",
+        )
+        os.utime(config_path, ns=(0, config_path.stat().st_mtime_ns + 1_000_000))
+
+        assert load_dataset_configs(config_path)["wifi_counts"].category == "network"
+        assert len(parse_calls) == 2
+
+    def test_compiled_cache_is_used_by_new_processes(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The compiled cache file is written and read back without parsing YAML."""
+        config_path = tmp_path / "datasets.yml"
+        config_path.write_text(_CACHE_YAML, encoding="utf-8")
+
+        load_dataset_configs(config_path, compiled_cache=True)
+        assert compiled_cache_path(config_path).exists()
+
+        clear_dataset_config_cache()
+
+        def _fail_parse(path: Path) -> dict[str, DatasetConfig]:
+            msg = f"YAML should not be parsed: {path}"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(models, "_parse_dataset_configs", _fail_parse)
+        monkeypatch.setenv(models.COMPILED_CACHE_ENV, "1")
+
+        configs = load_dataset_configs(config_path)
+
+        assert configs["wifi_counts"].url == "https://example.com/wifi.csv"
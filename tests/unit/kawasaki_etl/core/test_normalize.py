@@ -7,14 +7,20 @@ import pandas as pd
 import pandas.testing as tm
 import pytest
 
+from kawasaki_etl.core import normalize as normalize_module
 from kawasaki_etl.core.normalize import (
     NormalizationError,
+    detect_encoding,
     detect_encoding_and_read_csv,
     normalize_column_name,
     normalize_csv,
+    normalize_csv_chunked,
     normalize_excel,
     normalize_zip_of_csv,
+    read_normalized,
 )
+from kawasaki_etl.core.projection import RowPredicate, filter_rows
+from kawasaki_etl.core.schema import DatasetSchema, apply_schema, frame_memory
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -36,6 +42,94 @@ def test_detect_encoding_and_read_csv_cp932_success(tmp_path: Path) -> None:
     tm.assert_frame_equal(loaded, df)  # pyright: ignore[reportUnknownMemberType]
 
 
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        ("ID,名称\n1,テスト\n".encode(), "utf-8"),
+        (b"\xef\xbb\xbf" + "ID,名称\n".encode(), "utf-8-sig"),
+        ("ID,名称\n1,川崎市の観光\n".encode("cp932"), "cp932"),
+        ("ID,名称\n1,川崎市の観光\n".encode("euc_jp"), "euc_jp"),
+    ],
+)
+def test_detect_encoding_from_sample(
+    tmp_path: Path,
+    payload: bytes,
+    expected: str,
+) -> None:
+    """BOM・UTF-8 厳格デコード・リードバイト統計でエンコーディングを判定すること."""
+    csv_path = tmp_path / "sample.csv"
+    csv_path.write_bytes(payload)
+
+    assert detect_encoding(csv_path) == expected
+
+
+def test_detect_encoding_and_read_csv_parses_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """判定できた場合は検出したエンコーディングで 1 回だけ読み込むこと."""
+    df = _sample_dataframe()
+    csv_path = tmp_path / "sample_cp932.csv"
+    df.to_csv(csv_path, index=False, encoding="cp932")  # pyright: ignore[reportUnknownMemberType]
+
+    calls: list[str] = []
+    original = pd.read_csv
+
+    def _tracking_read_csv(*args: object, **kwargs: object) -> pd.DataFrame:
+        calls.append(str(kwargs["encoding"]))
+        return original(*args, **kwargs)  # pyright: ignore[reportUnknownVariableType, reportArgumentType, reportCallIssue]
+
+    monkeypatch.setattr(pd, "read_csv", _tracking_read_csv)
+
+    loaded = detect_encoding_and_read_csv(csv_path)
+
+    tm.assert_frame_equal(loaded, df)  # pyright: ignore[reportUnknownMemberType]
+    assert calls == ["cp932"]
+
+
+def test_detect_encoding_and_read_csv_falls_back_after_sample(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """サンプル外で判定が外れた場合は残りの候補で再試行すること."""
+    monkeypatch.setattr(normalize_module, "DETECTION_SAMPLE_SIZE", 16)
+    csv_path = tmp_path / "late_cp932.csv"
+    ascii_head = "ID,name\n" + "".join(f"{i},row\n" for i in range(10))
+    csv_path.write_bytes(ascii_head.encode() + "99,テスト\n".encode("cp932"))
+
+    loaded = detect_encoding_and_read_csv(csv_path)
+
+    assert loaded["name"].iloc[-1] == "テスト"
+
+
+def test_detect_encoding_and_read_csv_skips_aliases_of_failed_encoding(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """判定が外れたエンコーディングの別名や BOM なしの utf-8-sig は再試行しないこと."""
+    monkeypatch.setattr(normalize_module, "DETECTION_SAMPLE_SIZE", 16)
+    csv_path = tmp_path / "late_cp932.csv"
+    ascii_head = "ID,name\n" + "".join(f"{i},row\n" for i in range(10))
+    csv_path.write_bytes(ascii_head.encode() + "99,テスト\n".encode("cp932"))
+
+    calls: list[str] = []
+    original = pd.read_csv
+
+    def _tracking_read_csv(*args: object, **kwargs: object) -> pd.DataFrame:
+        calls.append(str(kwargs["encoding"]))
+        return original(*args, **kwargs)  # pyright: ignore[reportUnknownVariableType, reportArgumentType, reportCallIssue]
+
+    monkeypatch.setattr(pd, "read_csv", _tracking_read_csv)
+
+    loaded = detect_encoding_and_read_csv(
+        csv_path,
+        encodings=["utf-8", "UTF8", "utf-8-sig", "cp932"],
+    )
+
+    assert loaded["name"].iloc[-1] == "テスト"
+    assert calls == ["utf-8", "cp932"]
+
+
 def test_detect_encoding_and_read_csv_raises_with_tried_encodings(
     tmp_path: Path,
 ) -> None:
@@ -68,6 +162,169 @@ def test_normalize_csv_creates_utf8_with_normalized_columns(tmp_path: Path) -> N
     ]
 
 
+def test_normalize_csv_chunked_streams_and_summarizes(tmp_path: Path) -> None:
+    """チャンク単位で UTF-8 に書き出し、行数・列・型のサマリを返すこと."""
+    raw_path = tmp_path / "raw.csv"
+    rows = [
+        f"{index},{index * 0.5 if index > 3 else index},名前{index}"
+        for index in range(7)
+    ]
+    raw_path.write_bytes(("ＩＤ, 値 ,名称\n" + "\n".join(rows) + "\n").encode("cp932"))  # noqa: RUF001
+    dest_path = tmp_path / "normalized" / "output.csv"
+
+    summary = normalize_csv_chunked(raw_path, dest_path, chunksize=3)
+
+    assert summary.dest == dest_path
+    assert summary.rows == 7
+    assert summary.columns == ("ID", "値", "名称")
+    assert summary.dtypes == {"ID": "int64", "値": "float64", "名称": "object"}
+    loaded = pd.read_csv(dest_path, encoding="utf-8")  # pyright: ignore[reportUnknownMemberType]
+    assert list(loaded.columns) == ["ID", "値", "名称"]
+    assert len(loaded) == 7
+    assert not dest_path.with_name("output.csv.part").exists()
+
+
+def test_normalize_csv_parquet_keeps_dtypes(tmp_path: Path) -> None:
+    """Parquet 出力では正規化時の型が保持され、読み込み時に優先されること."""
+    pytest.importorskip("pyarrow")
+    df = _sample_dataframe()
+    raw_path = tmp_path / "raw.csv"
+    df.to_csv(raw_path, index=False, encoding="cp932")  # pyright: ignore[reportUnknownMemberType]
+    dest_path = tmp_path / "normalized" / "output.csv"
+
+    normalized_df = normalize_csv(raw_path, dest_path, output_format="parquet")
+
+    parquet_path = dest_path.with_suffix(".parquet")
+    assert parquet_path.exists()
+    assert not dest_path.exists()
+    loaded = read_normalized(dest_path)
+    tm.assert_frame_equal(loaded, normalized_df)  # pyright: ignore[reportUnknownMemberType]
+
+
+def test_normalize_csv_chunked_parquet(tmp_path: Path) -> None:
+    """チャンク書き出しでも Parquet に 1 ファイルとして保存されること."""
+    pytest.importorskip("pyarrow")
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text(
+        "id,value\n" + "".join(f"{i},{i * 10}\n" for i in range(5)),
+        encoding="utf-8",
+    )
+
+    summary = normalize_csv_chunked(
+        raw_path,
+        tmp_path / "out.csv",
+        chunksize=2,
+        output_format="parquet",
+    )
+
+    assert summary.dest == tmp_path / "out.parquet"
+    loaded = read_normalized(summary.dest)
+    assert loaded["value"].tolist() == [0, 10, 20, 30, 40]
+    assert str(loaded["value"].dtype) == "int64"
+
+
+@pytest.mark.filterwarnings("error::pandas.errors.SettingWithCopyWarning")
+def test_normalize_csv_chunked_logs_summed_schema_memory(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """スキーマ適用前後のチャンクのメモリ量の合計を完了ログに出力すること."""
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text(
+        "name,value\n" + "".join(f"spot{i % 2},{i}\n" for i in range(5)),
+        encoding="utf-8",
+    )
+    schema = DatasetSchema(columns={"name": "category", "value": "int32"})
+    predicates = [RowPredicate.parse("value >= 1")]
+    expected_before = 0
+    expected_after = 0
+    for raw_chunk in pd.read_csv(raw_path, chunksize=2):  # pyright: ignore[reportUnknownMemberType]
+        chunk = filter_rows(raw_chunk, predicates)
+        expected_before += frame_memory(chunk)
+        expected_after += frame_memory(apply_schema(chunk, schema))
+    captured: dict[str, object] = {}
+
+    def fake_info(msg: str, **kwargs: object) -> None:
+        captured[msg] = kwargs
+
+    monkeypatch.setattr(normalize_module.logger, "info", fake_info)
+
+    summary = normalize_csv_chunked(
+        raw_path,
+        tmp_path / "out.csv",
+        chunksize=2,
+        row_filter=predicates,
+        schema=schema,
+    )
+
+    completed = captured["Normalized CSV written in chunks"]
+    assert completed == {
+        "source": str(raw_path),
+        "dest": str(summary.dest),
+        "rows": 4,
+        "chunksize": 2,
+        "output_format": "csv",
+        "memory_before": expected_before,
+        "memory_after": expected_after,
+    }
+    assert summary.dtypes == {"name": "category", "value": "Int32"}
+
+
+def test_normalize_csv_logs_schema_memory(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """ファイル全体を読む場合も型変換前後のメモリ量を完了ログに出力すること."""
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text("name,value\nspot0,1\nspot1,2\n", encoding="utf-8")
+    schema = DatasetSchema(columns={"name": "category", "value": "int32"})
+    captured: dict[str, object] = {}
+
+    def fake_info(msg: str, **kwargs: object) -> None:
+        captured[msg] = kwargs
+
+    monkeypatch.setattr(normalize_module.logger, "info", fake_info)
+
+    df = normalize_csv(raw_path, tmp_path / "out.csv", schema=schema)
+
+    completed = captured["Normalized CSV written"]
+    assert isinstance(completed, dict)
+    assert completed["memory_after"] == frame_memory(df)
+    assert completed["memory_before"] == frame_memory(pd.read_csv(raw_path))  # pyright: ignore[reportUnknownMemberType]
+    assert str(df["value"].dtype) == "Int32"
+
+
+def test_normalize_csv_chunked_parquet_widens_category_indices(tmp_path: Path) -> None:
+    """後のチャンクでカテゴリ数が増えても Parquet に書き出せること."""
+    pytest.importorskip("pyarrow")
+    raw_path = tmp_path / "raw.csv"
+    names = ["a", "b", *(f"spot{i}" for i in range(300))]
+    raw_path.write_text(
+        "name\n" + "".join(f"{name}\n" for name in names),
+        encoding="utf-8",
+    )
+
+    summary = normalize_csv_chunked(
+        raw_path,
+        tmp_path / "out.csv",
+        chunksize=2,
+        output_format="parquet",
+        schema=DatasetSchema(columns={"name": "category"}),
+    )
+
+    loaded = read_normalized(summary.dest)
+    assert loaded["name"].astype(str).tolist() == names
+
+
+def test_normalize_csv_rejects_unknown_output_format(tmp_path: Path) -> None:
+    """未対応の出力形式は NormalizationError になること."""
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text("a\n1\n", encoding="utf-8")
+
+    with pytest.raises(NormalizationError):
+        normalize_csv(raw_path, tmp_path / "out.csv", output_format="feather")
+
+
 def test_normalize_excel_outputs_per_sheet(tmp_path: Path) -> None:
     """Excelの各シートが個別のUTF-8 CSVに正規化されること."""
     excel_path = tmp_path / "workbook.xlsx"
@@ -91,6 +348,23 @@ def test_normalize_excel_outputs_per_sheet(tmp_path: Path) -> None:
         assert sheet in outputs
 
 
+def test_normalize_excel_dedupes_colliding_sheet_names(tmp_path: Path) -> None:
+    """サニタイズ後に同名になるシートも別々のファイルに書き出されること."""
+    excel_path = tmp_path / "workbook.xlsx"
+    with pd.ExcelWriter(excel_path) as writer:  # pyright: ignore[reportUnknownVariableType]
+        pd.DataFrame({"value": [1]}).to_excel(writer, sheet_name="集計", index=False)  # pyright: ignore[reportUnknownMemberType]
+        pd.DataFrame({"value": [2]}).to_excel(writer, sheet_name="明細", index=False)  # pyright: ignore[reportUnknownMemberType]
+
+    outputs = normalize_excel(excel_path, tmp_path / "normalized", max_workers=2)
+
+    assert outputs == {
+        "集計": tmp_path / "normalized" / "workbook__.csv",
+        "明細": tmp_path / "normalized" / "workbook___1.csv",
+    }
+    assert pd.read_csv(outputs["集計"])["value"].tolist() == [1]  # pyright: ignore[reportUnknownMemberType]
+    assert pd.read_csv(outputs["明細"])["value"].tolist() == [2]  # pyright: ignore[reportUnknownMemberType]
+
+
 def test_normalize_zip_of_csv_processes_members(tmp_path: Path) -> None:
     """ZIP内のCSVが重複名を回避しつつ正規化されること."""
     df = _sample_dataframe()
@@ -116,3 +390,118 @@ def test_normalize_zip_of_csv_processes_members(tmp_path: Path) -> None:
         loaded,
         normalize_csv(raw_csv, dest_dir / "expected.csv"),
     )
+
+
+def test_normalize_zip_of_csv_streams_members_without_temp_files(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """ZIP のメンバーを展開せずに読み込み、デコード失敗時は再試行すること."""
+    rows = pd.DataFrame({"name": ["abc"] * 50 + ["テスト"]})
+    zip_path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "late_cp932.csv",
+            rows.to_csv(index=False).encode("cp932"),  # pyright: ignore[reportUnknownMemberType]
+        )
+        archive.writestr("utf8.csv", rows.to_csv(index=False).encode("utf-8"))  # pyright: ignore[reportUnknownMemberType]
+    # The non-ASCII row lies beyond the sample, so utf-8 is detected first.
+    monkeypatch.setattr(normalize_module, "DETECTION_SAMPLE_SIZE", 64)
+    opened: list[str] = []
+    original_open = zipfile.ZipFile.open
+
+    def _tracking_open(
+        self: zipfile.ZipFile,
+        name: str | zipfile.ZipInfo,
+        *args: object,
+        **kwargs: object,
+    ) -> object:
+        opened.append(name.filename if isinstance(name, zipfile.ZipInfo) else name)
+        return original_open(self, name, *args, **kwargs)  # pyright: ignore[reportArgumentType]
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", _tracking_open)
+
+    outputs = normalize_zip_of_csv(zip_path, tmp_path / "normalized")
+
+    for output in outputs:
+        loaded = pd.read_csv(output, encoding="utf-8")  # pyright: ignore[reportUnknownMemberType]
+        tm.assert_frame_equal(loaded, rows)  # pyright: ignore[reportUnknownMemberType]
+    assert opened.count("utf8.csv") == 1
+    assert opened.count("late_cp932.csv") > 1
+
+
+def test_parallel_normalization_matches_serial_names_and_order(tmp_path: Path) -> None:
+    """max_workers 指定時も出力名と順序が逐次処理と一致すること."""
+    zip_path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(zip_path, "w") as archive:
+        for index, name in enumerate(("b/data.csv", "a/data.csv", "c.csv")):
+            archive.writestr(name, f"値\n{index}\n".encode("cp932"))
+    excel_path = tmp_path / "book.xlsx"
+    with pd.ExcelWriter(excel_path) as writer:  # pyright: ignore[reportUnknownVariableType]
+        for sheet in ("Z", "A", "M"):
+            _sample_dataframe().to_excel(writer, sheet_name=sheet, index=False)  # pyright: ignore[reportUnknownMemberType]
+
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+    for dest_dir in (serial_dir, parallel_dir):
+        dest_dir.mkdir()
+        (dest_dir / "bundle_data.csv").write_text("existing", encoding="utf-8")
+    serial = normalize_zip_of_csv(zip_path, serial_dir)
+    parallel = normalize_zip_of_csv(zip_path, parallel_dir, max_workers=2)
+    serial_sheets = normalize_excel(excel_path, serial_dir)
+    parallel_sheets = normalize_excel(excel_path, parallel_dir, max_workers=2)
+
+    assert [path.name for path in parallel] == [path.name for path in serial]
+    assert [path.name for path in serial] == [
+        "bundle_data_1.csv",
+        "bundle_data_2.csv",
+        "bundle_c.csv",
+    ]
+    assert [pd.read_csv(path)["値"].tolist() for path in parallel] == [[0], [1], [2]]  # pyright: ignore[reportUnknownMemberType]
+    assert list(parallel_sheets) == list(serial_sheets) == ["Z", "A", "M"]
+    assert [path.name for path in parallel_sheets.values()] == [
+        path.name for path in serial_sheets.values()
+    ]
+
+
+def test_normalize_zip_of_csv_rejects_invalid_max_workers(tmp_path: Path) -> None:
+    """max_workers に 0 以下を指定すると NormalizationError になること."""
+    zip_path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(zip_path, "w") as archive:
+        archive.writestr("a.csv", "a\n1\n")
+
+    with pytest.raises(NormalizationError, match="max_workers"):
+        normalize_zip_of_csv(zip_path, tmp_path / "out", max_workers=0)
+
+
+def test_normalize_csv_pushes_down_usecols_and_row_filter(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """列の絞り込みと行フィルタで不要な列と行を読み込まずに正規化できること."""
+    raw_path = tmp_path / "raw.csv"
+    lines = [f"2024-01-{day:02d},{day},メモ{day}" for day in range(1, 11)]
+    raw_path.write_bytes(
+        ("日付,接続数,備考\n" + "\n".join(lines) + "\n").encode("cp932"),
+    )
+    monkeypatch.setattr(normalize_module, "DEFAULT_CHUNKSIZE", 3)
+    predicates = [RowPredicate.parse("日付 >= 2024-01-06")]
+
+    df = normalize_csv(
+        raw_path,
+        tmp_path / "out.csv",
+        usecols=["日付", "接続数"],
+        row_filter=predicates,
+    )
+    summary = normalize_csv_chunked(
+        raw_path,
+        tmp_path / "chunked.csv",
+        chunksize=4,
+        usecols=["日付", "接続数"],
+        row_filter=predicates,
+    )
+
+    assert list(df.columns) == ["日付", "接続数"]
+    assert df["接続数"].tolist() == [6, 7, 8, 9, 10]
+    assert summary.rows == 5
+    tm.assert_frame_equal(read_normalized(summary.dest), df)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from kawasaki_etl.core.models import DatasetConfig
+from kawasaki_etl.core.projection import (
+    ProjectionError,
+    ReadProjection,
+    RowPredicate,
+    filter_rows,
+    get_projection,
+)
+
+
+def _dataset(**extra: object) -> DatasetConfig:
+    return DatasetConfig(
+        dataset_id="sample",
+        category="wifi",
+        url="https://example.com/sample.csv",
+        type="csv",
+        extra=dict(extra),
+    )
+
+
+def test_row_predicate_parse_accepts_operators_and_quotes() -> None:
+    """条件文字列から列名・演算子・値を取り出せること."""
+    assert RowPredicate.parse("date >= 2024-01-01") == RowPredicate(
+        column="date",
+        op=">=",
+        value="2024-01-01",
+    )
+    assert RowPredicate.parse("スポット名 != '駅前'") == RowPredicate(
+        column="スポット名",
+        op="!=",
+        value="駅前",
+    )
+    with pytest.raises(ProjectionError):
+        RowPredicate.parse("date")
+
+
+def test_filter_rows_compares_numbers_dates_and_text() -> None:
+    """値の種類に応じて数値・日付・文字列として比較し、変換できない行を除くこと."""
+    df = pd.DataFrame(
+        {
+            "date": ["2023-12-31", "2024-01-01", "2024-02-01", "不明"],
+            "count": ["5", "10", "x", "20"],
+            "name": ["a", "b", "a", "b"],
+        },
+    )
+
+    by_date = filter_rows(df, [RowPredicate.parse("date >= 2024-01-01")])
+    by_count = filter_rows(df, [RowPredicate.parse("count > 6")])
+    combined = filter_rows(
+        df,
+        [RowPredicate.parse("date >= 2024-01-01"), RowPredicate.parse("name = a")],
+    )
+
+    assert by_date.index.tolist() == [1, 2]
+    assert by_count.index.tolist() == [1, 3]
+    assert combined.index.tolist() == [2]
+    with pytest.raises(ProjectionError):
+        filter_rows(df, [RowPredicate.parse("missing = 1")])
+
+
+def test_filter_rows_follows_column_dtype() -> None:
+    """数値に見える値でも日付の列は日付として比較し、型の合わない値はエラーにすること."""
+    text_dates = pd.DataFrame({"date": ["2023-12-31", "2024-01-01", "2024-06-01"]})
+    typed = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2023-12-31", "2024-06-01"]),
+            "count": [5, 10],
+        },
+    )
+
+    by_year = filter_rows(text_dates, [RowPredicate.parse("date >= 2024")])
+    typed_by_year = filter_rows(typed, [RowPredicate.parse("date >= 2024")])
+
+    assert by_year.index.tolist() == [1, 2]
+    assert typed_by_year.index.tolist() == [1]
+    with pytest.raises(ProjectionError, match="number"):
+        filter_rows(typed, [RowPredicate.parse("count > many")])
+    with pytest.raises(ProjectionError, match="date"):
+        filter_rows(typed, [RowPredicate.parse("date > soon")])
+
+
+def test_get_projection_reads_extra_and_renames_to_source_columns() -> None:
+    """extra.columns / extra.row_filter を読み取り、ソース列名に置き換えられること."""
+    projection = get_projection(
+        _dataset(columns=["date", "count"], row_filter="date >= 2024-01-01"),
+    )
+
+    renamed = projection.renamed({"date": "日付", "count": "接続数"})
+
+    assert renamed == ReadProjection(
+        columns=("日付", "接続数"),
+        predicates=(RowPredicate(column="日付", op=">=", value="2024-01-01"),),
+    )
+    assert get_projection(_dataset(), default_columns=["date"]).columns == ("date",)
+    assert get_projection(_dataset()).columns is None
+    with pytest.raises(ProjectionError):
+        projection.renamed({"count": "接続数"})
+    with pytest.raises(ProjectionError):
+        get_projection(_dataset(columns={"date": "日付"}))
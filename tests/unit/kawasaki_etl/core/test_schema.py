@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import datetime
+from dataclasses import replace
+
+import pandas as pd
+import pytest
+
+from kawasaki_etl.core.models import DatasetConfig
+from kawasaki_etl.core.schema import (
+    WIFI_SCHEMA,
+    DatasetSchema,
+    SchemaError,
+    apply_schema,
+    frame_memory,
+    get_schema,
+    register_schema,
+    unregister_schema,
+    with_python_dates,
+)
+
+
+def _dataset(parser: str | None = None, **extra: object) -> DatasetConfig:
+    return DatasetConfig(
+        dataset_id="sample",
+        category="wifi",
+        url="https://example.com/sample.csv",
+        type="csv",
+        parser=parser,
+        extra=dict(extra),
+    )
+
+
+def test_apply_schema_types_columns_and_reduces_memory() -> None:
+    """スキーマ適用で category / Int32 / datetime64 になり、メモリが減ること."""
+    rows = 1_000
+    frame = pd.DataFrame(
+        {
+            "date": [datetime.date(2024, 1, 1 + index % 28) for index in range(rows)],
+            "spot_id": [f"spot-{index % 10}" for index in range(rows)],
+            "connection_count": [float(index) for index in range(rows)],
+            "unknown": ["x"] * rows,
+        },
+    )
+    before = frame_memory(frame)
+
+    apply_schema(frame, WIFI_SCHEMA)
+
+    assert str(frame["date"].dtype) == "datetime64[s]"
+    assert str(frame["spot_id"].dtype) == "category"
+    assert str(frame["connection_count"].dtype) == "Int32"
+    assert str(frame["unknown"].dtype) == "object"
+    assert frame_memory(frame) < before
+    assert with_python_dates(frame, WIFI_SCHEMA)["date"].iloc[0] == datetime.date(
+        2024,
+        1,
+        1,
+    )
+
+
+def test_apply_schema_rejects_fractional_integers() -> None:
+    """整数列に小数が含まれる場合は SchemaError になること."""
+    frame = pd.DataFrame({"count": [1.5]})
+
+    with pytest.raises(SchemaError, match="count"):
+        apply_schema(frame, DatasetSchema({"count": "int32"}))
+
+
+def test_apply_schema_keeps_dtype_when_not_strict() -> None:
+    """厳密でないスキーマは変換できない列の型をそのまま残すこと."""
+    frame = pd.DataFrame({"count": [1.5], "name": ["a"]})
+
+    apply_schema(
+        frame,
+        DatasetSchema({"count": "int32", "name": "category"}, strict=False),
+    )
+
+    assert frame["count"].tolist() == [1.5]
+    assert str(frame["name"].dtype) == "category"
+
+
+def test_get_schema_resolution_order() -> None:
+    """extra.schema の定義を優先し、なければ parser の登録スキーマを使うこと."""
+    inline = get_schema(_dataset("wifi_usage_parser", schema={"spot_id": "string"}))
+    assert inline == DatasetSchema({"spot_id": "string"})
+    assert get_schema(_dataset("wifi_usage_parser")) == replace(
+        WIFI_SCHEMA,
+        strict=False,
+    )
+    assert get_schema(_dataset()) is None
+
+    register_schema("shared", DatasetSchema({"code": "category"}))
+    try:
+        assert get_schema(_dataset(schema="shared")) == DatasetSchema(
+            {"code": "category"},
+        )
+    finally:
+        unregister_schema("shared")
+
+    with pytest.raises(SchemaError, match="not registered"):
+        get_schema(_dataset(schema="shared"))
+    with pytest.raises(SchemaError, match="Unknown schema types"):
+        get_schema(_dataset(schema={"spot_id": "varchar"}))
+
+
+def test_read_dtypes_only_covers_label_columns() -> None:
+    """読み込み時の dtype はラベル列だけを対象にし、除外列を含まないこと."""
+    dtypes = WIFI_SCHEMA.read_dtypes(
+        {"spot_name": ["スポット名", "施設名"], "spot_id": ["スポットID"]},
+        exclude=["spot_id", "dataset_id", "snapshot_date"],
+    )
+
+    assert dtypes == {"スポット名": "category", "施設名": "category"}
+
+
+def test_dataset_schema_renamed_keeps_mapped_columns() -> None:
+    """対応付けた列だけを新しい列名で持ち、除外した列は含めないこと."""
+    renamed = WIFI_SCHEMA.renamed(
+        {"spot_id": "地点ID", "spot_name": "施設名", "connection_count": "接続数"},
+        exclude=["spot_id"],
+    )
+
+    assert renamed.columns == {"施設名": "category", "接続数": "int32"}
@@ -21,6 +21,7 @@ class _DummyStream:
     def __init__(self, body: bytes, status_code: int = 200) -> None:
         self.body = body
         self.status_code = status_code
+        self.headers: dict[str, str] = {}
 
     def iter_bytes(self, chunk_size: int) -> Iterator[bytes]:
         _ = chunk_size
@@ -37,22 +38,16 @@ class _DummyClient:
     def __init__(self, body: bytes) -> None:
         self.body = body
 
-    def __enter__(self) -> Self:
-        return self
-
-    def __exit__(self, exc_type: object, exc: object, tb: object) -> bool:
-        return False
-
-    def stream(self, method: str, url: str) -> _DummyStream:
+    def stream(self, method: str, url: str, **_kwargs: object) -> _DummyStream:
         _ = (method, url)
         return _DummyStream(self.body)
 
 
 def _patch_http_client(monkeypatch: pytest.MonkeyPatch, body: bytes) -> None:
-    def dummy_factory(*_args: object, **_kwargs: object) -> _DummyClient:
+    def dummy_factory() -> _DummyClient:
         return _DummyClient(body)
 
-    monkeypatch.setattr(io_module.httpx, "Client", dummy_factory)
+    monkeypatch.setattr(io_module, "get_http_client", dummy_factory)
 
 
 def _write_dataset_config(config_path: Path, url: str) -> None:
@@ -133,7 +128,13 @@ def test_etl_run_invokes_wifi_pipeline(
     called: list[tuple[str, Engine | None]] = []
     engine = create_engine("sqlite://")
 
-    def fake_run_wifi(dataset: DatasetConfig, engine: Engine | None = None) -> None:
+    def fake_run_wifi(
+        dataset: DatasetConfig,
+        engine: Engine | None = None,
+        *,
+        verify: bool = False,
+    ) -> None:
+        _ = verify
         called.append((dataset.dataset_id, engine))
 
     cli = CLIInterface(datasets_config_path=datasets_path)
@@ -143,7 +144,7 @@ def test_etl_run_invokes_wifi_pipeline(
 
     monkeypatch.setattr(cli, "_get_engine", value=_get_engine)  # pyright: ignore[reportCallIssue]
     monkeypatch.setattr(
-        "kawasaki_etl.interfaces.cli.run_wifi_count", fake_run_wifi,
+        "kawasaki_etl.pipelines.wifi.run_wifi_count", fake_run_wifi,
     )  # pyright: ignore[reportCallIssue]
 
     result = runner.invoke(cli.app, ["etl", "run", "wifi_sample"])
@@ -176,8 +177,13 @@ def test_etl_run_all_invokes_all(
     called: list[str] = []
     engine = create_engine("sqlite://")
 
-    def fake_run_wifi(dataset: DatasetConfig, engine: Engine | None = None) -> None:
-        _ = engine
+    def fake_run_wifi(
+        dataset: DatasetConfig,
+        engine: Engine | None = None,
+        *,
+        verify: bool = False,
+    ) -> None:
+        _ = (engine, verify)
         called.append(dataset.dataset_id)
 
     cli = CLIInterface(datasets_config_path=datasets_path)
@@ -187,10 +193,126 @@ def test_etl_run_all_invokes_all(
 
     monkeypatch.setattr(cli, "_get_engine", value=_get_engine)  # pyright: ignore[reportCallIssue]
     monkeypatch.setattr(
-        "kawasaki_etl.interfaces.cli.run_wifi_count", fake_run_wifi,
+        "kawasaki_etl.pipelines.wifi.run_wifi_count", fake_run_wifi,
     )  # pyright: ignore[reportCallIssue]
 
     result = runner.invoke(cli.app, ["etl", "run-all"])
 
     assert result.exit_code == 0
     assert called == ["wifi_a", "wifi_b"]
+
+
+def test_etl_run_passes_verify_flag(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    """Etl run --verify で再ハッシュ指定がパイプラインに渡ること."""
+    runner = CliRunner()
+    datasets_path = tmp_path / "datasets.yml"
+    datasets_path.write_text(
+        """
+        datasets:
+          wifi_sample:
+            category: wifi
+            url: https://example.com/wifi.csv
+            type: csv
+        """,
+        encoding="utf-8",
+    )
+
+    received: list[bool] = []
+    engine = create_engine("sqlite://")
+
+    def fake_run_wifi(
+        dataset: DatasetConfig,
+        engine: Engine | None = None,
+        *,
+        verify: bool = False,
+    ) -> None:
+        _ = (dataset, engine)
+        received.append(verify)
+
+    cli = CLIInterface(datasets_config_path=datasets_path)
+
+    def _get_engine(_alias: str) -> Engine:
+        return engine
+
+    monkeypatch.setattr(cli, "_get_engine", value=_get_engine)  # pyright: ignore[reportCallIssue]
+    monkeypatch.setattr(
+        "kawasaki_etl.pipelines.wifi.run_wifi_count", fake_run_wifi,
+    )  # pyright: ignore[reportCallIssue]
+
+    result = runner.invoke(cli.app, ["etl", "run", "wifi_sample", "--verify"])
+
+    assert result.exit_code == 0
+    assert received == [True]
+
+
+def test_etl_run_all_with_jobs_prints_summary_and_fails(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    """run-all --jobs で並列スケジューラを使い、失敗があれば終了コード 1 になること."""
+    from kawasaki_etl.pipelines.scheduler import DatasetRunResult
+
+    runner = CliRunner()
+    datasets_path = tmp_path / "datasets.yml"
+    datasets_path.write_text(
+        """
+        datasets:
+          wifi_a:
+            category: wifi
+            url: https://example.com/a.csv
+            type: csv
+          wifi_b:
+            category: wifi
+            url: https://example.com/b.csv
+            type: csv
+        """,
+        encoding="utf-8",
+    )
+    engine = create_engine("sqlite://")
+    received: dict[str, object] = {}
+
+    def fake_run_datasets(
+        datasets: list[DatasetConfig],
+        db_engine: Engine | None = None,
+        **kwargs: object,
+    ) -> list[DatasetRunResult]:
+        received["ids"] = [dataset.dataset_id for dataset in datasets]
+        received["engine"] = db_engine
+        received.update(kwargs)
+        return [
+            DatasetRunResult(
+                dataset_id="wifi_a",
+                status="completed",
+                timings={"download": 0.5, "normalize": 1.0, "load": 0.25},
+            ),
+            DatasetRunResult(
+                dataset_id="wifi_b",
+                status="failed",
+                timings={"download": 0.1},
+                error="normalize: boom",
+            ),
+        ]
+
+    cli = CLIInterface(datasets_config_path=datasets_path)
+
+    def _get_engine(_alias: str) -> Engine:
+        return engine
+
+    monkeypatch.setattr(cli, "_get_engine", value=_get_engine)  # pyright: ignore[reportCallIssue]
+    monkeypatch.setattr(
+        "kawasaki_etl.interfaces.cli.run_datasets", fake_run_datasets,
+    )  # pyright: ignore[reportCallIssue]
+
+    result = runner.invoke(
+        cli.app, ["etl", "run-all", "--jobs", "4", "--db-writers", "1"],
+    )
+
+    assert result.exit_code == 1
+    assert received["ids"] == ["wifi_a", "wifi_b"]
+    assert received["engine"] is engine
+    assert received["jobs"] == 4
+    assert received["db_writers"] == 1
+    assert "run-all summary" in result.output
+    assert "1.75s" in result.output
+    assert "normalize: boom" in result.output
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kawasaki_etl.core import meta_store
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def isolated_meta_store(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """パイプラインが記録するステージ情報をテストごとの一時ディレクトリに書く."""
+    meta_dir = tmp_path / "meta"
+    monkeypatch.setattr(meta_store, "META_DATA_DIR", meta_dir)
+    return meta_dir
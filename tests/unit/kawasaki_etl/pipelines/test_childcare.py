@@ -18,6 +18,8 @@ from kawasaki_etl.pipelines.childcare import (
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from kawasaki_etl.core.async_io import DownloadJob
+
     from kawasaki_etl.models import OpenDataPage
 
 PAGES: list[OpenDataPage] = [
@@ -54,13 +56,15 @@ def test_run_childcare_opendata_downloads(
     """Ensure childcare files are downloaded to the expected directory."""
     created_paths: list[Path] = []
 
-    def _fake_download(url: str, dest: Path) -> None:
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_text("dummy", encoding="utf-8")
-        assert url
-        created_paths.append(dest)
+    def _fake_download(jobs: list[DownloadJob], **_kwargs: object) -> list[Path]:
+        for job in jobs:
+            job.dest.parent.mkdir(parents=True, exist_ok=True)
+            job.dest.write_text("dummy", encoding="utf-8")
+            assert job.url
+            created_paths.append(job.dest)
+        return [job.dest for job in jobs]
 
-    monkeypatch.setattr(opendata, "download_file", _fake_download)
+    monkeypatch.setattr(opendata, "download_files", _fake_download)
 
     config = _make_dataset_config(page)
     outputs = run_childcare_opendata(config, base_dir=tmp_path)
@@ -15,6 +15,8 @@ from kawasaki_etl.pipelines.opendata import download_opendata_page
 
 if TYPE_CHECKING:  # pragma: no cover
     from pathlib import Path
+
+    from kawasaki_etl.core.async_io import DownloadJob
     from kawasaki_etl.models import OpenDataPage
 
 
@@ -43,12 +45,14 @@ def test_download_opendata_page(
     """ダウンロード関数が各リソースを保存することを確認する."""
     called: list[tuple[str, Path]] = []
 
-    def _fake_download(url: str, dest: Path) -> None:
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_text("dummy", encoding="utf-8")
-        called.append((url, dest))
+    def _fake_download(jobs: list[DownloadJob], **_kwargs: object) -> list[Path]:
+        for job in jobs:
+            job.dest.parent.mkdir(parents=True, exist_ok=True)
+            job.dest.write_text("dummy", encoding="utf-8")
+            called.append((job.url, job.dest))
+        return [job.dest for job in jobs]
 
-    monkeypatch.setattr(opendata, "download_file", _fake_download)
+    monkeypatch.setattr(opendata, "download_files", _fake_download)
 
     outputs = download_opendata_page(page, base_dir=tmp_path)
 
@@ -50,17 +50,22 @@ def test_download_population_pages(
     """Download helper should fetch all configured resources for each year."""
     called: list[tuple[str, Path]] = []
 
-    def _fake_download(page: OpenDataPage, base_dir: Path) -> list[Path]:
+    def _fake_download(
+        pages: tuple[OpenDataPage, ...],
+        base_dir: Path,
+        **_kwargs: object,
+    ) -> list[Path]:
         paths: list[Path] = []
-        for resource in page.resources:
-            dest = base_dir / page.storage_dirname / resource.filename
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text("dummy", encoding="utf-8")
-            paths.append(dest)
-        called.append((page.identifier, base_dir))
+        for page in pages:
+            for resource in page.resources:
+                dest = base_dir / page.storage_dirname / resource.filename
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                dest.write_text("dummy", encoding="utf-8")
+                paths.append(dest)
+            called.append((page.identifier, base_dir))
         return paths
 
-    monkeypatch.setattr(population, "download_opendata_page", _fake_download)
+    monkeypatch.setattr(population, "download_opendata_pages", _fake_download)
 
     outputs = download_func(base_dir=tmp_path)
 
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from kawasaki_etl.core.models import DatasetConfig
+from kawasaki_etl.pipelines import registry
+from kawasaki_etl.pipelines.registry import (
+    PipelineError,
+    PipelineNotFoundError,
+    PipelineSpec,
+    get_pipeline,
+    register_pipeline,
+    unregister_pipeline,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+calls: list[dict[str, Any]] = []
+
+
+def fake_run(config: DatasetConfig, **kwargs: Any) -> None:
+    """Record the call made through the registry."""
+    calls.append({"dataset_id": config.dataset_id, **kwargs})
+
+
+FAKE_SPEC = PipelineSpec(
+    parser="fake_parser",
+    module=__name__,
+    run="fake_run",
+    uses_engine=True,
+)
+
+
+def _dataset(category: str, parser: str | None = None) -> DatasetConfig:
+    return DatasetConfig(
+        dataset_id="sample",
+        category=category,
+        url="https://example.com/sample.csv",
+        type="csv",
+        parser=parser,
+    )
+
+
+@pytest.fixture
+def _fake_pipeline() -> Iterator[None]:
+    calls.clear()
+    register_pipeline(FAKE_SPEC)
+    yield
+    unregister_pipeline(FAKE_SPEC.parser)
+
+
+def test_get_pipeline_prefers_parser_then_category() -> None:
+    """Parser 名で検索し、未登録の parser はカテゴリで解決すること."""
+    assert get_pipeline(_dataset("other", "tourism_irikomi_pdf")).parser == (
+        "tourism_irikomi_pdf"
+    )
+    assert get_pipeline(_dataset("wifi")).parser == "wifi_usage_parser"
+    assert get_pipeline(_dataset("wifi", "unknown_parser")).parser == (
+        "wifi_usage_parser"
+    )
+
+
+def test_get_pipeline_unknown_raises() -> None:
+    """未対応のデータセットは PipelineNotFoundError になること."""
+    with pytest.raises(PipelineNotFoundError, match="Unsupported dataset category"):
+        get_pipeline(_dataset("unknown"))
+
+
+@pytest.mark.usefixtures("_fake_pipeline")
+def test_registered_pipeline_runs_with_declared_arguments() -> None:
+    """登録したパイプラインが宣言どおりの引数で呼ばれること."""
+    engine = object()
+
+    get_pipeline(_dataset("misc", "fake_parser")).run_dataset(
+        _dataset("misc", "fake_parser"),
+        engine,  # pyright: ignore[reportArgumentType]
+        verify=True,
+    )
+
+    assert calls == [{"dataset_id": "sample", "engine": engine}]
+
+
+def test_get_pipeline_loads_entry_point(monkeypatch: pytest.MonkeyPatch) -> None:
+    """未登録の parser はエントリポイントから読み込まれること."""
+
+    class _EntryPoint:
+        value = f"{__name__}:FAKE_SPEC"
+
+        def load(self) -> PipelineSpec:
+            return FAKE_SPEC
+
+    def _entry_points(**kwargs: str) -> list[_EntryPoint]:
+        assert kwargs == {"group": registry.ENTRY_POINT_GROUP, "name": "fake_parser"}
+        return [_EntryPoint()]
+
+    monkeypatch.setattr(registry, "entry_points", _entry_points)
+    try:
+        assert get_pipeline(_dataset("misc", "fake_parser")) is FAKE_SPEC
+    finally:
+        unregister_pipeline(FAKE_SPEC.parser)
+
+
+@pytest.mark.usefixtures("_fake_pipeline")
+def test_stages_require_fetch() -> None:
+    """段階関数を持たないパイプラインの stages() はエラーになること."""
+    with pytest.raises(PipelineError):
+        FAKE_SPEC.stages()
+
+
+def test_cli_import_does_not_load_pipeline_modules() -> None:
+    """CLI の import 時にパイプライン実装 (pandas / pypdf 依存) を読み込まないこと."""
+    code = (
+        "import sys, kawasaki_etl.interfaces.cli\n"
+        "loaded = [name for name in ('kawasaki_etl.pipelines.wifi',"
+        " 'kawasaki_etl.pipelines.tourism', 'kawasaki_etl.pipelines.childcare',"
+        " 'pypdf') if name in sys.modules]\n"
+        "print(','.join(loaded))\n"
+    )
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))},
+    )
+
+    assert completed.stdout.strip() == ""
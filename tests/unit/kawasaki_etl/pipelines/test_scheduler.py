@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from kawasaki_etl.core.models import DatasetConfig
+from kawasaki_etl.pipelines.scheduler import (
+    PipelineStages,
+    SchedulerError,
+    run_datasets,
+    stages_for,
+)
+
+
+def _dataset(dataset_id: str, category: str = "test") -> DatasetConfig:
+    return DatasetConfig(
+        dataset_id=dataset_id,
+        category=category,
+        url=f"https://example.com/{dataset_id}.csv",
+        type="csv",
+    )
+
+
+def _fetch(config: DatasetConfig, *, verify: bool = False) -> str | None:
+    _ = verify
+    if config.dataset_id.startswith("loaded"):
+        return None
+    return config.dataset_id
+
+
+def _normalize(config: DatasetConfig, raw: str) -> str:
+    if config.dataset_id.startswith("broken"):
+        msg = "cannot parse"
+        raise ValueError(msg)
+    return raw.upper()
+
+
+def test_run_datasets_isolates_failures_and_records_timings() -> None:
+    """1 件が失敗しても他のデータセットは最後まで処理され、段階ごとの時間が残ること."""
+    loaded: list[tuple[str, str]] = []
+    lock = threading.Lock()
+
+    def _load(config: DatasetConfig, normalized: str, engine: object) -> None:
+        _ = engine
+        with lock:
+            loaded.append((config.dataset_id, normalized))
+
+    stages = PipelineStages(fetch=_fetch, normalize=_normalize, load=_load)
+    datasets = [_dataset("a"), _dataset("broken"), _dataset("loaded"), _dataset("b")]
+
+    results = run_datasets(
+        datasets,
+        jobs=2,
+        use_processes=False,
+        resolve_stages=lambda _dataset: stages,
+    )
+
+    assert [result.dataset_id for result in results] == ["a", "broken", "loaded", "b"]
+    assert [result.status for result in results] == [
+        "completed",
+        "failed",
+        "skipped",
+        "completed",
+    ]
+    assert sorted(loaded) == [("a", "A"), ("b", "B")]
+    assert set(results[0].timings) == {"download", "normalize", "load"}
+    assert results[1].error == "normalize: cannot parse"
+    assert set(results[2].timings) == {"download"}
+
+
+def test_run_datasets_bounds_db_writers() -> None:
+    """ロード段の同時実行数が db_writers を超えないこと."""
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _load(config: DatasetConfig, normalized: str, engine: object) -> None:
+        nonlocal in_flight, peak
+        _ = (config, normalized, engine)
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+
+    stages = PipelineStages(fetch=_fetch, normalize=_normalize, load=_load)
+
+    results = run_datasets(
+        [_dataset(f"d{index}") for index in range(6)],
+        jobs=4,
+        db_writers=1,
+        use_processes=False,
+        resolve_stages=lambda _dataset: stages,
+    )
+
+    assert {result.status for result in results} == {"completed"}
+    assert peak == 1
+
+
+def test_run_datasets_parses_in_worker_processes() -> None:
+    """正規化段をワーカープロセスで実行できること."""
+    received: dict[str, Any] = {}
+
+    def _load(config: DatasetConfig, normalized: str, engine: object) -> None:
+        _ = engine
+        received[config.dataset_id] = normalized
+
+    stages = PipelineStages(fetch=_fetch, normalize=_normalize, load=_load)
+
+    results = run_datasets(
+        [_dataset("x"), _dataset("broken")],
+        jobs=2,
+        resolve_stages=lambda _dataset: stages,
+    )
+
+    assert [result.status for result in results] == ["completed", "failed"]
+    assert received == {"x": "X"}
+
+
+def test_run_datasets_reports_unsupported_category() -> None:
+    """未対応カテゴリは失敗として記録され、例外で中断しないこと."""
+    results = run_datasets([_dataset("unknown", category="unknown")], jobs=2)
+
+    assert results[0].status == "failed"
+    assert results[0].error is not None
+    assert "Unsupported dataset category" in results[0].error
+
+
+def test_stages_for_rejects_unknown_category() -> None:
+    """未対応カテゴリでは SchedulerError を送出すること."""
+    with pytest.raises(SchedulerError):
+        stages_for(_dataset("unknown", category="unknown"))
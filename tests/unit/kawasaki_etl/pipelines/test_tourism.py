@@ -70,3 +70,35 @@ def test_run_tourism_irikomi_saves_csv(
     assert normalized_path.exists()
     loaded_df: pd.DataFrame = pd.read_csv(str(normalized_path))  # pyright: ignore[reportUnknownMemberType]
     assert_frame_equal(loaded_df, sample_df)
+
+
+def test_run_tourism_irikomi_saves_parquet(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    """output_format: parquet の場合は Parquet として保存されること."""
+    pytest.importorskip("pyarrow")
+    dataset = DatasetConfig(
+        dataset_id="tourism_r05_irikomi",
+        category="tourism",
+        url="https://example.com/tourism.pdf",
+        type="pdf",
+        parser="tourism_irikomi_pdf",
+        output_format="parquet",
+    )
+    raw_pdf = tmp_path / "tourism.pdf"
+    raw_pdf.write_text("dummy pdf content", encoding="utf-8")
+    sample_df: pd.DataFrame = pd.DataFrame({"col": [1, 2, 3]})
+
+    monkeypatch.setattr(tourism, "NORMALIZED_DATA_DIR", tmp_path / "normalized")
+    monkeypatch.setattr(tourism, "download_if_needed", lambda _: raw_pdf)
+    monkeypatch.setattr(tourism, "calculate_sha256", lambda _: "dummyhash")
+    monkeypatch.setattr(tourism, "is_already_loaded", lambda *_a, **_k: False)
+    monkeypatch.setattr(
+        tourism, "extract_tables_from_tourism_irikomi", lambda _: sample_df,
+    )
+    monkeypatch.setattr(tourism, "mark_loaded", lambda *_a, **_k: None)
+
+    normalized_path = tourism.run_tourism_irikomi(dataset)
+
+    assert normalized_path.suffix == ".parquet"
+    assert_frame_equal(pd.read_parquet(normalized_path), sample_df)  # pyright: ignore[reportUnknownMemberType]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import pandas as pd
 import pytest
 from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, text
 
@@ -9,7 +12,6 @@ from kawasaki_etl.core.models import DatasetConfig
 from kawasaki_etl.pipelines import wifi
 
 if TYPE_CHECKING:
-    from pathlib import Path
     from sqlalchemy.engine import Engine
 
 
@@ -168,3 +170,251 @@ def test_run_wifi_count_skips_when_already_loaded(
 
     assert rows[0][0] == 0
     assert marker_called == []
+
+
+def test_run_wifi_count_streams_in_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    sqlite_engine: Engine,
+) -> None:
+    """extra.chunksize 指定時はチャンク単位で正規化・UPSERT する."""
+    raw_path = tmp_path / "raw.csv"
+    lines = [f"2020-01-{day:02d},A,駅前,{day}" for day in range(1, 6)]
+    raw_path.write_bytes(
+        ("日付,スポットID,スポット名,接続数\n" + "\n".join(lines) + "\n").encode(
+            "cp932",
+        ),
+    )
+
+    base = _build_dataset()
+    dataset = DatasetConfig(
+        dataset_id=base.dataset_id,
+        category=base.category,
+        url=base.url,
+        type=base.type,
+        parser=base.parser,
+        table=base.table,
+        key_fields=base.key_fields,
+        extra={**base.extra, "chunksize": 2},
+    )
+
+    monkeypatch.setattr(wifi, "NORMALIZED_DATA_DIR", tmp_path / "normalized")
+    monkeypatch.setattr(wifi, "download_if_needed", lambda _cfg: raw_path)
+    monkeypatch.setattr(wifi, "calculate_sha256", lambda _p: "dummy-hash")
+    monkeypatch.setattr(wifi, "is_already_loaded", lambda *_a, **_k: False)
+    monkeypatch.setattr(wifi, "mark_loaded", lambda *_a, **_k: None)
+
+    def _fail_normalize_csv(*_args: object, **_kwargs: object) -> None:
+        pytest.fail("normalize_csv should not be used in streaming mode")
+
+    monkeypatch.setattr(wifi, "normalize_csv", _fail_normalize_csv)
+
+    wifi.run_wifi_count(dataset, engine=sqlite_engine)
+
+    with sqlite_engine.connect() as conn:
+        rows = list(
+            conn.execute(text("select date, connection_count from wifi_access_counts")),
+        )
+
+    assert sorted(rows) == [(f"2020-01-{day:02d}", day) for day in range(1, 6)]
+
+
+def test_normalize_wifi_applies_dtype_schema(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """正規化後のフレームにスキーマの dtype が適用されること."""
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text(
+        "日付,スポットID,スポット名,接続数\n2020-01-01,A,駅前,10\n2020-01-02,A,駅前,\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(wifi, "NORMALIZED_DATA_DIR", tmp_path / "normalized")
+
+    normalized = wifi.normalize_wifi(
+        _build_dataset(),
+        wifi.WifiRawFile(raw_path=raw_path, sha256="dummy-hash"),
+    )
+
+    assert normalized.frame is not None
+    dtypes = {name: str(dtype) for name, dtype in normalized.frame.dtypes.items()}
+    assert dtypes == {
+        "date": "datetime64[s]",
+        "spot_id": "category",
+        "spot_name": "category",
+        "connection_count": "Int32",
+        "snapshot_date": "category",
+        "dataset_id": "category",
+    }
+    assert normalized.frame["connection_count"].tolist() == [10, 0]
+
+
+def test_normalize_wifi_keeps_fractional_counts_without_declared_schema(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """extra.schema を宣言していなければ小数の接続数もエラーにせず読み込むこと."""
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text(
+        "日付,スポットID,スポット名,接続数\n2020-01-01,A,駅前,2.5\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(wifi, "NORMALIZED_DATA_DIR", tmp_path / "normalized")
+
+    normalized = wifi.normalize_wifi(
+        _build_dataset(),
+        wifi.WifiRawFile(raw_path=raw_path, sha256="dummy-hash"),
+    )
+
+    assert normalized.frame is not None
+    assert normalized.frame["connection_count"].tolist() == [2.5]
+
+
+def test_normalize_wifi_projects_columns_and_filters_rows(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """extra.columns と extra.row_filter が読み込み時に適用されること."""
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text(
+        "日付,スポットID,スポット名,接続数,備考\n"
+        "2020-01-01,A,駅前,10,x\n2020-01-02,A,駅前,5,y\n2020-01-03,B,公園,7,z\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(wifi, "NORMALIZED_DATA_DIR", tmp_path / "normalized")
+    base = _build_dataset()
+    dataset = replace(
+        base,
+        extra={
+            **base.extra,
+            "columns": ["date", "spot_id", "connection_count"],
+            "row_filter": ["date >= 2020-01-02", "connection_count > 5"],
+        },
+    )
+
+    normalized = wifi.normalize_wifi(
+        dataset,
+        wifi.WifiRawFile(raw_path=raw_path, sha256="dummy-hash"),
+    )
+
+    assert normalized.frame is not None
+    assert "spot_name" not in normalized.frame.columns
+    assert normalized.frame["spot_id"].astype(str).tolist() == ["B"]
+    normalized_columns = pd.read_csv(normalized.normalized_path).columns.tolist()
+    assert normalized_columns == ["日付", "スポットID", "接続数"]
+
+    missing_required = replace(
+        base,
+        extra={**base.extra, "columns": ["date", "spot_id"]},
+    )
+    with pytest.raises(wifi.WifiPipelineError):
+        wifi.normalize_wifi(
+            missing_required,
+            wifi.WifiRawFile(raw_path=raw_path, sha256="dummy-hash"),
+        )
+
+
+def test_normalize_wifi_keeps_all_columns_without_projection(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """extra.columns を指定しない場合は正規化ファイルに全列が残ること."""
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text(
+        "日付,スポットID,スポット名,接続数,備考\n2020-01-01,A,駅前,10,x\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(wifi, "NORMALIZED_DATA_DIR", tmp_path / "normalized")
+    base = _build_dataset()
+    dataset = replace(
+        base,
+        extra={**base.extra, "row_filter": "connection_count > 5"},
+    )
+
+    normalized = wifi.normalize_wifi(
+        dataset,
+        wifi.WifiRawFile(raw_path=raw_path, sha256="dummy-hash"),
+    )
+
+    normalized_columns = pd.read_csv(normalized.normalized_path).columns.tolist()
+    assert normalized_columns == ["日付", "スポットID", "スポット名", "接続数", "備考"]
+    assert normalized.frame is not None
+    assert normalized.frame["spot_name"].astype(str).tolist() == ["駅前"]
+
+
+def test_run_wifi_count_resumes_after_failed_load(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    sqlite_engine: Engine,
+) -> None:
+    """ロード失敗後の再実行では正規化済みファイルを再利用し、版を上げると正規化し直すこと."""
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text(
+        "日付,スポットID,スポット名,接続数\n2020-01-01,A,駅前,10\n",
+        encoding="utf-8",
+    )
+    dataset = _build_dataset()
+    monkeypatch.setattr(wifi, "NORMALIZED_DATA_DIR", tmp_path / "normalized")
+    monkeypatch.setattr(wifi, "download_if_needed", lambda _cfg: raw_path)
+
+    normalize_calls: list[Path] = []
+    original_normalize_csv = wifi.normalize_csv
+
+    def _normalize_csv(path: Path, *args: object, **kwargs: object) -> object:
+        normalize_calls.append(path)
+        return original_normalize_csv(path, *args, **kwargs)  # pyright: ignore[reportArgumentType]
+
+    def _fail_upsert(*_args: object, **_kwargs: object) -> None:
+        msg = "database is down"
+        raise wifi.UpsertError(msg)
+
+    original_upsert = wifi.upsert_dataframe
+    monkeypatch.setattr(wifi, "normalize_csv", _normalize_csv)
+    monkeypatch.setattr(wifi, "upsert_dataframe", _fail_upsert)
+    with pytest.raises(wifi.UpsertError):
+        wifi.run_wifi_count(dataset, engine=sqlite_engine)
+    monkeypatch.setattr(wifi, "upsert_dataframe", original_upsert)
+
+    wifi.run_wifi_count(dataset, engine=sqlite_engine)
+    wifi.run_wifi_count(dataset, engine=sqlite_engine)
+
+    with sqlite_engine.connect() as conn:
+        rows = list(
+            conn.execute(text("select date, connection_count from wifi_access_counts")),
+        )
+    assert rows == [("2020-01-01", 10)]
+    assert normalize_calls == [raw_path]
+
+    monkeypatch.setattr(wifi, "WIFI_NORMALIZER_VERSION", "2")
+    wifi.run_wifi_count(dataset, engine=sqlite_engine)
+
+    assert normalize_calls == [raw_path, raw_path]
+
+
+def test_fetch_wifi_raw_skips_loaded_file_without_reading_it(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    sqlite_engine: Engine,
+) -> None:
+    """ロード済みで変更のない raw ファイルは再実行時に一度も開かれないこと."""
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text(
+        "日付,スポットID,スポット名,接続数\n2020-01-01,A,駅前,10\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(wifi, "NORMALIZED_DATA_DIR", tmp_path / "normalized")
+    monkeypatch.setattr(wifi, "download_if_needed", lambda _cfg: raw_path)
+    dataset = _build_dataset()
+    wifi.run_wifi_count(dataset, engine=sqlite_engine)
+
+    opened: list[Path] = []
+    original_open = Path.open
+
+    def _spy_open(self: Path, *args: Any, **kwargs: Any) -> Any:
+        opened.append(self)
+        return original_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", _spy_open)
+
+    assert wifi.fetch_wifi_raw(dataset) is None
+    assert raw_path not in opened
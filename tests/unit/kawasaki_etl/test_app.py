@@ -160,10 +160,18 @@ class TestApplication:
 
         # Create and run application
         app = Application()
-        app.run()
+        with (
+            patch("kawasaki_etl.app.close_http_client") as mock_close_http,
+            patch("kawasaki_etl.app.dispose_engines") as mock_dispose,
+        ):
+            app.run()
 
         # Verify interface was run
         mock_interface.run.assert_called_once()
+        # Verify the shared HTTP client is released on shutdown
+        mock_close_http.assert_called_once()
+        # Verify cached DB engines are disposed on shutdown
+        mock_dispose.assert_called_once()
 
     @patch("kawasaki_etl.app.load_dotenv")
     @patch("kawasaki_etl.app.configure_logging")
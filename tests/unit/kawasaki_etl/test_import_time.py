@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = (
+    "pandas",
+    "sqlalchemy",
+    "httpx",
+    "pypdf",
+    "fastapi",
+    "fastmcp",
+    "uvicorn",
+)
+
+
+def _import_cli(code: str) -> subprocess.CompletedProcess[str]:
+    # 子プロセスは pytest の pythonpath 設定を引き継がないため、親の sys.path を渡す
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))}
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def test_cli_import_skips_heavy_dependencies() -> None:
+    """CLI 起動時に pandas / SQLAlchemy などの重い依存を読み込まないこと."""
+    code = (
+        "import sys, kawasaki_etl.main, kawasaki_etl.interfaces.cli\n"
+        f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))\n"
+    )
+
+    assert _import_cli(code).stdout.strip() == ""
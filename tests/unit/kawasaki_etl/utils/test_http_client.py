@@ -0,0 +1,59 @@
+"""Tests for the shared pooled HTTP client."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kawasaki_etl.utils import http_client
+from kawasaki_etl.utils.data_fetcher import WebDataFetcher
+from kawasaki_etl.utils.settings import reset_download_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_client() -> Iterator[None]:
+    reset_download_settings()
+    http_client.close_http_client()
+    yield
+    http_client.close_http_client()
+    reset_download_settings()
+
+
+def test_get_http_client_returns_same_instance() -> None:
+    """同じプロセス内では同一のクライアントが再利用される."""
+    first = http_client.get_http_client()
+    second = http_client.get_http_client()
+
+    assert first is second
+    assert "gzip" in first.headers["Accept-Encoding"]
+
+
+def test_close_http_client_allows_recreation() -> None:
+    """クローズ後は新しいクライアントが作られる."""
+    first = http_client.get_http_client()
+    http_client.close_http_client()
+
+    assert first.is_closed
+    assert http_client.get_http_client() is not first
+
+
+def test_pool_limits_follow_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """接続プールの上限が設定値から反映される."""
+    monkeypatch.setenv("HTTP_MAX_CONNECTIONS", "3")
+    reset_download_settings()
+
+    options = http_client._client_options()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    assert options["limits"].max_connections == 3
+
+
+def test_fetcher_does_not_close_shared_client() -> None:
+    """WebDataFetcher は共有クライアントを閉じない."""
+    with WebDataFetcher() as fetcher:
+        assert not fetcher.is_closed
+
+    assert not http_client.get_http_client().is_closed